@@ -0,0 +1,33 @@
+"""
+Runs the maintenance commands of the application:
+
+    python -m app import-orders orders.ndjson --batch-size 10000
+    python -m app archive-orders --retention-days 30
+    python -m app rebuild-order-summary --check
+
+The arguments after the command name are those of its module, see
+python -m app <command> --help.
+"""
+
+import runpy
+import sys
+
+COMMANDS: dict[str, str] = {
+    "import-orders": "app.presentation.cli.import_orders",
+    "archive-orders": "app.presentation.cli.archive_orders",
+    "rebuild-order-summary": "app.presentation.cli.rebuild_order_summary",
+}
+
+
+def main() -> None:
+    """
+    Runs the module of the command given as first argument with the remaining ones.
+    """
+    if len(sys.argv) < 2 or sys.argv[1] not in COMMANDS:
+        sys.exit(f"{__doc__}\nCommands: {', '.join(COMMANDS)}")
+    command: str = sys.argv.pop(1)
+    runpy.run_module(COMMANDS[command], run_name="__main__", alter_sys=True)
+
+
+if __name__ == "__main__":
+    main()
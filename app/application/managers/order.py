@@ -1,29 +1,53 @@
+import asyncio
+import csv
+import hashlib
+import io
 import json
 import logging
+import uuid
 from logging.config import dictConfig
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, AsyncIterator, Optional
 
 
+import redis
+from fastapi import HTTPException
 from starlette.status import (
     HTTP_200_OK,
     HTTP_201_CREATED,
+    HTTP_400_BAD_REQUEST,
 )
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from redis.exceptions import WatchError
 from typing_extensions import Any
 
 from app.application.mixins.order_mixin import OrderMixin
+from app.core.config import settings
 from app.core.logger import LoggerConfig
-from app.domain.schemas.order import OrderRead
+from app.domain.schemas.order import (
+    ORDER_CSV_COLUMNS,
+    OrderRead,
+    OrderStatsGroup,
+    UserOrderSummary,
+    UserOrderSummaryGroup,
+)
 from app.domain.schemas.user import UserRead
+from app.infrastructure.db import read_session, use_primary
+from app.infrastructure.local_cache import LocalCache, order_local_cache
+from app.infrastructure.single_flight import SingleFlight
 
 if TYPE_CHECKING:
-    from app.domain.models import Order
+    from aioredis import Redis
+    from app.domain.repositories.orders import OrdersRepository
+    from app.domain.schemas.order import OrderRow
     from app.application.managers.user import UserManager
 
 dictConfig(LoggerConfig().model_dump())
 logger: logging = logging.getLogger("digital_travel_concierge")
 
+# A cached order: the owner's user ID and the rendered response body.
+CachedOrder = tuple[int, bytes]
+
 
 class OrderManager(OrderMixin):
     """
@@ -33,17 +57,353 @@ class OrderManager(OrderMixin):
     environment.
     """
 
-    async def cache_order(self, order_id: int, data: dict[Any, Any]):
-        await self._redis.set(f"order:{order_id}", json.dumps(data))
+    # Optional per-worker tier in front of Redis, None when disabled.
+    local_cache: Optional[LocalCache] = order_local_cache
+    # Coalesces concurrent cache misses for the same order within the worker.
+    single_flight: SingleFlight = SingleFlight()
+
+    @staticmethod
+    def order_cache_key(order_id: int) -> str:
+        return f"{settings.CACHE_KEY_PREFIX}:order:{order_id}"
+
+    @staticmethod
+    def order_generation_key(order_id: int) -> str:
+        return f"{settings.CACHE_KEY_PREFIX}:order:{order_id}:gen"
+
+    @staticmethod
+    def order_lock_key(order_id: int) -> str:
+        return f"{settings.CACHE_KEY_PREFIX}:order:{order_id}:lock"
+
+    @staticmethod
+    def order_missing_key(order_id: int) -> str:
+        return f"{settings.CACHE_KEY_PREFIX}:order:{order_id}:missing"
 
-    async def get_cached_order(self, order_id: int):
-        data_str = await self._redis.get(f"order:{order_id}")
-        if data_str:
-            return json.loads(data_str)
-        return None
+    @staticmethod
+    def order_written_key(order_id: int) -> str:
+        return f"{settings.CACHE_KEY_PREFIX}:order:{order_id}:written"
 
-    async def delete_cached_order(self, order_id: int):
-        await self._redis.delete(f"order:{order_id}")
+    @staticmethod
+    def user_orders_written_key(user_id: int) -> str:
+        return f"{settings.CACHE_KEY_PREFIX}:user:{user_id}:orders_written"
+
+    @staticmethod
+    def orders_stats_cache_key(filters: dict[str, Any], group_by: list[str]) -> str:
+        params: str = json.dumps(
+            {"filters": filters, "group_by": sorted(set(group_by))},
+            sort_keys=True,
+            default=str,
+        )
+        digest: str = hashlib.sha256(params.encode("utf-8")).hexdigest()
+        return f"{settings.CACHE_KEY_PREFIX}:orders:stats:{digest}"
+
+    @staticmethod
+    def pack_order(data: dict[Any, Any]) -> bytes:
+        """
+        Renders the order exactly as JSONResponse would and prefixes it with the
+        owner's user ID, so that hits need no parsing before the access check.
+        """
+        body: str = json.dumps(
+            data,
+            ensure_ascii=False,
+            allow_nan=False,
+            indent=None,
+            separators=(",", ":"),
+        )
+        return f"{data['user_id']}|{body}".encode("utf-8")
+
+    @staticmethod
+    def unpack_order(value: bytes | str) -> CachedOrder:
+        """
+        Splits a cached value into the owner's user ID and the response body.
+        """
+        if isinstance(value, str):
+            value = value.encode("utf-8")
+        user_id, body = value.split(b"|", 1)
+        return int(user_id), body
+
+    async def cache_order(
+        self,
+        order_id: int,
+        data: dict[Any, Any],
+        writer_id: Optional[int] = None,
+    ):
+        """
+        Replaces the cached order after a write. The generation counter is bumped in
+        the same transaction so that concurrent readers do not put back stale data.
+        """
+        await self.cache_orders({order_id: data}, writer_id)
+
+    async def cache_orders(
+        self,
+        orders: dict[int, dict[Any, Any]],
+        writer_id: Optional[int] = None,
+    ):
+        """
+        Replaces the cached orders, keyed by ID, in a single transaction.
+        ``writer_id`` is the user who made the write, see mark_written.
+        """
+        ttl: int = settings.ORDER_CACHE_TTL_SECONDS
+        async with self._redis.pipeline(transaction=True) as pipe:
+            for order_id, data in orders.items():
+                key: str = self.order_cache_key(order_id)
+                generation_key: str = self.order_generation_key(order_id)
+                pipe.incr(generation_key)
+                pipe.expire(generation_key, ttl)
+                pipe.set(key, self.pack_order(data), ex=ttl)
+                pipe.delete(self.order_missing_key(order_id))
+                self.publish_invalidation(pipe, key)
+                self.mark_written(pipe, order_id, data["user_id"], writer_id)
+            await pipe.execute()
+
+    async def fill_cached_order(
+        self,
+        order_id: int,
+        value: bytes,
+        generation: Optional[Any],
+    ) -> bool:
+        """
+        Populates the cache after a miss, but only if the order has not been
+        written or invalidated since the miss was observed.
+        Returns whether the order was cached.
+        """
+        generation_key: str = self.order_generation_key(order_id)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            try:
+                await pipe.watch(generation_key)
+                if await pipe.get(generation_key) != generation:
+                    return False
+                pipe.multi()
+                pipe.set(
+                    self.order_cache_key(order_id),
+                    value,
+                    ex=settings.ORDER_CACHE_TTL_SECONDS,
+                )
+                await pipe.execute()
+                return True
+            except WatchError:
+                logger.info("Order %s changed while caching, skipped", order_id)
+        return False
+
+    async def get_cached_order(
+        self, order_id: int
+    ) -> tuple[Optional[CachedOrder], Optional[Any]]:
+        """
+        Returns the cached order (or None) together with its current generation,
+        fetched in a single round trip.
+        """
+        value, generation = await self._redis.mget(
+            self.order_cache_key(order_id),
+            self.order_generation_key(order_id),
+        )
+        if value:
+            return self.unpack_order(value), generation
+        return None, generation
+
+    async def delete_cached_order(
+        self,
+        order_id: int,
+        user_id: Optional[int] = None,
+        writer_id: Optional[int] = None,
+    ):
+        """
+        Atomically drops the cached order and bumps its generation counter.
+        """
+        await self.delete_cached_orders({order_id: user_id}, writer_id)
+
+    async def delete_cached_orders(
+        self,
+        orders: dict[int, Optional[int]],
+        writer_id: Optional[int] = None,
+    ):
+        """
+        Atomically drops the cached orders, given as IDs mapped to their owners,
+        with a single UNLINK and bumps their generation counters.
+        ``writer_id`` is the user who made the write, see mark_written.
+        """
+        if not orders:
+            return
+        keys: list[str] = []
+        async with self._redis.pipeline(transaction=True) as pipe:
+            for order_id, user_id in orders.items():
+                key: str = self.order_cache_key(order_id)
+                generation_key: str = self.order_generation_key(order_id)
+                keys.append(key)
+                pipe.incr(generation_key)
+                pipe.expire(generation_key, settings.ORDER_CACHE_TTL_SECONDS)
+                self.publish_invalidation(pipe, key)
+                self.mark_written(pipe, order_id, user_id, writer_id)
+            pipe.unlink(*keys)
+            await pipe.execute()
+
+    def publish_invalidation(self, pipe: Any, key: str) -> None:
+        """
+        Drops the key from this worker's local cache and queues a message on the
+        pipeline so that the other workers drop it as well.
+        """
+        if self.local_cache is None:
+            return
+        self.local_cache.delete(key)
+        pipe.publish(settings.CACHE_INVALIDATION_CHANNEL, key)
+
+    def mark_written(
+        self,
+        pipe: Any,
+        order_id: int,
+        user_id: Optional[int],
+        writer_id: Optional[int] = None,
+    ) -> None:
+        """
+        Queues markers on the pipeline recording that the order, the owner's orders
+        and the orders written by the writer were just written, so that reads within
+        DB_REPLICA_MAX_LAG_SECONDS go to the primary instead of a replica that may
+        not have the write yet. Marking the writer lets a superuser read back the
+        orders of other users they just wrote, however they list them.
+        """
+        if not settings.DB_REPLICA_URLS:
+            return
+        lag_ms: int = int(settings.DB_REPLICA_MAX_LAG_SECONDS * 1000)
+        pipe.set(self.order_written_key(order_id), 1, px=lag_ms)
+        for written_by in {user_id, writer_id} - {None}:
+            pipe.set(self.user_orders_written_key(written_by), 1, px=lag_ms)
+
+    def orders_written_keys(self, user: UserRead, filters: dict[str, Any]) -> list[str]:
+        """
+        Returns the markers of the user and, when the orders are filtered by owner,
+        of the owner, either of which sends the listing to the primary.
+        """
+        user_ids: set[int] = {user.id, filters.get("user_id", None)} - {None}
+        return [self.user_orders_written_key(user_id) for user_id in user_ids]
+
+    async def written_recently(self, *written_keys: str) -> bool:
+        """
+        Returns whether any of the markers is set, so that reads have to go to the
+        primary.
+        """
+        return bool(settings.DB_REPLICA_URLS) and bool(
+            await self._redis.exists(*written_keys)
+        )
+
+    async def read_own_writes(self, *written_keys: str) -> None:
+        """
+        Pins the repository's session to the primary if any of the markers is set.
+        """
+        if await self.written_recently(*written_keys):
+            use_primary(self.order_repository.session)
+
+    async def release_lock(self, lock_key: str, token: str) -> None:
+        """
+        Deletes the lock only if it is still held with the given token.
+        """
+        async with self._redis.pipeline(transaction=True) as pipe:
+            try:
+                await pipe.watch(lock_key)
+                if await pipe.get(lock_key) not in (token, token.encode()):
+                    return
+                pipe.multi()
+                pipe.delete(lock_key)
+                await pipe.execute()
+            except WatchError:
+                pass
+
+    async def wait_for_cached_order(
+        self, order_id: int
+    ) -> tuple[Optional[CachedOrder], bool]:
+        """
+        Polls the cache while another process loads the order, up to
+        ORDER_CACHE_LOCK_WAIT_MS, and stops as soon as the loader releases its lock.
+        Returns the cached order (or None) and whether the loader found the order missing.
+        """
+        keys: list[str] = [
+            self.order_cache_key(order_id),
+            self.order_missing_key(order_id),
+            self.order_lock_key(order_id),
+        ]
+        deadline: float = asyncio.get_running_loop().time() + (
+            settings.ORDER_CACHE_LOCK_WAIT_MS / 1000
+        )
+        while asyncio.get_running_loop().time() < deadline:
+            await asyncio.sleep(0.05)
+            value, missing, lock = await self._redis.mget(*keys)
+            if value:
+                return self.unpack_order(value), False
+            if missing:
+                return None, True
+            if lock is None:
+                break
+        return None, False
+
+    async def load_order(
+        self,
+        order_id: int,
+        generation: Optional[Any],
+    ) -> tuple[Optional[CachedOrder], bool]:
+        """
+        Loads an order into the cache after a miss. Only the process holding the
+        short Redis lock reads the database, the others wait for its result.
+        The order is loaded without the user filter; callers check ownership.
+        Returns the cached order (or None) and whether it is present in the cache.
+        """
+        lock_key: str = self.order_lock_key(order_id)
+        token: str = uuid.uuid4().hex
+        locked: bool = await self._redis.set(
+            lock_key, token, nx=True, px=settings.ORDER_CACHE_LOCK_TTL_MS
+        )
+        if not locked:
+            cached_order, missing = await self.wait_for_cached_order(order_id)
+            if cached_order:
+                return cached_order, True
+            if missing:
+                return None, False
+            logger.info(
+                "Order %s was not cached by the lock holder, loading directly", order_id
+            )
+
+        try:
+            # A stale replica read would be cached for the whole TTL.
+            await self.read_own_writes(self.order_written_key(order_id))
+            order: Optional[dict[str, Any]] = (
+                await self.order_repository.get_data_by_id(order_id)
+            )
+            if order is None:
+                # Lets the waiting readers answer without querying the database.
+                await self._redis.set(
+                    self.order_missing_key(order_id),
+                    1,
+                    px=settings.ORDER_CACHE_MISSING_TTL_MS,
+                )
+                return None, False
+            value: bytes = self.pack_order(OrderRead.model_validate(order).dict())
+            cached: bool = await self.fill_cached_order(order_id, value, generation)
+            return self.unpack_order(value), cached
+        finally:
+            if locked:
+                await self.release_lock(lock_key, token)
+
+    async def load_shared_order(
+        self,
+        order_id: int,
+        generation: Optional[Any],
+    ) -> tuple[Optional[CachedOrder], bool]:
+        """
+        Runs load_order for a coalesced cache miss with a session and a Redis client
+        of its own. Every request missing the order awaits this load, which may
+        outlive the request that started it and whose session and client are closed
+        when it ends.
+        """
+        redis_client: "Redis" = redis.asyncio.Redis(
+            connection_pool=self._redis.connection_pool
+        )
+        try:
+            async with read_session() as session:
+                manager: OrderManager = type(self)(
+                    order_repository=type(self.order_repository)(
+                        session, self.order_repository.model
+                    ),
+                    redis=redis_client,
+                )
+                return await manager.load_order(order_id, generation)
+        finally:
+            await redis_client.aclose(close_connection_pool=False)
 
     async def on_after_create_order(
         self,
@@ -57,41 +417,96 @@ class OrderManager(OrderMixin):
         """
 
         data["user_id"] = user.id
+        await self.check_products_exist([data])
 
-        order: "Order" = await self.order_repository.create(data)
+        order: dict[str, Any] = await self.order_repository.create(data)
         order_read: OrderRead = OrderRead.model_validate(order)
 
-        await self.cache_order(order.id, order_read.dict())
+        await self.cache_order(order_read.id, order_read.dict())
 
-        logger.info("Order created successfully by id %s", order.id)
+        logger.info("Order created successfully by id %s", order_read.id)
 
         return JSONResponse(
             content=order_read.dict(),
             status_code=HTTP_201_CREATED,
         )
 
+    async def on_after_bulk_create_orders(
+        self,
+        data: list[dict[Any, Any]],
+        user: UserRead,
+    ) -> JSONResponse:
+        """
+        Creates a batch of orders for the given user in a single transaction and
+        caches them in a single Redis round trip. The created orders are returned
+        as a JSON response with a 201 Created status.
+        """
+        for order_data in data:
+            order_data["user_id"] = user.id
+        await self.check_products_exist(data)
+
+        orders: list[dict[str, Any]] = await self.order_repository.bulk_create(data)
+        orders_read: list[dict[str, Any]] = [
+            OrderRead.model_validate(order).dict() for order in orders
+        ]
+
+        await self.cache_orders({order["id"]: order for order in orders_read})
+
+        logger.info("Orders created in bulk: %d", len(orders_read))
+
+        return JSONResponse(
+            content=orders_read,
+            status_code=HTTP_201_CREATED,
+        )
+
     async def get_details(
         self,
         pk: int,
         user: UserRead,
-    ) -> JSONResponse:
+    ) -> Response:
         """
         Retrieves the details of an order based on its primary key (pk).
-        The order is validated and returned as a JSON response with a 200 OK status.
+        The cached response body is returned as is with a 200 OK status, without
+        being parsed or validated again.
         """
-        cached_order = await self.get_cached_order(pk)
+        key: str = self.order_cache_key(pk)
+        if self.local_cache is not None and (cached_order := self.local_cache.get(key)):
+            logger.info("Order %s retrieved from local cache", pk)
+            return self.order_response(pk, user, cached_order)
+
+        token: Optional[int] = (
+            self.local_cache.invalidations if self.local_cache is not None else None
+        )
+        cached_order, generation = await self.get_cached_order(pk)
+        cached: bool = True
         if cached_order:
-            order_read = OrderRead.model_validate(cached_order)
             logger.info("Order %s retrieved from cache", pk)
         else:
-            order: "Order" = await self.get_order_or_404(pk, user)
-            order_read: OrderRead = OrderRead.model_validate(order)
-            await self.cache_order(order.id, order_read.dict())
-            logger.info("Order %s founded successfully by id %s", pk, order.id)
+            cached_order, cached = await self.single_flight.run(
+                key, lambda: self.load_shared_order(pk, generation)
+            )
+            logger.info("Order %s loaded on cache miss", pk)
 
-        return JSONResponse(
-            content=order_read.dict(),
+        if self.local_cache is not None and cached_order is not None and cached:
+            self.local_cache.set(key, cached_order, len(cached_order[1]), token)
+
+        return self.order_response(pk, user, cached_order)
+
+    def order_response(
+        self,
+        pk: int,
+        user: UserRead,
+        cached_order: Optional[CachedOrder],
+    ) -> Response:
+        """
+        Checks that the user may read the cached order and wraps its body in a response.
+        """
+        if cached_order is None or not self.can_access_order(user, cached_order[0]):
+            self.raise_order_not_found(pk, user)
+        return Response(
+            content=cached_order[1],
             status_code=HTTP_200_OK,
+            media_type="application/json",
         )
 
     async def soft_delete(
@@ -104,42 +519,243 @@ class OrderManager(OrderMixin):
         logically removed from the system but can be recovered if needed.
         The function returns a JSON response with a 200 OK status.
         """
-        order: "Order" = await self.get_order_or_404(pk, user)
-        await self.order_repository.delete(order)
-        await self.delete_cached_order(pk)
+        deleted: list[tuple[int, int]] = (
+            await self.order_repository.soft_delete_by_filter({"ids": [pk]})
+        )
+        if not deleted:
+            self.raise_order_not_found(pk, user)
+        await self.delete_cached_orders(dict(deleted), user.id)
         logger.info("Order %r deleted soft", pk)
         return JSONResponse(
             status_code=HTTP_200_OK,
             content={"order": f"Order {pk} deleted soft"},
         )
 
-    async def filter_orders(
+    async def bulk_soft_delete(
         self,
         user: UserRead,
         filters: dict[str, Any],
     ) -> JSONResponse:
         """
-        Filters orders based on the provided criteria and retrieves them from
-        the database. Each filtered order is validated and returned as a list
-        of dictionaries in a JSON response with a 200 OK status.
+        Soft deletes every order matching the filters in a single statement and
+        drops them from the cache in a single Redis round trip. At least one filter
+        is required. Returns the number of deleted orders with a 200 OK status.
         """
+        if all(value is None for value in filters.values()):
+            logger.info("Bulk delete without filters refused")
+            raise HTTPException(
+                status_code=HTTP_400_BAD_REQUEST,
+                detail={
+                    "filters": "At least one filter is required to delete orders in bulk.",
+                    "code": "null",
+                },
+            )
         await self.check_filters(user, filters)
-        orders: list["Order"] = await self.order_repository.get_by_filter_or_get_all(
-            filters=filters
+        deleted: list[tuple[int, int]] = (
+            await self.order_repository.soft_delete_by_filter(filters)
         )
-        orders_data: Optional[list[dict[Any, Any]]] = [
-            OrderRead.model_validate(order).dict() for order in orders
-        ]
+        await self.delete_cached_orders(dict(deleted), user.id)
+        logger.info("Orders deleted soft in bulk: %d", len(deleted))
+        return JSONResponse(
+            status_code=HTTP_200_OK,
+            content={"deleted": len(deleted)},
+        )
+
+    async def get_stats(
+        self,
+        user: UserRead,
+        filters: dict[Any, Any],
+        group_by: list[str],
+    ) -> Response:
+        """
+        Returns order statistics grouped by status, and optionally by day and user,
+        aggregated by the database over the orders the user may read. Results are
+        cached for ORDERS_STATS_CACHE_TTL_SECONDS, so they may lag recent writes.
+        """
+        await self.check_filters(user, filters)
+        key: str = self.orders_stats_cache_key(filters, group_by)
+        body: Optional[bytes] = await self._redis.get(key)
+        if body is None:
+            groups: list[dict[str, Any]] = await self.order_repository.get_stats(
+                filters, group_by
+            )
+            items: list[dict[str, Any]] = [
+                OrderStatsGroup(
+                    status=group["status"].value,
+                    day=None if group.get("day") is None else str(group["day"]),
+                    user_id=group.get("user_id"),
+                    count=group["count"],
+                    total=group["total"],
+                    avg=round(group["avg"], 2),
+                    min=group["min"],
+                    max=group["max"],
+                ).dict(exclude_none=True)
+                for group in groups
+            ]
+            body = json.dumps({"items": items}, separators=(",", ":")).encode("utf-8")
+            await self._redis.set(key, body, ex=settings.ORDERS_STATS_CACHE_TTL_SECONDS)
+            logger.info("Order statistics computed: %d groups", len(items))
+        return Response(
+            content=body,
+            status_code=HTTP_200_OK,
+            media_type="application/json",
+        )
+
+    async def get_user_summary(
+        self,
+        user: UserRead,
+        user_id: Optional[int] = None,
+    ) -> JSONResponse:
+        """
+        Returns the number and total price of a user's orders per status, read from
+        the maintained summary rather than aggregated from the orders. Superusers
+        may read the summary of any user, other users only their own.
+        """
+        filters: dict[str, Any] = {"user_id": user_id or user.id}
+        await self.check_filters(user, filters)
+        await self.read_own_writes(*self.orders_written_keys(user, filters))
+        groups: list[dict[str, Any]] = await self.order_repository.get_user_summary(
+            filters["user_id"]
+        )
+        summary: UserOrderSummary = UserOrderSummary(
+            user_id=filters["user_id"],
+            items=[
+                UserOrderSummaryGroup(
+                    status=group["status"].value,
+                    count=group["order_count"],
+                    total=group["total_spent"],
+                )
+                for group in groups
+            ],
+        )
+        return JSONResponse(
+            status_code=HTTP_200_OK,
+            content=summary.dict(),
+        )
+
+    async def filter_orders(
+        self,
+        user: UserRead,
+        filters: dict[str, Any],
+        limit: int = settings.ORDERS_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        order_by: Optional[str] = None,
+    ) -> Response:
+        """
+        Filters orders based on the provided criteria and retrieves one page of them
+        from the database, using keyset pagination over (order_by, id).
+        Searches are sorted by relevance unless another order_by is given, and
+        other listings by creation time. Sorted by relevance, only
+        ORDERS_SEARCH_MAX_CANDIDATES matches of each name are ranked, so that the
+        page does not get slower as a search matches more orders.
+        The page and the cursor of the next one are returned in a JSON response
+        with a 200 OK status. Orders are read as plain rows with their products
+        rendered by the database, and written to the body without validation.
+        """
+        await self.check_filters(user, filters)
+        searching: bool = filters.get("q", None) is not None
+        if order_by is None:
+            order_by = "relevance" if searching else "created_at"
+        elif order_by == "relevance" and not searching:
+            logger.info("Sorting by relevance without a search")
+            raise HTTPException(
+                status_code=HTTP_400_BAD_REQUEST,
+                detail={
+                    "order_by": "Sorting by relevance requires a search.",
+                    "code": "invalid_choice",
+                },
+            )
+        after: Optional[tuple[Any, int]] = self.decode_cursor(order_by, cursor)
+        await self.read_own_writes(*self.orders_written_keys(user, filters))
+        orders: list["OrderRow"] = await self.order_repository.get_rows_by_filter(
+            filters=filters,
+            limit=limit + 1,
+            order_by=order_by,
+            after=after,
+            search_candidates=(
+                settings.ORDERS_SEARCH_MAX_CANDIDATES
+                if order_by == "relevance"
+                else None
+            ),
+        )
+        next_cursor: Optional[str] = None
+        if len(orders) > limit:
+            orders = orders[:limit]
+            next_cursor = self.encode_cursor(order_by, orders[-1])
+
         logger.info(
             "Orders data: IDs: %s, Total Count: %d",
             [order.id for order in orders],
             len(orders),
         )
-        return JSONResponse(
+        items: str = ",".join(order.to_json() for order in orders)
+        return Response(
+            content=f'{{"items":[{items}],"next_cursor":{json.dumps(next_cursor)}}}',
             status_code=HTTP_200_OK,
-            content=orders_data,
+            media_type="application/json",
         )
 
+    async def export_orders(
+        self,
+        user: UserRead,
+        filters: dict[str, Any],
+        export_format: str,
+    ) -> StreamingResponse:
+        """
+        Streams every order matching the filters, scoped like the listing, as NDJSON
+        or as CSV with a row per order line. The body is rendered one batch of
+        ORDERS_EXPORT_BATCH_SIZE orders at a time from a server-side cursor, so
+        memory does not grow with the number of orders.
+        """
+        await self.check_filters(user, filters)
+        primary: bool = await self.written_recently(
+            *self.orders_written_keys(user, filters)
+        )
+        logger.info("Orders export: format %s, filters %s", export_format, filters)
+        return StreamingResponse(
+            self.render_export(filters, export_format, primary),
+            status_code=HTTP_200_OK,
+            media_type="text/csv" if export_format == "csv" else "application/x-ndjson",
+            headers={
+                "Content-Disposition": f'attachment; filename="orders.{export_format}"'
+            },
+        )
+
+    async def render_export(
+        self,
+        filters: dict[str, Any],
+        export_format: str,
+        primary: bool,
+    ) -> AsyncIterator[str]:
+        """
+        Renders the exported orders batch by batch. The body is sent after the
+        request's dependencies have closed its session, so the export reads on a
+        session of its own, from the primary if primary is set, closed when the
+        body is sent or the client goes away.
+        """
+        buffer: io.StringIO = io.StringIO()
+        writer: Any = csv.writer(buffer)
+        async with read_session() as session:
+            if primary:
+                use_primary(session)
+            repository: "OrdersRepository" = type(self.order_repository)(
+                session, self.order_repository.model
+            )
+            if export_format == "csv":
+                writer.writerow(ORDER_CSV_COLUMNS)
+                yield buffer.getvalue()
+            async for rows in repository.stream_rows_by_filter(
+                filters, settings.ORDERS_EXPORT_BATCH_SIZE
+            ):
+                if export_format == "csv":
+                    buffer.seek(0)
+                    buffer.truncate()
+                    for row in rows:
+                        writer.writerows(row.to_csv_rows())
+                    yield buffer.getvalue()
+                else:
+                    yield "".join(f"{row.to_json()}\n" for row in rows)
+
     async def on_after_update(
         self,
         pk: int,
@@ -151,16 +767,45 @@ class OrderManager(OrderMixin):
         Updates an existing order identified by its primary key (pk) with the
         provided data. After validation and successful update, the updated order
         is returned as a JSON response with a 200 OK status.
+        The order is updated in a single statement whose ownership condition
+        replaces reading it first. An order that is missing or not visible to the
+        user is reported as not found even when the data is invalid, so that the
+        errors do not reveal which orders exist.
         """
-        order: "Order" = await self.get_order_or_404(pk, user)
+        owner_id: Optional[int] = None if user.is_superuser else user.id
+        try:
+            await self.validate_data_for_update(user, data, user_manager)
+        except HTTPException:
+            if not await self.order_repository.exists_by_id(pk, owner_id):
+                self.raise_order_not_found(pk, user)
+            raise
 
-        await self.validate_data_for_update(user, data, user_manager)
+        order: Optional[dict[str, Any]] = await self.order_repository.update_by_id(
+            pk, data, owner_id
+        )
+        if order is None:
+            self.raise_order_not_found(pk, user)
+        order["products"] = await self.get_order_products(pk)
 
-        order_update: "Order" = await self.order_repository.update(order, data)
-        order_read: OrderRead = OrderRead.model_validate(order_update)
-        await self.cache_order(order_update.id, order_read.dict())
+        order_read: OrderRead = OrderRead.model_validate(order)
+        await self.cache_order(pk, order_read.dict(), user.id)
         logger.info("Order update: %s", order_read)
         return JSONResponse(
             status_code=HTTP_200_OK,
             content=order_read.dict(),
         )
+
+    async def get_order_products(self, pk: int) -> list[dict[str, Any]]:
+        """
+        Returns the products of an order, taken from the cached order when present.
+        Products are never changed after the order is created, so any cached
+        version of the order has the current ones.
+        """
+        cached_order: Optional[CachedOrder] = None
+        if self.local_cache is not None:
+            cached_order = self.local_cache.get(self.order_cache_key(pk))
+        if cached_order is None:
+            cached_order, _ = await self.get_cached_order(pk)
+        if cached_order is not None:
+            return json.loads(cached_order[1])["products"]
+        return await self.order_repository.get_products(pk)
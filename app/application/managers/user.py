@@ -1,5 +1,5 @@
 from logging.config import dictConfig
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Optional
 import logging
 
 from starlette.status import HTTP_400_BAD_REQUEST
@@ -7,8 +7,13 @@ from starlette.status import HTTP_400_BAD_REQUEST
 from app.core.config import settings
 from app.core.logger import LoggerConfig
 from app.domain.models.auth import User
+from app.infrastructure.auth_cache import invalidate_user
+from app.domain.schemas.user import AuthenticatedUser
 from fastapi import Request, HTTPException
-from fastapi_users import BaseUserManager, IntegerIDMixin, models
+from fastapi_users import BaseUserManager, IntegerIDMixin, schemas, models
+
+if TYPE_CHECKING:
+    from aioredis import Redis
 
 dictConfig(LoggerConfig().model_dump())
 logger: logging = logging.getLogger("digital_travel_concierge")
@@ -24,6 +29,10 @@ class UserManager(IntegerIDMixin, BaseUserManager[User, int]):
     reset_password_token_secret: str = SECRET
     verification_token_secret: str = SECRET
 
+    def __init__(self, user_db: Any, redis: Optional["Redis"] = None) -> None:
+        super().__init__(user_db)
+        self._redis = redis
+
     async def get(self, id: models.ID) -> models.UP:
         """
         Get a user by id.
@@ -46,6 +55,31 @@ class UserManager(IntegerIDMixin, BaseUserManager[User, int]):
 
         return user
 
+    async def update(
+        self,
+        user_update: schemas.UU,
+        user: User | AuthenticatedUser,
+        safe: bool = False,
+        request: Optional[Request] = None,
+    ) -> User:
+        """
+        Update a user, reloaded from the database: the authenticated user may be the
+        read-only one from the auth cache or a JWT.
+        """
+        return await super().update(
+            user_update, await self.get(user.id), safe=safe, request=request
+        )
+
+    async def delete(
+        self,
+        user: User | AuthenticatedUser,
+        request: Optional[Request] = None,
+    ) -> None:
+        """
+        Delete a user, reloaded from the database, see update.
+        """
+        await super().delete(await self.get(user.id), request=request)
+
     async def on_after_register(
         self,
         user: User,
@@ -55,3 +89,28 @@ class UserManager(IntegerIDMixin, BaseUserManager[User, int]):
             "User %r has registered.",
             user.id,
         )
+
+    async def on_after_update(
+        self,
+        user: User,
+        update_dict: dict[str, Any],
+        request: Optional[Request] = None,
+    ):
+        """
+        Drops the cached user of every token, so that the change applies at once.
+        """
+        if self._redis is not None:
+            await invalidate_user(self._redis, user.id)
+        logger.info("User %r has been updated.", user.id)
+
+    async def on_after_delete(
+        self,
+        user: User,
+        request: Optional[Request] = None,
+    ):
+        """
+        Drops the cached user of every token issued to the deleted user.
+        """
+        if self._redis is not None:
+            await invalidate_user(self._redis, user.id)
+        logger.info("User %r has been deleted.", user.id)
@@ -1,5 +1,10 @@
 from logging.config import dictConfig
+import base64
+import binascii
+import decimal
+import json
 import logging
+from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Optional
 
 from fastapi import HTTPException
@@ -9,6 +14,7 @@ from starlette.status import (
     HTTP_404_NOT_FOUND,
 )
 
+from app.core.config import settings
 from app.core.logger import LoggerConfig
 from app.domain.models.order import StatusEnum
 from app.infrastructure.redis import get_redis
@@ -34,34 +40,33 @@ class OrderMixin:
         self.order_repository = order_repository
         self._redis = redis
 
-    async def get_order_or_404(self, pk: int, user: "UserRead") -> "Order":
+    @staticmethod
+    def raise_order_not_found(pk: int, user: "UserRead") -> None:
         """
-        Retrieves an order by its ID and checks if the order belongs to the current user.
-        If the order is not found, raises a 404 HTTP exception.
-        Superusers are allowed to access any order by ID.
+        Raises a 404 HTTP exception for an order that is missing or not visible to the user.
         """
-        if user.is_superuser:
-            order: "Order" = await self.order_repository.get_by_id_by_current_user(pk)
-        else:
-            order: "Order" = await self.order_repository.get_by_id_by_current_user(
-                pk, user.id
-            )
-        if order is None:
-            logger.info("Order %s not found for user %s", pk, user.id)
-            raise HTTPException(
-                status_code=HTTP_404_NOT_FOUND,
-                detail={
-                    "order": f"Not Found by id: {pk}",
-                    "code": "not_found",
-                },
-            )
-        return order
+        logger.info("Order %s not found for user %s", pk, user.id)
+        raise HTTPException(
+            status_code=HTTP_404_NOT_FOUND,
+            detail={
+                "order": f"Not Found by id: {pk}",
+                "code": "not_found",
+            },
+        )
+
+    @staticmethod
+    def can_access_order(user: "UserRead", order_user_id: int) -> bool:
+        """
+        Checks whether the user may read an order owned by the given user ID.
+        Superusers are allowed to access any order.
+        """
+        return user.is_superuser or order_user_id == user.id
 
     async def check_filters(self, user: "UserRead", filters: dict[Any, Any]) -> None:
         """
-        Validates the provided filters for orders, checking status and price ranges.
-        Raises HTTP exceptions for invalid filters. If the user is not a superuser,
-        adds the user ID to the filters.
+        Validates the provided filters for orders, checking status, price and time
+        ranges and the length of the search. Raises HTTP exceptions for invalid
+        filters. If the user is not a superuser, adds the user ID to the filters.
         """
         status: Optional[str] = filters.get("status", None)
         min_price: Optional[int] = filters.get("min_price", None)
@@ -95,9 +100,124 @@ class OrderMixin:
                 },
             )
 
+        # Creation times are stored as naive UTC.
+        for key in ("created_from", "created_to"):
+            value: Optional[datetime] = filters.get(key, None)
+            if value is not None and value.tzinfo is not None:
+                filters[key] = value.astimezone(timezone.utc).replace(tzinfo=None)
+        created_from: Optional[datetime] = filters.get("created_from", None)
+        created_to: Optional[datetime] = filters.get("created_to", None)
+        if (
+            created_from is not None
+            and created_to is not None
+            and created_from >= created_to
+        ):
+            logger.info(
+                "%r >= %r The start of the time range must be before its end.",
+                created_from,
+                created_to,
+            )
+            raise HTTPException(
+                status_code=HTTP_400_BAD_REQUEST,
+                detail={
+                    "error": "The start of the time range must be before its end.",
+                    "code": "invalid_date_range",
+                },
+            )
+
+        q: Optional[str] = filters.get("q", None)
+        if q is not None:
+            filters["q"] = q = q.strip()
+            if len(q) < settings.ORDERS_SEARCH_MIN_LENGTH:
+                logger.info("Search too short: %r", q)
+                raise HTTPException(
+                    status_code=HTTP_400_BAD_REQUEST,
+                    detail={
+                        "q": f"The search must be at least "
+                        f"{settings.ORDERS_SEARCH_MIN_LENGTH} characters long.",
+                        "code": "invalid_search",
+                    },
+                )
+
         if not user.is_superuser:
             filters["user_id"] = user.id
 
+    async def check_products_exist(self, orders_data: list[dict[Any, Any]]) -> None:
+        """
+        Validates that the products referenced by id in the orders exist in the catalog.
+        Raises an HTTP exception listing the unknown product IDs.
+        """
+        product_ids: set[int] = {
+            product["id"]
+            for order_data in orders_data
+            for product in order_data["products"]
+            if product.get("id") is not None
+        }
+        missing: list[int] = await self.order_repository.get_missing_product_ids(
+            product_ids
+        )
+        if missing:
+            logger.info("Products not found by ids: %s", missing)
+            raise HTTPException(
+                status_code=HTTP_400_BAD_REQUEST,
+                detail={
+                    "products": f"Products not found by ids: {missing}",
+                    "code": "not_found",
+                },
+            )
+
+    @staticmethod
+    def encode_cursor(order_by: str, order: "Order") -> str:
+        """
+        Builds an opaque cursor from the sort key of the last order of a page.
+        """
+        value: Any = getattr(order, order_by)
+        payload: dict[str, Any] = {
+            "order_by": order_by,
+            "value": value.isoformat() if isinstance(value, datetime) else str(value),
+            "id": order.id,
+        }
+        return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+    @staticmethod
+    def decode_cursor(
+        order_by: str, cursor: Optional[str]
+    ) -> Optional[tuple[Any, int]]:
+        """
+        Decodes a cursor into the (sort value, id) keyset of the previous page.
+        Raises an HTTP exception if the cursor is malformed or was issued for
+        another sort order.
+        """
+        if cursor is None:
+            return None
+        try:
+            payload: dict[str, Any] = json.loads(base64.urlsafe_b64decode(cursor))
+            if payload["order_by"] != order_by:
+                raise ValueError(payload["order_by"])
+            value: Any
+            if order_by == "created_at":
+                value = datetime.fromisoformat(payload["value"])
+            elif order_by == "relevance":
+                value = float(payload["value"])
+            else:
+                value = decimal.Decimal(payload["value"])
+            return value, int(payload["id"])
+        except (
+            binascii.Error,
+            decimal.InvalidOperation,
+            KeyError,
+            TypeError,
+            ValueError,
+        ):
+            logger.info("Invalid cursor: %s", cursor)
+            raise HTTPException(
+                status_code=HTTP_400_BAD_REQUEST,
+                detail={
+                    "cursor": "The cursor is invalid for this sort order.",
+                    "code": "invalid_cursor",
+                },
+            )
+
     async def validate_data_for_update(
         self,
         user: "UserRead",
@@ -1,3 +1,5 @@
+from typing import Literal, Optional
+
 from pydantic_settings import BaseSettings
 from dotenv import load_dotenv
 
@@ -15,22 +17,95 @@ class Settings(BaseSettings):
     DB_PASS: str
     DB_NAME: str
 
+    # Engine tuning. Unset values fall back to the DB_POOL_PRESET defaults,
+    # see app.infrastructure.db.DB_POOL_PRESETS.
+    DB_POOL_PRESET: Literal["direct", "transaction_pooler"] = "direct"
+    DB_USE_NULL_POOL: Optional[bool] = None
+    DB_POOL_SIZE: Optional[int] = None
+    DB_MAX_OVERFLOW: Optional[int] = None
+    DB_POOL_TIMEOUT: Optional[float] = None
+    DB_POOL_RECYCLE: Optional[int] = None
+    DB_POOL_PRE_PING: Optional[bool] = None
+    DB_POOL_WARMUP_CONNECTIONS: Optional[int] = None
+    DB_STATEMENT_CACHE_SIZE: Optional[int] = None
+    DB_STATEMENT_TIMEOUT_MS: Optional[int] = None
+    DB_APPLICATION_NAME: str = "digital_travel_concierge"
+    # Read replicas for the read-only endpoints, as SQLAlchemy URLs.
+    DB_REPLICA_URLS: list[str] = []
+    # Replicas further behind are skipped, and data written more recently is read from the primary.
+    DB_REPLICA_MAX_LAG_SECONDS: float = 2.0
+    DB_REPLICA_LAG_CHECK_INTERVAL_SECONDS: float = 1.0
+
     POSTGRES_DB: str
     POSTGRES_USER: str
     POSTGRES_PASSWORD: str
 
     REDIS_PORT: int
     REDIS_HOST: str
+    REDIS_MAX_CONNECTIONS: int = 50
+    REDIS_SOCKET_TIMEOUT: float = 5.0
+    REDIS_SOCKET_CONNECT_TIMEOUT: float = 5.0
+    REDIS_HEALTH_CHECK_INTERVAL: int = 30
+
+    # Bump whenever the format of a cached value changes, so that a rolling deploy
+    # never reads the entries written by the previous release.
+    CACHE_SCHEMA_VERSION: int = 3
+    DEPLOY_VERSION: str = "0"
+    ORDER_CACHE_TTL_SECONDS: int = 300
+    ORDER_CACHE_LOCK_TTL_MS: int = 3000
+    ORDER_CACHE_LOCK_WAIT_MS: int = 1000
+    # How long the loader of a missing order tells the waiting readers it does not exist.
+    ORDER_CACHE_MISSING_TTL_MS: int = 1000
+    ORDER_LOCAL_CACHE_ENABLED: bool = False
+    ORDER_LOCAL_CACHE_TTL_SECONDS: float = 5.0
+    ORDER_LOCAL_CACHE_MAX_ENTRIES: int = 10_000
+    ORDER_LOCAL_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+
+    ORDERS_PAGE_SIZE: int = 50
+    ORDERS_MAX_PAGE_SIZE: int = 500
+    ORDERS_BULK_MAX_SIZE: int = 1000
+    ORDERS_STATS_CACHE_TTL_SECONDS: int = 30
+    # Orders rendered per chunk of GET /orders/export, and fetched per round trip.
+    ORDERS_EXPORT_BATCH_SIZE: int = 1000
+    # Shorter searches have no trigram, so they could not use the trigram indexes.
+    ORDERS_SEARCH_MIN_LENGTH: int = 3
+    # Matches of each name ranked when a search is sorted by relevance.
+    ORDERS_SEARCH_MAX_CANDIDATES: int = 1000
+    # Monthly range partitioning of orders on PostgreSQL, applied by migration a7e3c9d51f08.
+    ORDERS_PARTITIONING: bool = False
+    ORDERS_PARTITIONS_AHEAD_MONTHS: int = 3
+    ORDERS_PARTITION_CHECK_INTERVAL_SECONDS: int = 6 * 3600
+    # Soft-deleted orders are moved to orders_archive once deleted for longer than the retention.
+    ORDERS_ARCHIVE_RETENTION_DAYS: int = 30
+    ORDERS_ARCHIVE_BATCH_SIZE: int = 1000
+    ORDERS_ARCHIVE_BATCH_PAUSE_SECONDS: float = 0.0
+    ORDERS_ARCHIVE_ENABLED: bool = False
+    ORDERS_ARCHIVE_INTERVAL_SECONDS: int = 3600
 
     PORT: int
 
     LIFE_TIME_SECONDS: int
     SECRET_JWT: str
 
+    AUTH_STRATEGY: Literal["database", "jwt"] = "database"
+    AUTH_CACHE_ENABLED: bool = True
+    AUTH_CACHE_TTL_SECONDS: int = 60
+    AUTH_LOCAL_CACHE_ENABLED: bool = False
+    AUTH_LOCAL_CACHE_TTL_SECONDS: float = 5.0
+    AUTH_LOCAL_CACHE_MAX_ENTRIES: int = 10_000
+
     @property
     def DB_URL(self) -> str:
         return f"postgresql+asyncpg://{self.DB_USER}:{self.DB_PASS}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
 
+    @property
+    def CACHE_KEY_PREFIX(self) -> str:
+        return f"v{self.CACHE_SCHEMA_VERSION}:{self.DEPLOY_VERSION}"
+
+    @property
+    def CACHE_INVALIDATION_CHANNEL(self) -> str:
+        return f"{self.CACHE_KEY_PREFIX}:invalidate"
+
     class Config:
         env_file = ".env"
 
@@ -1,31 +1,203 @@
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+
+import jwt
+
 from app.core.config import settings
 from app.domain.dependencies.access_token import get_access_token_db
+from app.domain.schemas.user import AuthenticatedUser
+from app.infrastructure.auth_cache import (
+    build_user,
+    cache_user_token,
+    get_cached_user,
+    get_user_generation,
+    invalidate_token,
+    is_token_revoked,
+    revoke_token,
+    user_claims,
+)
+from app.infrastructure.redis import get_redis
 from fastapi import Depends
+from fastapi_users import BaseUserManager, exceptions
 from fastapi_users.authentication import BearerTransport, AuthenticationBackend
-from fastapi_users.authentication.strategy import AccessTokenDatabase, DatabaseStrategy
+from fastapi_users.authentication.strategy import (
+    AccessTokenDatabase,
+    DatabaseStrategy,
+    JWTStrategy,
+)
+from fastapi_users.jwt import decode_jwt, generate_jwt
+from pydantic import ValidationError
 from typing_extensions import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from app.domain.models.auth import AccessToken
+    from aioredis import Redis
+    from app.domain.models.auth import AccessToken, User
 
 # Bearer transport used for token-based authentication with the specified login endpoint.
 bearer_transport = BearerTransport(tokenUrl="auth/login")
 
 
+class CachedDatabaseStrategy(DatabaseStrategy):
+    """
+    Database strategy that resolves tokens to users through Redis (and an optional
+    in-process tier) before falling back to the access token and user tables.
+    Cached entries never outlive the token itself.
+    """
+
+    def __init__(
+        self,
+        database: AccessTokenDatabase["AccessToken"],
+        redis: "Redis",
+        lifetime_seconds: Optional[int] = None,
+    ):
+        super().__init__(database, lifetime_seconds=lifetime_seconds)
+        self.redis = redis
+
+    async def read_token(
+        self,
+        token: Optional[str],
+        user_manager: BaseUserManager["User", int],
+    ) -> Optional["User | AuthenticatedUser"]:
+        if token is None:
+            return None
+
+        cached_user: Optional[AuthenticatedUser] = await get_cached_user(
+            self.redis, token
+        )
+        if cached_user is not None:
+            return cached_user
+
+        now: datetime = datetime.now(timezone.utc)
+        max_age: Optional[datetime] = None
+        if self.lifetime_seconds:
+            max_age = now - timedelta(seconds=self.lifetime_seconds)
+
+        access_token: Optional["AccessToken"] = await self.database.get_by_token(
+            token, max_age
+        )
+        if access_token is None:
+            return None
+
+        generation: Optional[Any] = await get_user_generation(
+            self.redis, access_token.user_id
+        )
+        try:
+            user: "User" = await user_manager.get(
+                user_manager.parse_id(access_token.user_id)
+            )
+        except (exceptions.UserNotExists, exceptions.InvalidID):
+            return None
+
+        ttl_seconds: int = settings.AUTH_CACHE_TTL_SECONDS
+        if self.lifetime_seconds:
+            expires_at: datetime = access_token.created_at + timedelta(
+                seconds=self.lifetime_seconds
+            )
+            ttl_seconds = min(ttl_seconds, int((expires_at - now).total_seconds()))
+        await cache_user_token(self.redis, token, user, ttl_seconds, generation)
+        return user
+
+    async def destroy_token(self, token: str, user: "User | AuthenticatedUser") -> None:
+        await super().destroy_token(token, user)
+        await invalidate_token(self.redis, token)
+
+
 def get_database_strategy(
     access_token_db: AccessTokenDatabase["AccessToken"] = Depends(get_access_token_db),
+    redis: "Redis" = Depends(get_redis),
 ) -> DatabaseStrategy:
     """
     Returns a database strategy for managing access tokens with a specified lifetime.
     """
+    if settings.AUTH_CACHE_ENABLED:
+        return CachedDatabaseStrategy(
+            access_token_db, redis, lifetime_seconds=settings.LIFE_TIME_SECONDS
+        )
     return DatabaseStrategy(
         access_token_db, lifetime_seconds=settings.LIFE_TIME_SECONDS
     )
 
 
-# Authentication backend configured to use bearer transport and a database strategy.
-authentication_backend = AuthenticationBackend(
-    name="access-token-db",
-    transport=bearer_transport,
-    get_strategy=get_database_strategy,
+class RevocableJWTStrategy(JWTStrategy):
+    """
+    Stateless JWT strategy: the user's authorization fields are signed into the
+    token, so reading it needs no database query. Logout and user changes are
+    enforced through a Redis deny-list checked in a single round trip.
+    """
+
+    def __init__(self, redis: "Redis", secret: str, lifetime_seconds: Optional[int]):
+        super().__init__(secret, lifetime_seconds)
+        self.redis = redis
+
+    def decode(self, token: str) -> dict[str, Any]:
+        return decode_jwt(
+            token, self.decode_key, self.token_audience, algorithms=[self.algorithm]
+        )
+
+    async def read_token(
+        self,
+        token: Optional[str],
+        user_manager: BaseUserManager["User", int],
+    ) -> Optional[AuthenticatedUser]:
+        if token is None:
+            return None
+
+        try:
+            data: dict[str, Any] = self.decode(token)
+            user: AuthenticatedUser = build_user(data["user"])
+            token_id: str = data["jti"]
+            issued_at: float = float(data["iat"])
+        except (jwt.PyJWTError, KeyError, TypeError, ValidationError):
+            return None
+
+        if await is_token_revoked(self.redis, token_id, user.id, issued_at):
+            return None
+        return user
+
+    async def write_token(self, user: "User") -> str:
+        data: dict[str, Any] = {
+            "sub": str(user.id),
+            "aud": self.token_audience,
+            "jti": uuid.uuid4().hex,
+            "iat": time.time(),
+            "user": user_claims(user),
+        }
+        return generate_jwt(
+            data, self.encode_key, self.lifetime_seconds, algorithm=self.algorithm
+        )
+
+    async def destroy_token(self, token: str, user: AuthenticatedUser) -> None:
+        try:
+            data: dict[str, Any] = self.decode(token)
+        except jwt.PyJWTError:
+            return
+        expires_at: float = data.get("exp", time.time() + settings.LIFE_TIME_SECONDS)
+        await revoke_token(self.redis, data["jti"], expires_at)
+
+
+def get_jwt_strategy(redis: "Redis" = Depends(get_redis)) -> JWTStrategy:
+    """
+    Returns a JWT strategy signed with SECRET_JWT and backed by the Redis deny-list.
+    """
+    return RevocableJWTStrategy(
+        redis, secret=settings.SECRET_JWT, lifetime_seconds=settings.LIFE_TIME_SECONDS
+    )
+
+
+# Authentication backend configured to use bearer transport and the strategy
+# selected by AUTH_STRATEGY.
+authentication_backend = (
+    AuthenticationBackend(
+        name="jwt",
+        transport=bearer_transport,
+        get_strategy=get_jwt_strategy,
+    )
+    if settings.AUTH_STRATEGY == "jwt"
+    else AuthenticationBackend(
+        name="access-token-db",
+        transport=bearer_transport,
+        get_strategy=get_database_strategy,
+    )
 )
@@ -2,7 +2,7 @@ from typing import TYPE_CHECKING
 from fastapi import Depends
 
 from app.domain.models import Order
-from app.infrastructure.db import get_async_session
+from app.infrastructure.db import get_async_session, get_read_session
 
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
@@ -15,3 +15,13 @@ async def get_order_db(
     Provides a database connection for working with order records.
     """
     yield Order.get_db(session=session)
+
+
+async def get_order_read_db(
+    session: "AsyncSession" = Depends(get_read_session),
+):
+    """
+    Provides a database connection for reading order records, served by a read
+    replica when one is configured.
+    """
+    yield Order.get_db(session=session)
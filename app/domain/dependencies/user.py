@@ -3,9 +3,11 @@ from typing import TYPE_CHECKING
 from app.application.managers.user import UserManager
 from app.domain.models.auth import User
 from app.infrastructure.db import get_async_session
+from app.infrastructure.redis import get_redis
 from fastapi import Depends
 
 if TYPE_CHECKING:
+    from aioredis import Redis
     from sqlalchemy.ext.asyncio import AsyncSession
 
 
@@ -20,8 +22,9 @@ async def get_user_db(
 
 async def get_user_manager(
     user_db=Depends(get_user_db),
+    redis: "Redis" = Depends(get_redis),
 ):
     """
     Provides an instance of UserManager for managing user operations.
     """
-    yield UserManager(user_db)
+    yield UserManager(user_db, redis)
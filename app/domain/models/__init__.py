@@ -4,6 +4,10 @@ __all__ = [
     "Order",
     "Product",
     "order_product_association_table",
+    "orders_archive_table",
+    "order_product_association_archive_table",
+    "order_import_progress_table",
+    "user_order_summary_table",
     "StatusEnum",
 ]
 
@@ -11,3 +15,6 @@ from .auth import User, AccessToken
 from .order_product import order_product_association_table
 from .order import Order, StatusEnum
 from .product import Product
+from .user_order_summary import user_order_summary_table
+from .order_archive import orders_archive_table, order_product_association_archive_table
+from .order_import import order_import_progress_table
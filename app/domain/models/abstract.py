@@ -1,17 +1,45 @@
 from datetime import datetime
 
 from app.infrastructure.db import Base
-from sqlalchemy import Integer, DateTime, func, Boolean
+from typing import Any
+
+from sqlalchemy import Integer, DateTime, func, Boolean, text
+from sqlalchemy.dialects import sqlite
 from sqlalchemy.orm import Mapped, mapped_column
 
+# SQLite fills server defaults without microseconds, so values bound from Python
+# (e.g. keyset pagination cursors) are stored and compared in the same format.
+Timestamp = DateTime().with_variant(
+    sqlite.DATETIME(
+        storage_format="%(year)04d-%(month)02d-%(day)02d %(hour)02d:%(minute)02d:%(second)02d"
+    ),
+    "sqlite",
+)
+
+# Partial index condition matching the ``is_deleted == False`` filter of every
+# repository query, as rendered by each dialect.
+NOT_DELETED_INDEX: dict[str, Any] = {
+    "postgresql_where": text("NOT is_deleted"),
+    "sqlite_where": text("is_deleted = 0"),
+}
+
+# Partial index condition selecting the soft-deleted rows, waiting to be archived.
+DELETED_INDEX: dict[str, Any] = {
+    "postgresql_where": text("is_deleted"),
+    "sqlite_where": text("is_deleted = 1"),
+}
+
 
 class AbstractModel(Base):
     """
     An abstract base model providing common fields for ID, creation, update timestamps, and a soft delete flag.
     """
     __abstract__ = True
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True, index=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, server_default=func.now())
-    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, server_default=func.now(),
-                                                 onupdate=func.now())
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    created_at: Mapped[datetime] = mapped_column(
+        Timestamp, nullable=False, server_default=func.now()
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, server_default=func.now(), onupdate=func.now()
+    )
     is_deleted: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
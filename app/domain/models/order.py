@@ -7,10 +7,11 @@ from sqlalchemy import (
     Enum,
     Numeric,
     ForeignKey,
+    Index,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.domain.models.abstract import AbstractModel
+from app.domain.models.abstract import AbstractModel, DELETED_INDEX, NOT_DELETED_INDEX
 
 
 from .order_product import order_product_association_table
@@ -39,6 +40,34 @@ class Order(AbstractModel):
     """
 
     __tablename__ = "orders"
+    __table_args__ = (
+        Index(
+            "ix_orders_user_id_created_at",
+            "user_id",
+            "created_at",
+            "id",
+            **NOT_DELETED_INDEX,
+        ),
+        Index("ix_orders_created_at", "created_at", "id", **NOT_DELETED_INDEX),
+        Index(
+            "ix_orders_status_created_at",
+            "status",
+            "created_at",
+            "id",
+            **NOT_DELETED_INDEX,
+        ),
+        Index("ix_orders_total_price", "total_price", "id", **NOT_DELETED_INDEX),
+        # updated_at is the deletion time of soft-deleted orders, see OrdersRepository.archive_deleted.
+        Index("ix_orders_deleted_updated_at", "updated_at", "id", **DELETED_INDEX),
+        # Trigram index of the customer name searches, see OrdersRepository.search_condition.
+        Index(
+            "ix_orders_customer_name_trgm",
+            "customer_name",
+            postgresql_using="gin",
+            postgresql_ops={"customer_name": "gin_trgm_ops"},
+            **NOT_DELETED_INDEX,
+        ).ddl_if(dialect="postgresql"),
+    )
     user_id: Mapped[int] = mapped_column(
         ForeignKey("user.id"),
     )
@@ -0,0 +1,105 @@
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Enum,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    Table,
+    func,
+)
+
+from app.domain.models.abstract import Timestamp
+from app.domain.models.order import StatusEnum
+from app.infrastructure.db import Base
+
+
+# Orders soft-deleted for longer than ORDERS_ARCHIVE_RETENTION_DAYS, moved out of
+# the orders table. They keep their IDs and reference nothing, so that users and
+# products can change without touching the archive.
+orders_archive_table = Table(
+    "orders_archive",
+    Base.metadata,
+    Column(
+        "id",
+        Integer,
+        primary_key=True,
+        autoincrement=False,
+    ),
+    Column(
+        "user_id",
+        Integer,
+        nullable=False,
+    ),
+    Column(
+        "customer_name",
+        String(length=255),
+        nullable=False,
+    ),
+    Column(
+        "status",
+        Enum(StatusEnum),
+        nullable=True,
+    ),
+    Column(
+        "total_price",
+        Numeric(10, 2),
+        nullable=True,
+    ),
+    Column(
+        "created_at",
+        Timestamp,
+        nullable=False,
+    ),
+    Column(
+        "deleted_at",
+        DateTime,
+        nullable=False,
+    ),
+    Column(
+        "archived_at",
+        DateTime,
+        nullable=False,
+        server_default=func.now(),
+    ),
+    Index("ix_orders_archive_user_id", "user_id"),
+)
+
+# Lines of the archived orders.
+order_product_association_archive_table = Table(
+    "order_product_association_archive",
+    Base.metadata,
+    Column(
+        "id",
+        Integer,
+        primary_key=True,
+        autoincrement=False,
+    ),
+    Column(
+        "order_id",
+        Integer,
+        nullable=False,
+    ),
+    Column(
+        "product_id",
+        Integer,
+        nullable=False,
+    ),
+    Column(
+        "quantity",
+        Integer,
+        nullable=False,
+    ),
+    Column(
+        "price",
+        Numeric(10, 2),
+        nullable=False,
+    ),
+    Column(
+        "created_at",
+        Timestamp,
+        nullable=False,
+    ),
+    Index("ix_order_product_association_archive_order_id", "order_id"),
+)
@@ -0,0 +1,36 @@
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Integer,
+    String,
+    Table,
+    func,
+)
+
+from app.infrastructure.db import Base
+
+
+# Number of records of each imported file that have been processed, written in
+# the transaction of each imported batch so that an interrupted import resumes
+# right after the last committed batch.
+order_import_progress_table = Table(
+    "order_import_progress",
+    Base.metadata,
+    Column(
+        "source",
+        String(length=255),
+        primary_key=True,
+    ),
+    Column(
+        "position",
+        Integer,
+        nullable=False,
+    ),
+    Column(
+        "updated_at",
+        DateTime,
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    ),
+)
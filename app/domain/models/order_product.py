@@ -1,10 +1,13 @@
 from sqlalchemy import (
     Integer,
     ForeignKey,
+    Numeric,
     Table,
     Column,
-    UniqueConstraint,
+    Index,
+    func,
 )
+from app.domain.models.abstract import Timestamp
 from app.infrastructure.db import Base
 
 
@@ -26,9 +29,25 @@ order_product_association_table = Table(
         ForeignKey("products.id"),
         nullable=False,
     ),
-    UniqueConstraint(
-        "order_id",
-        "product_id",
-        name="idx_unique_order_product",
+    # Line data of the order: how many were ordered and at which unit price.
+    Column(
+        "quantity",
+        Integer,
+        nullable=False,
+    ),
+    Column(
+        "price",
+        Numeric(10, 2),
+        nullable=False,
+    ),
+    # Creation time of the order, the partition key when orders are partitioned.
+    Column(
+        "created_at",
+        Timestamp,
+        nullable=False,
+        server_default=func.now(),
     ),
+    # Also serves the order_id lookups of selectinload(Order.products).
+    Index("ix_order_product_association_order_id", "order_id", "product_id"),
+    Index("ix_order_product_association_product_id", "product_id"),
 )
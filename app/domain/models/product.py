@@ -3,8 +3,8 @@ from typing import TYPE_CHECKING
 
 from sqlalchemy import (
     String,
-    Integer,
     Numeric,
+    Index,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -18,19 +18,26 @@ if TYPE_CHECKING:
 
 class Product(AbstractModel):
     """
-    Represents a product available for purchase, including its name, quantity, price, and associated orders.
+    Represents a catalog product available for purchase, identified by its unique name,
+    with its list price and associated orders. The quantity and price of each order
+    line are stored on the order-product association.
     """
 
     __tablename__ = "products"
+    __table_args__ = (
+        Index("ix_products_name", "name", unique=True),
+        # Trigram index of the product name searches of the orders.
+        Index(
+            "ix_products_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
     name: Mapped[str] = mapped_column(
         String(length=255),
         nullable=False,
     )
-    quantity: Mapped[int] = mapped_column(
-        Integer,
-        default=0,
-        nullable=False,
-    )
     price: Mapped[decimal.Decimal] = mapped_column(
         Numeric(10, 2),
         nullable=False,
@@ -0,0 +1,41 @@
+from sqlalchemy import (
+    Column,
+    Enum,
+    ForeignKey,
+    Integer,
+    Numeric,
+    Table,
+)
+
+from app.domain.models.order import StatusEnum
+from app.infrastructure.db import Base
+
+
+# Number of non-deleted orders of each user per status and their total price,
+# maintained in the same transaction as the order writes.
+user_order_summary_table = Table(
+    "user_order_summary",
+    Base.metadata,
+    Column(
+        "user_id",
+        ForeignKey("user.id"),
+        primary_key=True,
+    ),
+    Column(
+        "status",
+        Enum(StatusEnum),
+        primary_key=True,
+    ),
+    Column(
+        "order_count",
+        Integer,
+        nullable=False,
+        default=0,
+    ),
+    Column(
+        "total_spent",
+        Numeric(14, 2),
+        nullable=False,
+        default=0,
+    ),
+)
@@ -1,17 +1,68 @@
-from sqlalchemy import Result, Select
+import operator
+from functools import lru_cache
+
+from sqlalchemy import Result, Select, bindparam
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from typing import Generic, Type, TypeVar, Optional, List, Any
+from typing import Callable, Generic, Type, TypeVar, Optional, List, Any
 
 # Generic type for models
 T = TypeVar("T")
 
+# Operators of the filters, given as a suffix of the filter key: "total_price__gte"
+# compares the total_price column with >=, and a key without suffix compares for
+# equality. "in" takes a list of values and "null" a boolean, selecting rows
+# where the column is (True) or is not (False) NULL.
+FILTER_OPERATORS: dict[str, Callable[[Any, Any], Any]] = {
+    "eq": operator.eq,
+    "in": lambda column, value: column.in_(value),
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "lt": operator.lt,
+    "lte": operator.le,
+    "ilike": lambda column, value: column.ilike(value),
+    "null": lambda column, value: column.is_(None) if value else column.is_not(None),
+}
+
+# A filter without its value: column name, operator and, for "null", the boolean.
+FilterShape = tuple[tuple[str, str, Optional[bool]], ...]
+
+
+@lru_cache(maxsize=512)
+def build_filter_statement(model: Any, shape: FilterShape) -> Select:
+    """
+    Builds the query for the non-deleted objects of the model matching filters of
+    the given shape, with their values, the limit and the offset left as bound
+    parameters. Statements are built once per shape and reused, so repeated
+    queries skip the construction and hit the compiled cache of SQLAlchemy.
+    """
+    conditions: list[Any] = [model.is_deleted == False]
+    for name, operator_name, flag in shape:
+        column: Any = model.__table__.c[name]
+        if operator_name == "null":
+            conditions.append(FILTER_OPERATORS["null"](column, flag))
+            continue
+        value: Any = bindparam(
+            f"{name}__{operator_name}",
+            type_=column.type,
+            expanding=operator_name == "in",
+        )
+        conditions.append(FILTER_OPERATORS[operator_name](column, value))
+    return (
+        select(model)
+        .where(*conditions)
+        .order_by(model.id)
+        .limit(bindparam("page_limit"))
+        .offset(bindparam("page_offset"))
+    )
+
 
 class BaseRepository(Generic[T]):
     """
     Generic repository for database operations with SQLAlchemy models,
     including support for soft deletion.
     """
+
     def __init__(self, session: AsyncSession, model: Type[T]):
         self.session = session
         self.model = model
@@ -20,32 +71,60 @@ class BaseRepository(Generic[T]):
         """
         Get an object by its ID, excluding soft-deleted objects.
         """
-        result: Result[T] = await self.session.execute(
-            select(self.model).where(self.model.id == object_id, self.model.is_deleted is False)
-        )
-        return result.scalars().first()
+        objects: List[T] = await self.filter_by({"id": object_id}, limit=1)
+        return objects[0] if objects else None
 
     async def get_all(self, limit: int = 100, offset: int = 0) -> List[T]:
         """
         Get all objects with optional limit and offset, excluding soft-deleted objects.
         """
-        result: Result[T] = await self.session.execute(
-            select(self.model).where(self.model.is_deleted is False).limit(limit).offset(offset)
-        )
-        return result.scalars().all()
+        return await self.filter_by({}, limit=limit, offset=offset)
 
-    async def filter_by(self, filters: dict[str, Any], limit: int = 100, offset: int = 0) -> List[T]:
+    def parse_filters(
+        self, filters: dict[str, Any]
+    ) -> tuple[FilterShape, dict[str, Any]]:
         """
-        Filter objects based on the provided dictionary of filters, with optional limit and offset.
+        Splits the filters into their shape and the values of their bound parameters.
+        Keys are column names, optionally followed by "__" and one of FILTER_OPERATORS.
+        Raises a ValueError for unknown columns and operators, and for a column given
+        the same operator twice, e.g. as "status" and "status__eq".
         """
-        query: Select = select(self.model).where(self.model.is_deleted.is_(False))
-
-        # Apply filters dynamically
-        for field, value in filters.items():
-            query = query.where(getattr(self.model, field) == value)
+        shape: list[tuple[str, str, Optional[bool]]] = []
+        params: dict[str, Any] = {}
+        for key, value in sorted(filters.items()):
+            name, _, operator_name = key.partition("__")
+            operator_name = operator_name or "eq"
+            if name not in self.model.__table__.c:
+                raise ValueError(
+                    f"{self.model.__name__} has no column {name!r} to filter on"
+                )
+            if operator_name not in FILTER_OPERATORS:
+                raise ValueError(
+                    f"Unknown filter operator {operator_name!r} in {key!r}"
+                )
+            if (name, operator_name) in {(column, op) for column, op, _ in shape}:
+                raise ValueError(f"Duplicate filter {name}__{operator_name} in {key!r}")
+            if operator_name == "null":
+                shape.append((name, operator_name, bool(value)))
+                continue
+            shape.append((name, operator_name, None))
+            params[f"{name}__{operator_name}"] = (
+                list(value) if operator_name == "in" else value
+            )
+        return tuple(shape), params
 
-        query = query.limit(limit).offset(offset)
-        result: Result[T] = await self.session.execute(query)
+    async def filter_by(
+        self, filters: dict[str, Any], limit: int = 100, offset: int = 0
+    ) -> List[T]:
+        """
+        Filter objects based on the provided dictionary of filters, with optional limit and offset.
+        Objects are sorted by ID. See FILTER_OPERATORS for the supported filters.
+        """
+        shape, params = self.parse_filters(filters)
+        result: Result[T] = await self.session.execute(
+            build_filter_statement(self.model, shape),
+            {**params, "page_limit": limit, "page_offset": offset},
+        )
         return result.scalars().all()
 
     async def create(self, obj_data: dict[Any, Any]) -> T:
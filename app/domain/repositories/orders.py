@@ -1,14 +1,32 @@
-from typing import Any, TypeVar, Optional
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Optional
 
-from sqlalchemy import select, Result, Select, ScalarResult
-from sqlalchemy.orm import selectinload
+from sqlalchemy import (
+    case,
+    cast,
+    delete,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    text,
+    tuple_,
+    type_coerce,
+    union,
+    update,
+    Float,
+    Result,
+    Select,
+    ScalarResult,
+    Text,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 
 from .abstract import BaseRepository
 
 
-T = TypeVar("T")
-
-
 class OrdersRepository(BaseRepository):
     """
     A repository class for managing CRUD operations on Order objects in the database.
@@ -16,49 +34,702 @@ class OrdersRepository(BaseRepository):
     relationships and transactions.
     """
 
-    async def create(self, obj_data: dict[Any, Any]) -> T:
+    async def create(self, obj_data: dict[Any, Any]) -> dict[str, Any]:
         """
         Creates a new order from the provided data, including associated product details.
         Calculates the total price based on product prices and quantities.
-        Commits the transaction to the database and returns the created order with product details.
+        The rows are written with batched INSERT ... RETURNING statements and the
+        created order is returned as a dictionary with its products, without
+        querying it again.
+        """
+        orders: list[dict[str, Any]] = await self.bulk_create([obj_data])
+        return orders[0]
+
+    async def bulk_create(
+        self,
+        orders_data: list[dict[Any, Any]],
+    ) -> list[dict[str, Any]]:
+        """
+        Creates the orders in a single transaction, using one multi-row
+        INSERT ... RETURNING for the orders and one INSERT for their lines.
+        Products are taken from the catalog by id or name, and products named
+        for the first time are added to it. Returns the created orders as
+        dictionaries with their products, in the order they were given.
+        """
+        from app.domain.models.order_product import order_product_association_table
+
+        products_data: list[list[dict[str, Any]]] = []
+        order_rows: list[dict[str, Any]] = []
+        for order_data in orders_data:
+            order_data = dict(order_data)
+            products: list[dict[str, Any]] = order_data.pop("products")
+            order_data["total_price"] = sum(
+                product["price"] * product["quantity"] for product in products
+            )
+            products_data.append(products)
+            order_rows.append(order_data)
+
+        orders_table = self.model.__table__
+        try:
+            catalog: list[dict[str, Any]] = await self.get_or_create_products(
+                [product for products in products_data for product in products]
+            )
+            orders: list[dict[str, Any]] = [
+                dict(row._mapping)
+                for row in await self.session.execute(
+                    insert(orders_table).returning(
+                        *orders_table.c, sort_by_parameter_order=True
+                    ),
+                    order_rows,
+                )
+            ]
+
+            links: list[dict[str, Any]] = []
+            position: int = 0
+            for order, order_products in zip(orders, products_data):
+                lines: list[dict[str, Any]] = [
+                    {
+                        "name": product["name"],
+                        "price": line["price"],
+                        "quantity": line["quantity"],
+                        "is_deleted": product["is_deleted"],
+                        "id": product["id"],
+                    }
+                    for line, product in zip(
+                        order_products,
+                        catalog[position : position + len(order_products)],
+                    )
+                ]
+                position += len(order_products)
+                # Same order as the products read back with the order.
+                order["products"] = sorted(lines, key=lambda line: line["id"])
+                links.extend(
+                    {
+                        "order_id": order["id"],
+                        "product_id": line["id"],
+                        "quantity": line["quantity"],
+                        "price": line["price"],
+                        "created_at": order["created_at"],
+                    }
+                    for line in order["products"]
+                )
+            await self.session.execute(insert(order_product_association_table), links)
+            await self.update_summaries(self.summary_deltas(orders))
+            await self.session.commit()
+        except Exception as e:
+            await self.session.rollback()
+            raise e
+        return orders
+
+    async def get_or_create_products(
+        self,
+        products_data: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """
+        Returns the catalog product referenced by each of the given products, by id
+        when it is set and by name otherwise. Unknown names are added to the
+        catalog with the given price; names created concurrently by another
+        transaction are read back instead. Does not commit.
         """
         from app.domain.models.product import Product
 
-        products_data: list[dict[str, Any]] = obj_data.pop("products")
-        obj_data["total_price"] = sum(
-            product["price"] * product["quantity"] for product in products_data
+        products_table = Product.__table__
+        columns: list[Any] = [
+            products_table.c.id,
+            products_table.c.name,
+            products_table.c.is_deleted,
+        ]
+        ids: set[int] = {
+            product["id"] for product in products_data if product.get("id") is not None
+        }
+        names: set[str] = {
+            product["name"] for product in products_data if product.get("id") is None
+        }
+        conditions: list[Any] = []
+        if ids:
+            conditions.append(products_table.c.id.in_(ids))
+        if names:
+            conditions.append(products_table.c.name.in_(names))
+
+        by_id: dict[int, dict[str, Any]] = {}
+        by_name: dict[str, dict[str, Any]] = {}
+        if conditions:
+            for row in await self.session.execute(
+                select(*columns).where(or_(*conditions))
+            ):
+                by_id[row.id] = by_name[row.name] = dict(row._mapping)
+
+        new_products: dict[str, dict[str, Any]] = {}
+        for product in products_data:
+            if product.get("id") is None and product["name"] not in by_name:
+                new_products.setdefault(
+                    product["name"],
+                    {
+                        "name": product["name"],
+                        "price": product["price"],
+                        "is_deleted": False,
+                    },
+                )
+        if new_products:
+            await self.session.execute(
+                self.upsert(products_table).on_conflict_do_nothing(
+                    index_elements=["name"]
+                ),
+                list(new_products.values()),
+            )
+            for row in await self.session.execute(
+                select(*columns).where(products_table.c.name.in_(new_products))
+            ):
+                by_id[row.id] = by_name[row.name] = dict(row._mapping)
+
+        return [
+            (
+                by_id[product["id"]]
+                if product.get("id") is not None
+                else by_name[product["name"]]
+            )
+            for product in products_data
+        ]
+
+    def upsert(self, table: Any) -> Any:
+        """
+        Builds an INSERT of the session's dialect, which supports ON CONFLICT clauses.
+        """
+        if self.session.bind.dialect.name == "postgresql":
+            return postgresql.insert(table)
+        return sqlite.insert(table)
+
+    async def update_summaries(self, deltas: dict[tuple[int, Any], list[Any]]) -> None:
+        """
+        Adds the order count and total price deltas, keyed by (user ID, status), to
+        the user order summaries. Rows are written in key order so that concurrent
+        transactions lock them in the same order. Does not commit.
+        """
+        from app.domain.models.user_order_summary import user_order_summary_table
+
+        rows: list[dict[str, Any]] = [
+            {
+                "user_id": user_id,
+                "status": status,
+                "order_count": count,
+                "total_spent": total,
+            }
+            for (user_id, status), (count, total) in sorted(
+                deltas.items(), key=lambda item: (item[0][0], item[0][1].value)
+            )
+            if count or total
+        ]
+        if not rows:
+            return
+        stmt: Any = self.upsert(user_order_summary_table)
+        await self.session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["user_id", "status"],
+                set_={
+                    "order_count": user_order_summary_table.c.order_count
+                    + stmt.excluded.order_count,
+                    "total_spent": user_order_summary_table.c.total_spent
+                    + stmt.excluded.total_spent,
+                },
+            ),
+            rows,
+        )
+
+    @staticmethod
+    def summary_deltas(
+        orders: list[Any],
+        sign: int = 1,
+        deltas: Optional[dict[tuple[int, Any], list[Any]]] = None,
+    ) -> dict[tuple[int, Any], list[Any]]:
+        """
+        Accumulates the summary deltas of adding (sign 1) or removing (sign -1)
+        the given orders, which need user_id, status and total_price.
+        """
+        from app.domain.models.order import StatusEnum
+
+        deltas = {} if deltas is None else deltas
+        for order in orders:
+            key: tuple[int, Any] = (order["user_id"], StatusEnum(order["status"]))
+            delta: list[Any] = deltas.setdefault(key, [0, 0])
+            delta[0] += sign
+            delta[1] += sign * order["total_price"]
+        return deltas
+
+    async def get_user_summary(self, user_id: int) -> list[dict[str, Any]]:
+        """
+        Retrieves the summary of the user's non-deleted orders per status.
+        """
+        from app.domain.models.user_order_summary import user_order_summary_table
+
+        stmt: Select = (
+            select(
+                user_order_summary_table.c.status,
+                user_order_summary_table.c.order_count,
+                user_order_summary_table.c.total_spent,
+            )
+            .where(
+                user_order_summary_table.c.user_id == user_id,
+                user_order_summary_table.c.order_count > 0,
+            )
+            .order_by(user_order_summary_table.c.status)
         )
+        result: Result = await self.session.execute(stmt)
+        return [dict(row._mapping) for row in result]
 
-        order: T = self.model(**obj_data)
-        self.session.add(order)
+    async def rebuild_summaries(
+        self,
+        first_user_id: int,
+        last_user_id: int,
+        write: bool = True,
+    ) -> int:
+        """
+        Recomputes the order summaries of the users in the inclusive ID range from
+        their orders and compares them with the stored ones. When ``write`` is set,
+        the stored summaries of the range are replaced in the same transaction,
+        which on PostgreSQL holds a lock that makes concurrent order writes wait.
+        Returns the number of (user, status) summaries that had drifted.
+        """
+        from app.domain.models.user_order_summary import user_order_summary_table
+
+        summary = user_order_summary_table
+        try:
+            if write and self.session.bind.dialect.name == "postgresql":
+                await self.session.execute(
+                    text("LOCK TABLE user_order_summary IN SHARE ROW EXCLUSIVE MODE")
+                )
+            actual: dict[tuple[int, Any], tuple[int, Any]] = {
+                (row.user_id, row.status): (row.order_count, row.total_spent)
+                for row in await self.session.execute(
+                    select(
+                        self.model.user_id,
+                        self.model.status,
+                        func.count().label("order_count"),
+                        func.sum(self.model.total_price).label("total_spent"),
+                    )
+                    .where(
+                        self.model.user_id.between(first_user_id, last_user_id),
+                        self.model.status.is_not(None),
+                        self.model.is_deleted == False,
+                    )
+                    .group_by(self.model.user_id, self.model.status)
+                )
+            }
+            stored: dict[tuple[int, Any], tuple[int, Any]] = {
+                (row.user_id, row.status): (row.order_count, row.total_spent)
+                for row in await self.session.execute(
+                    select(*summary.c).where(
+                        summary.c.user_id.between(first_user_id, last_user_id),
+                        or_(summary.c.order_count != 0, summary.c.total_spent != 0),
+                    )
+                )
+            }
+            drift: int = sum(
+                1
+                for key in actual.keys() | stored.keys()
+                if actual.get(key) != stored.get(key)
+            )
+            if write and drift:
+                await self.session.execute(
+                    summary.delete().where(
+                        summary.c.user_id.between(first_user_id, last_user_id)
+                    )
+                )
+            if write and drift and actual:
+                await self.session.execute(
+                    insert(summary),
+                    [
+                        {
+                            "user_id": user_id,
+                            "status": status,
+                            "order_count": count,
+                            "total_spent": total,
+                        }
+                        for (user_id, status), (count, total) in actual.items()
+                    ],
+                )
+            await self.session.commit()
+        except Exception as e:
+            await self.session.rollback()
+            raise e
+        return drift
 
-        products: list[Product] = [
-            Product(**product_data) for product_data in products_data
+    async def get_missing_product_ids(self, product_ids: set[int]) -> list[int]:
+        """
+        Returns the given product IDs that are not in the catalog, sorted.
+        """
+        from app.domain.models.product import Product
+
+        if not product_ids:
+            return []
+        found: ScalarResult[int] = await self.session.scalars(
+            select(Product.id).where(Product.id.in_(product_ids))
+        )
+        return sorted(product_ids - set(found))
+
+    async def get_missing_user_ids(self, user_ids: set[int]) -> list[int]:
+        """
+        Returns the given user IDs that do not exist, sorted.
+        """
+        from app.domain.models.auth import User
+
+        if not user_ids:
+            return []
+        found: ScalarResult[int] = await self.session.scalars(
+            select(User.id).where(User.id.in_(user_ids))
+        )
+        return sorted(user_ids - set(found))
+
+    async def get_import_position(self, source: str) -> int:
+        """
+        Returns the number of records of the source already processed by previous imports.
+        """
+        from app.domain.models.order_import import order_import_progress_table
+
+        position: Optional[int] = await self.session.scalar(
+            select(order_import_progress_table.c.position).where(
+                order_import_progress_table.c.source == source
+            )
+        )
+        return position or 0
+
+    async def import_batch(
+        self,
+        orders_data: list[dict[str, Any]],
+        source: str,
+        position: int,
+        catalog: dict[str, int],
+    ) -> None:
+        """
+        Loads validated orders, with user_id and optionally created_at, and their
+        lines in a single transaction, which also records that the first position
+        records of the source have been processed. Products referenced by name are
+        looked up in catalog, a name to ID cache that is filled with the products
+        found or created in the catalog table.
+
+        The order IDs are allocated up front, so that the lines can be built without
+        reading the orders back. On PostgreSQL they are drawn from the sequence and
+        the rows are streamed with COPY into temporary staging tables, from which
+        they are inserted with one INSERT ... SELECT per table. Other databases use
+        executemany INSERT statements with IDs following the highest one.
+        """
+        from app.domain.models.order_import import order_import_progress_table
+
+        orders_table = self.model.__table__
+        # Naive UTC, like the timestamps read from and compared with the tables.
+        now: datetime = datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+        order_rows: list[dict[str, Any]] = [
+            {
+                "user_id": order_data["user_id"],
+                "customer_name": order_data["customer_name"],
+                "status": order_data["status"],
+                "total_price": sum(
+                    product["price"] * product["quantity"]
+                    for product in order_data["products"]
+                ),
+                "created_at": order_data.get("created_at") or now,
+                "is_deleted": False,
+            }
+            for order_data in orders_data
+        ]
+        try:
+            # Written first: on SQLite this takes the database write lock, which keeps
+            # the order IDs allocated below from being taken concurrently.
+            stmt: Any = self.upsert(order_import_progress_table)
+            await self.session.execute(
+                stmt.values(source=source, position=position).on_conflict_do_update(
+                    index_elements=["source"],
+                    set_={"position": stmt.excluded.position, "updated_at": func.now()},
+                )
+            )
+            unknown: list[dict[str, Any]] = [
+                product
+                for order_data in orders_data
+                for product in order_data["products"]
+                if product.get("id") is None and product["name"] not in catalog
+            ]
+            if unknown:
+                for product in await self.get_or_create_products(unknown):
+                    catalog[product["name"]] = product["id"]
+
+            # A batch may consist of rejected orders only, then only its progress is recorded.
+            if order_rows:
+                if self.session.bind.dialect.name == "postgresql":
+                    # One array rather than a row per ID, and the sequence looked up once
+                    # rather than for every ID.
+                    order_ids: list[int] = await self.session.scalar(
+                        text(
+                            "SELECT array_agg(nextval(sequence.id)) FROM "
+                            "CAST(pg_get_serial_sequence('orders', 'id') AS regclass) "
+                            "AS sequence(id), generate_series(1, :count)"
+                        ),
+                        {"count": len(order_rows)},
+                    )
+                else:
+                    last_id: int = (
+                        await self.session.scalar(select(func.max(orders_table.c.id)))
+                    ) or 0
+                    order_ids = list(range(last_id + 1, last_id + 1 + len(order_rows)))
+                lines: list[tuple[Any, ...]] = [
+                    (
+                        order_id,
+                        (
+                            product["id"]
+                            if product.get("id") is not None
+                            else catalog[product["name"]]
+                        ),
+                        product["quantity"],
+                        product["price"],
+                        order_row["created_at"],
+                    )
+                    for order_id, order_row, order_data in zip(
+                        order_ids, order_rows, orders_data
+                    )
+                    for product in order_data["products"]
+                ]
+
+                if self.session.bind.dialect.name == "postgresql":
+                    await self.copy_import_rows(order_ids, order_rows, lines)
+                else:
+                    await self.insert_import_rows(order_ids, order_rows, lines)
+                await self.update_summaries(self.summary_deltas(order_rows))
+            await self.session.commit()
+        except Exception as e:
+            await self.session.rollback()
+            raise e
+
+    async def insert_import_rows(
+        self,
+        order_ids: list[int],
+        order_rows: list[dict[str, Any]],
+        lines: list[tuple[Any, ...]],
+    ) -> None:
+        """
+        Inserts the imported orders and lines with one executemany per table,
+        binding the values in the storage format of SQLite directly to skip the
+        per-row processing of SQLAlchemy. SQLite only, does not commit.
+        """
+        # Storage format of Timestamp on SQLite, formatted once per distinct time.
+        timestamps: dict[datetime, str] = {}
+
+        def timestamp(value: datetime) -> str:
+            if value not in timestamps:
+                timestamps[value] = value.strftime("%Y-%m-%d %H:%M:%S")
+            return timestamps[value]
+
+        connection: Any = await self.session.connection()
+        await connection.exec_driver_sql(
+            "INSERT INTO orders (id, user_id, customer_name, status, total_price, "
+            "created_at, is_deleted) VALUES (?, ?, ?, ?, ?, ?, 0)",
+            [
+                (
+                    order_id,
+                    row["user_id"],
+                    row["customer_name"],
+                    row["status"],
+                    row["total_price"],
+                    timestamp(row["created_at"]),
+                )
+                for order_id, row in zip(order_ids, order_rows)
+            ],
+        )
+        await connection.exec_driver_sql(
+            "INSERT INTO order_product_association "
+            "(order_id, product_id, quantity, price, created_at) VALUES (?, ?, ?, ?, ?)",
+            [
+                (order_id, product_id, quantity, price, timestamp(created_at))
+                for order_id, product_id, quantity, price, created_at in lines
+            ],
+        )
+
+    async def copy_import_rows(
+        self,
+        order_ids: list[int],
+        order_rows: list[dict[str, Any]],
+        lines: list[tuple[Any, ...]],
+    ) -> None:
+        """
+        Streams the imported orders and lines with COPY into staging tables dropped
+        at commit, and inserts them into the order tables. Prices are staged as the
+        floats they were validated as and rounded to numeric by the INSERT, which
+        spares converting each of them to a Decimal. PostgreSQL only, does not commit.
+        """
+        await self.session.execute(
+            text(
+                "CREATE TEMPORARY TABLE import_orders (id integer, user_id integer, "
+                "customer_name varchar(255), status text, total_price double precision, "
+                "created_at timestamp) ON COMMIT DROP"
+            )
+        )
+        await self.session.execute(
+            text(
+                "CREATE TEMPORARY TABLE import_lines (order_id integer, product_id integer, "
+                "quantity integer, price double precision, created_at timestamp) ON COMMIT DROP"
+            )
+        )
+        raw_connection: Any = await (
+            await self.session.connection()
+        ).get_raw_connection()
+        connection: Any = raw_connection.driver_connection
+        await connection.copy_records_to_table(
+            "import_orders",
+            records=[
+                (
+                    order_id,
+                    row["user_id"],
+                    row["customer_name"],
+                    row["status"],
+                    row["total_price"],
+                    row["created_at"],
+                )
+                for order_id, row in zip(order_ids, order_rows)
+            ],
+            columns=[
+                "id",
+                "user_id",
+                "customer_name",
+                "status",
+                "total_price",
+                "created_at",
+            ],
+        )
+        await connection.copy_records_to_table(
+            "import_lines",
+            records=lines,
+            columns=["order_id", "product_id", "quantity", "price", "created_at"],
+        )
+        await self.session.execute(
+            text(
+                "INSERT INTO orders (id, user_id, customer_name, status, total_price, "
+                "created_at, is_deleted) SELECT id, user_id, customer_name, "
+                "CAST(status AS statusenum), CAST(total_price AS numeric(10, 2)), created_at, false "
+                "FROM import_orders"
+            )
+        )
+        await self.session.execute(
+            text(
+                "INSERT INTO order_product_association "
+                "(order_id, product_id, quantity, price, created_at) "
+                "SELECT order_id, product_id, quantity, CAST(price AS numeric(10, 2)), "
+                "created_at FROM import_lines"
+            )
+        )
+
+    async def update_by_id(
+        self,
+        object_id: int,
+        update_data: dict[Any, Any],
+        user_id: Optional[int] = None,
+    ) -> Optional[dict[str, Any]]:
+        """
+        Updates a non-deleted order in a single UPDATE ... RETURNING statement,
+        optionally only if it belongs to the user. Returns the updated order row
+        as a dictionary without its products, or None if no order matched.
+        """
+        orders_table = self.model.__table__
+        conditions: list[Any] = [
+            orders_table.c.id == object_id,
+            orders_table.c.is_deleted == False,
         ]
-        order.products.extend(products)
+        if user_id is not None:
+            conditions.append(orders_table.c.user_id == user_id)
 
+        stmt = (
+            update(orders_table)
+            .where(*conditions)
+            .values(**update_data)
+            .returning(*orders_table.c)
+        )
         try:
+            # The summaries need the previous owner and status, read under a row lock.
+            previous: Optional[Any] = None
+            if "status" in update_data or "user_id" in update_data:
+                previous = (
+                    await self.session.execute(
+                        select(
+                            orders_table.c.user_id,
+                            orders_table.c.status,
+                            orders_table.c.total_price,
+                        )
+                        .where(*conditions)
+                        .with_for_update()
+                    )
+                ).one_or_none()
+            result: Result = await self.session.execute(stmt)
+            row: Optional[Any] = result.one_or_none()
+            if previous is not None and row is not None:
+                deltas = self.summary_deltas([previous._mapping], -1)
+                await self.update_summaries(
+                    self.summary_deltas([row._mapping], 1, deltas)
+                )
             await self.session.commit()
         except Exception as e:
             await self.session.rollback()
             raise e
+        return dict(row._mapping) if row is not None else None
 
+    async def get_products(
+        self,
+        order_id: int,
+        created_at: Optional[datetime] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Retrieves the products of an order as dictionaries, with the quantity and
+        price of the order line. Passing the creation time of the order lets
+        PostgreSQL read the lines from their partition only.
+        """
+        from app.domain.models.product import Product
+        from app.domain.models.order_product import order_product_association_table
+
+        products_table = Product.__table__
+        lines_table = order_product_association_table
         stmt: Select = (
-            select(self.model)
-            .where(self.model.id == order.id)
-            .options(selectinload(self.model.products))
+            select(
+                products_table.c.name,
+                lines_table.c.price,
+                lines_table.c.quantity,
+                products_table.c.is_deleted,
+                products_table.c.id,
+            )
+            .join(lines_table, lines_table.c.product_id == products_table.c.id)
+            .where(lines_table.c.order_id == order_id)
+            .order_by(products_table.c.id, lines_table.c.id)
         )
+        if created_at is not None:
+            stmt = stmt.where(lines_table.c.created_at == created_at)
         result: Result = await self.session.execute(stmt)
-        return result.scalar_one_or_none()
+        return [dict(row._mapping) for row in result]
+
+    async def get_data_by_id(self, object_id: int) -> Optional[dict[str, Any]]:
+        """
+        Retrieves a non-deleted order by its ID as a dictionary with its products,
+        or None if it does not exist.
+        """
+        stmt: Select = self.get_by_id_statement(object_id).with_only_columns(
+            *self.model.__table__.c
+        )
+        row: Optional[Any] = (await self.session.execute(stmt)).one_or_none()
+        if row is None:
+            return None
+        order: dict[str, Any] = dict(row._mapping)
+        order["products"] = await self.get_products(object_id, order["created_at"])
+        return order
 
-    async def get_by_id_by_current_user(
+    async def exists_by_id(self, object_id: int, user_id: Optional[int] = None) -> bool:
+        """
+        Checks whether a non-deleted order exists, optionally only among the user's.
+        """
+        stmt: Select = self.get_by_id_statement(object_id, user_id).with_only_columns(
+            self.model.id
+        )
+        return await self.session.scalar(stmt) is not None
+
+    def get_by_id_statement(
         self,
         object_id: int,
         user_id: Optional[int] = None,
-    ) -> Optional[T]:
+    ) -> Select:
         """
-        Retrieves an order by its ID, optionally filtered by the user ID.
-        Ensures that only non-deleted orders are fetched.
+        Builds the query for a non-deleted order by its ID, optionally filtered by the user ID.
         """
         conditions: list[Any] = []
         if user_id is not None:
@@ -67,21 +738,17 @@ class OrdersRepository(BaseRepository):
         conditions.append(self.model.id == object_id)
         conditions.append(self.model.is_deleted == False)
 
-        stmt: Select = (
-            select(self.model)
-            .where(*conditions)
-            .options(selectinload(self.model.products))
-        )
-        result: Result = await self.session.execute(stmt)
-        return result.scalar_one_or_none()
+        return select(self.model).where(*conditions)
 
-    async def get_by_filter_or_get_all(
+    def filter_conditions(
         self,
         filters: dict[str, Optional[Any]],
-    ) -> list[T]:
+        search_candidates: Optional[int] = None,
+    ) -> list[Any]:
         """
-        Retrieves orders based on the provided filters, or returns all non-deleted orders if no filters are given.
-        Supports filtering by status, price range, and user ID. Includes related products in the result.
+        Builds the conditions selecting non-deleted orders that match the filters:
+        status, price range, user ID, a list of order IDs, a creation time range and
+        a search of the customer and product names, see search_condition.
         """
         conditions: list[Any] = []
         if "status" in filters and filters["status"] is not None:
@@ -92,13 +759,426 @@ class OrdersRepository(BaseRepository):
             conditions.append(self.model.total_price <= filters["max_price"])
         if "user_id" in filters and filters["user_id"] is not None:
             conditions.append(self.model.user_id == filters["user_id"])
+        if "ids" in filters and filters["ids"] is not None:
+            conditions.append(self.model.id.in_(filters["ids"]))
+        # Time ranges also restrict partitioned tables to the matching partitions.
+        if "created_from" in filters and filters["created_from"] is not None:
+            conditions.append(self.model.created_at >= filters["created_from"])
+        if "created_to" in filters and filters["created_to"] is not None:
+            conditions.append(self.model.created_at < filters["created_to"])
+        if "q" in filters and filters["q"] is not None:
+            conditions.append(self.search_condition(filters["q"], search_candidates))
 
         conditions.append(self.model.is_deleted == False)
+        return conditions
+
+    @staticmethod
+    def like_pattern(value: str, prefix: str = "%", suffix: str = "%") -> str:
+        """
+        Returns a LIKE pattern matching the value literally, with its wildcards
+        escaped by "/", between the given prefix and suffix.
+        """
+        escaped: str = value.replace("/", "//").replace("%", "/%").replace("_", "/_")
+        return f"{prefix}{escaped}{suffix}"
+
+    def search_condition(self, q: str, candidates: Optional[int] = None) -> Any:
+        """
+        Builds the condition selecting the orders whose customer name, or the name
+        of one of their products, contains q, ignoring case. Each name is searched
+        on its own so that PostgreSQL answers both from their trigram indexes, and
+        the matching orders are then fetched by ID. ``candidates`` caps the matches
+        taken from each name, keeping the names most relevant to q, see search_rank,
+        so that the orders ranked afterwards do not grow with the number of matches.
+        """
+        from app.domain.models.product import Product
+        from app.domain.models.order_product import order_product_association_table
+
+        products_table = Product.__table__
+        lines_table = order_product_association_table
+        orders_table = self.model.__table__.alias("searched_orders")
+        pattern: str = self.like_pattern(q)
+        branches: list[Select] = [
+            select(orders_table.c.id).where(
+                orders_table.c.customer_name.ilike(pattern, escape="/"),
+                # Matches the condition of the partial trigram index.
+                orders_table.c.is_deleted == False,
+            ),
+            select(lines_table.c.order_id)
+            .join(products_table, products_table.c.id == lines_table.c.product_id)
+            .where(products_table.c.name.ilike(pattern, escape="/")),
+        ]
+        if candidates is not None:
+            names: list[Any] = [orders_table.c.customer_name, products_table.c.name]
+            # SQLite only accepts a LIMIT on a member of a UNION inside a subquery.
+            branches = [
+                select(
+                    *branch.order_by(
+                        self.search_rank(q, name).desc(), branch.selected_columns[0]
+                    )
+                    .limit(candidates)
+                    .subquery()
+                    .c
+                )
+                for branch, name in zip(branches, names)
+            ]
+        return self.model.id.in_(union(*branches))
+
+    def search_rank(self, q: str, name: Any = None) -> Any:
+        """
+        Builds the relevance of each order to the search q, from 0 to 1, judged on
+        its customer name, or on the given name column: the trigram word similarity
+        on PostgreSQL, and elsewhere whether the name equals q, starts with it, has
+        a word starting with it or only contains it. Orders matched by a product
+        name alone rank last.
+        """
+        if name is None:
+            name = self.model.customer_name
+        if self.session.bind.dialect.name == "postgresql":
+            return func.word_similarity(q, name, type_=Float)
+        return type_coerce(
+            case(
+                (func.lower(name) == func.lower(q), 1.0),
+                (name.ilike(self.like_pattern(q, prefix=""), escape="/"), 0.75),
+                (name.ilike(self.like_pattern(q, prefix="% "), escape="/"), 0.5),
+                (name.ilike(self.like_pattern(q), escape="/"), 0.25),
+                else_=0.0,
+            ),
+            Float,
+        )
+
+    def sort_column(self, filters: dict[str, Optional[Any]], order_by: str) -> Any:
+        """
+        Returns the sort key of the orders: a column, or the relevance to the search.
+        """
+        if order_by == "relevance":
+            return self.search_rank(filters["q"])
+        return getattr(self.model, order_by)
+
+    async def get_stats(
+        self,
+        filters: dict[str, Optional[Any]],
+        group_by: list[str],
+    ) -> list[dict[str, Any]]:
+        """
+        Aggregates the non-deleted orders matching the filters in the database:
+        count, sum, average, minimum and maximum of the total price per status,
+        and per day of creation and per user when requested in ``group_by``.
+        """
+        keys: list[Any] = [self.model.status]
+        if "day" in group_by:
+            keys.append(func.date(self.model.created_at).label("day"))
+        if "user" in group_by:
+            keys.append(self.model.user_id)
 
         stmt: Select = (
-            select(self.model)
+            select(
+                *keys,
+                func.count().label("count"),
+                func.sum(self.model.total_price).label("total"),
+                func.avg(self.model.total_price).label("avg"),
+                func.min(self.model.total_price).label("min"),
+                func.max(self.model.total_price).label("max"),
+            )
+            .where(*self.filter_conditions(filters))
+            .group_by(*keys)
+            .order_by(*keys)
+        )
+        result: Result = await self.session.execute(stmt)
+        return [dict(row._mapping) for row in result]
+
+    async def soft_delete_by_filter(
+        self,
+        filters: dict[str, Optional[Any]],
+    ) -> list[tuple[int, int]]:
+        """
+        Soft deletes every non-deleted order matching the filters in a single
+        UPDATE ... RETURNING statement. Returns the IDs and owners of the deleted orders.
+        """
+        stmt = (
+            update(self.model)
+            .where(*self.filter_conditions(filters))
+            .values(is_deleted=True)
+            .returning(
+                self.model.id,
+                self.model.user_id,
+                self.model.status,
+                self.model.total_price,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        try:
+            result: Result = await self.session.execute(stmt)
+            rows: list[Any] = result.all()
+            await self.update_summaries(
+                self.summary_deltas([row._mapping for row in rows], -1)
+            )
+            await self.session.commit()
+            deleted: list[tuple[int, int]] = [(row.id, row.user_id) for row in rows]
+        except Exception as e:
+            await self.session.rollback()
+            raise e
+        return deleted
+
+    async def archive_deleted(
+        self,
+        deleted_before: datetime,
+        batch_size: int,
+    ) -> tuple[int, int]:
+        """
+        Moves up to batch_size orders soft-deleted before deleted_before, along with
+        their lines, to the archive tables in one transaction. Orders locked by
+        another transaction are skipped rather than waited for, so that batches
+        never block the application. Returns the number of orders and lines moved.
+        """
+        from app.domain.models.order_archive import (
+            orders_archive_table,
+            order_product_association_archive_table,
+        )
+        from app.domain.models.order_product import order_product_association_table
+
+        lines = order_product_association_table
+        try:
+            # updated_at is set by the soft delete, and deleted orders are never updated again.
+            order_ids: list[int] = list(
+                await self.session.scalars(
+                    select(self.model.id)
+                    .where(
+                        self.model.is_deleted == True,
+                        self.model.updated_at < deleted_before,
+                    )
+                    .order_by(self.model.updated_at, self.model.id)
+                    .limit(batch_size)
+                    .with_for_update(skip_locked=True)
+                )
+            )
+            if not order_ids:
+                await self.session.commit()
+                return 0, 0
+            await self.session.execute(
+                insert(orders_archive_table).from_select(
+                    [
+                        "id",
+                        "user_id",
+                        "customer_name",
+                        "status",
+                        "total_price",
+                        "created_at",
+                        "deleted_at",
+                    ],
+                    select(
+                        self.model.id,
+                        self.model.user_id,
+                        self.model.customer_name,
+                        self.model.status,
+                        self.model.total_price,
+                        self.model.created_at,
+                        self.model.updated_at,
+                    ).where(self.model.id.in_(order_ids)),
+                )
+            )
+            await self.session.execute(
+                insert(order_product_association_archive_table).from_select(
+                    ["id", "order_id", "product_id", "quantity", "price", "created_at"],
+                    select(
+                        lines.c.id,
+                        lines.c.order_id,
+                        lines.c.product_id,
+                        lines.c.quantity,
+                        lines.c.price,
+                        lines.c.created_at,
+                    ).where(lines.c.order_id.in_(order_ids)),
+                )
+            )
+            result: Result = await self.session.execute(
+                delete(lines).where(lines.c.order_id.in_(order_ids))
+            )
+            moved_lines: int = result.rowcount
+            await self.session.execute(
+                delete(self.model)
+                .where(self.model.id.in_(order_ids))
+                .execution_options(synchronize_session=False)
+            )
+            await self.session.commit()
+        except Exception as e:
+            await self.session.rollback()
+            raise e
+        return len(order_ids), moved_lines
+
+    def filter_statement(
+        self,
+        filters: dict[str, Optional[Any]],
+        limit: Optional[int] = None,
+        order_by: str = "created_at",
+        after: Optional[tuple[Any, int]] = None,
+        columns: Optional[list[Any]] = None,
+        search_candidates: Optional[int] = None,
+    ) -> Select:
+        """
+        Builds the query for non-deleted orders matching the filters, sorted by
+        (order_by, id) descending. ``after`` is the keyset of the last order of the
+        previous page and ``limit`` bounds the page size. The query selects the
+        given columns, or whole orders by default. ``search_candidates`` caps the
+        matches of the search, see search_condition.
+        """
+        conditions: list[Any] = self.filter_conditions(filters, search_candidates)
+
+        sort_column: Any = self.sort_column(filters, order_by)
+        if after is not None:
+            value, last_id = after
+            conditions.append(
+                tuple_(sort_column, self.model.id)
+                < tuple_(literal(value, sort_column.type), literal(last_id))
+            )
+
+        stmt: Select = (
+            select(*columns if columns is not None else [self.model])
             .where(*conditions)
-            .options(selectinload(self.model.products))
+            .order_by(sort_column.desc(), self.model.id.desc())
         )
-        result: ScalarResult[T] = await self.session.scalars(stmt)
-        return result.all()
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        return stmt
+
+    def products_json_column(self) -> Any:
+        """
+        Builds a correlated subquery rendering the products of each order as a
+        JSON array, with json_agg on PostgreSQL and json_group_array elsewhere.
+        """
+        from app.domain.models.product import Product
+        from app.domain.models.order_product import order_product_association_table
+
+        products_table = Product.__table__
+        lines_table = order_product_association_table
+        price: Any = cast(lines_table.c.price, Float)
+        if self.session.bind.dialect.name == "postgresql":
+            product: Any = func.json_build_object(
+                "name",
+                products_table.c.name,
+                "price",
+                price,
+                "quantity",
+                lines_table.c.quantity,
+                "is_deleted",
+                products_table.c.is_deleted,
+                "id",
+                products_table.c.id,
+            )
+            products: Any = cast(
+                func.coalesce(
+                    func.json_agg(
+                        aggregate_order_by(
+                            product, products_table.c.id, lines_table.c.id
+                        )
+                    ),
+                    text("'[]'::json"),
+                ),
+                Text,
+            )
+        else:
+            product = func.json_object(
+                "name",
+                products_table.c.name,
+                "price",
+                price,
+                "quantity",
+                lines_table.c.quantity,
+                "is_deleted",
+                case(
+                    (products_table.c.is_deleted, func.json("true")),
+                    else_=func.json("false"),
+                ),
+                "id",
+                products_table.c.id,
+            )
+            products = func.json_group_array(product)
+
+        return (
+            select(products)
+            .select_from(
+                products_table.join(
+                    lines_table,
+                    lines_table.c.product_id == products_table.c.id,
+                )
+            )
+            .where(
+                lines_table.c.order_id == self.model.id,
+                # Lets PostgreSQL prune the partitions of the lines.
+                lines_table.c.created_at == self.model.created_at,
+            )
+            .scalar_subquery()
+        )
+
+    async def get_rows_by_filter(
+        self,
+        filters: dict[str, Optional[Any]],
+        limit: Optional[int] = None,
+        order_by: str = "created_at",
+        after: Optional[tuple[Any, int]] = None,
+        search_candidates: Optional[int] = None,
+    ) -> list["OrderRow"]:
+        """
+        Retrieves the orders matching the filters, or every non-deleted order if no
+        filters are given, sorted by (order_by, id) descending. ``after`` is the
+        keyset of the last order of the previous page and ``limit`` bounds the page
+        size. Only the columns of the response are selected, with the products
+        already rendered as JSON by the database, and rows are returned as plain
+        tuples, without ORM objects or identity map tracking.
+        Sorted by relevance, the rows also carry it, for the cursor of the next page.
+        ``search_candidates`` caps the matches of the search, see search_condition.
+        """
+        from app.domain.schemas.order import OrderRow
+
+        columns: list[Any] = self.row_columns()
+        if order_by == "relevance":
+            columns.append(self.sort_column(filters, order_by))
+        stmt: Select = self.filter_statement(
+            filters,
+            limit,
+            order_by,
+            after,
+            columns=columns,
+            search_candidates=search_candidates,
+        )
+        result: Result = await self.session.execute(stmt)
+        return [OrderRow(*row) for row in result]
+
+    def row_columns(self) -> list[Any]:
+        """
+        Returns the columns of an OrderRow, in its field order.
+        """
+        return [
+            self.model.id,
+            self.model.user_id,
+            self.model.customer_name,
+            self.model.status,
+            self.model.total_price,
+            self.model.is_deleted,
+            self.model.created_at,
+            self.products_json_column(),
+        ]
+
+    async def stream_rows_by_filter(
+        self,
+        filters: dict[str, Optional[Any]],
+        batch_size: int,
+    ) -> AsyncIterator[list["OrderRow"]]:
+        """
+        Streams every non-deleted order matching the filters as OrderRow batches of
+        up to batch_size rows, sorted by ID. Rows are fetched from a server-side
+        cursor as the batches are consumed, so memory does not grow with the
+        number of orders.
+        """
+        from app.domain.schemas.order import OrderRow
+
+        stmt: Select = (
+            select(*self.row_columns())
+            .where(*self.filter_conditions(filters))
+            .order_by(self.model.id)
+            .execution_options(yield_per=batch_size)
+        )
+        result: Any = await self.session.stream(stmt)
+        try:
+            async for partition in result.partitions():
+                yield [OrderRow(*row) for row in partition]
+        finally:
+            await result.close()
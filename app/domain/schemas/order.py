@@ -1,4 +1,7 @@
-from typing import Optional
+import decimal
+import json
+from datetime import datetime, timezone
+from typing import NamedTuple, Optional
 
 from fastapi import HTTPException
 from starlette.status import HTTP_400_BAD_REQUEST
@@ -7,6 +10,7 @@ from .abstract import AbstractReadSchemas, AbstractWriteUpdateSchemas
 from .product import ProductRead, ProductWrite
 from pydantic import field_validator
 
+from app.core.config import settings
 from app.domain.models.order import StatusEnum
 
 
@@ -61,6 +65,49 @@ class OrderWrite(OrderBase):
         return value
 
 
+class OrderImport(OrderWrite):
+    """
+    Schema for an order loaded by the import command on behalf of a user,
+    possibly created in the past.
+    """
+
+    user_id: int
+    created_at: Optional[datetime] = None
+
+    @field_validator("created_at")
+    def validate_created_at(cls, value: Optional[datetime]) -> Optional[datetime]:
+        # Creation times are stored as naive UTC.
+        if value is not None and value.tzinfo is not None:
+            return value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
+
+
+class OrderBulkWrite(AbstractWriteUpdateSchemas):
+    """
+    Schema for creating a batch of orders at once.
+    """
+
+    orders: list[OrderWrite]
+
+    @field_validator("orders")
+    def validate_orders(cls, value: list[OrderWrite]) -> list[OrderWrite]:
+        if len(value) == 0:
+            raise HTTPException(
+                status_code=HTTP_400_BAD_REQUEST,
+                detail={"orders": "orders must not be empty", "code": "null"},
+            )
+        if len(value) > settings.ORDERS_BULK_MAX_SIZE:
+            raise HTTPException(
+                status_code=HTTP_400_BAD_REQUEST,
+                detail={
+                    "orders": f"At most {settings.ORDERS_BULK_MAX_SIZE} orders "
+                    f"can be created at once.",
+                    "code": "too_many",
+                },
+            )
+        return value
+
+
 class OrderUpdate(OrderBase):
     """
     Schema for updating an order with optional fields and nested product updates.
@@ -69,3 +116,123 @@ class OrderUpdate(OrderBase):
     user_id: Optional[int] = None
     customer_name: Optional[str] = None
     status: Optional[str] = None
+
+
+class OrderPage(AbstractWriteUpdateSchemas):
+    """
+    Schema for a page of orders with the cursor of the next page, if any.
+    """
+
+    items: list[OrderRead]
+    next_cursor: Optional[str] = None
+
+
+class OrderStatsGroup(AbstractWriteUpdateSchemas):
+    """
+    Schema for the statistics of one group of orders: a status, optionally per
+    day and per user, with the count and the total price aggregates.
+    """
+
+    status: str
+    day: Optional[str] = None
+    user_id: Optional[int] = None
+    count: int
+    total: float
+    avg: float
+    min: float
+    max: float
+
+
+class OrderStats(AbstractWriteUpdateSchemas):
+    """
+    Schema for the order statistics grouped by status, and optionally by day and user.
+    """
+
+    items: list[OrderStatsGroup]
+
+
+class UserOrderSummaryGroup(AbstractWriteUpdateSchemas):
+    """
+    Schema for the number and total price of a user's orders with one status.
+    """
+
+    status: str
+    count: int
+    total: float
+
+
+class UserOrderSummary(AbstractWriteUpdateSchemas):
+    """
+    Schema for the summary of a user's orders per status.
+    """
+
+    user_id: int
+    items: list[UserOrderSummaryGroup]
+
+
+# Columns of the CSV order files, with one row per order line. Consecutive rows
+# with the same order_ref belong to the same order.
+ORDER_CSV_COLUMNS: tuple[str, ...] = (
+    "order_ref",
+    "user_id",
+    "customer_name",
+    "status",
+    "created_at",
+    "product_id",
+    "product_name",
+    "price",
+    "quantity",
+)
+
+
+class OrderRow(NamedTuple):
+    """
+    Lightweight read-only order row with its products already rendered as a JSON
+    array, serialized to the OrderRead JSON without validation.
+    """
+
+    id: int
+    user_id: int
+    customer_name: str
+    status: StatusEnum
+    total_price: decimal.Decimal
+    is_deleted: bool
+    created_at: datetime
+    products: str
+    # Relevance to the search, selected only when sorting by it.
+    relevance: Optional[float] = None
+
+    def to_json(self) -> str:
+        body: str = json.dumps(
+            {
+                "customer_name": self.customer_name,
+                "status": self.status.value,
+                "is_deleted": self.is_deleted,
+                "id": self.id,
+                "user_id": self.user_id,
+                "total_price": float(self.total_price),
+            },
+            ensure_ascii=False,
+            allow_nan=False,
+            separators=(",", ":"),
+        )
+        return f'{body[:-1]},"products":{self.products}}}'
+
+    def to_csv_rows(self) -> list[tuple]:
+        """
+        Returns a row of ORDER_CSV_COLUMNS per product, referencing the order by its ID.
+        """
+        return [
+            (
+                self.id,
+                self.user_id,
+                self.customer_name,
+                self.status.value,
+                self.created_at.isoformat(),
+                product["id"],
+                product["name"],
+                product["price"],
+                product["quantity"],
+            )
+            for product in json.loads(self.products)
+        ]
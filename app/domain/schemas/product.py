@@ -1,5 +1,5 @@
 import decimal
-from pydantic import field_validator
+from pydantic import field_validator, model_validator
 from typing import Optional
 from fastapi import HTTPException
 from starlette.status import HTTP_400_BAD_REQUEST
@@ -27,9 +27,26 @@ class ProductRead(AbstractReadSchemas, ProductBase):
 
 class ProductWrite(ProductBase):
     """
-    Schema for creating or writing product data.
+    Schema for an order line: the catalog product referenced by id or by name,
+    with the ordered quantity and unit price. A product named for the first time
+    is added to the catalog.
     """
 
+    id: Optional[int] = None
+    name: Optional[str] = None
+
+    @model_validator(mode="after")
+    def validate_reference(self) -> "ProductWrite":
+        if self.id is None and not self.name:
+            raise HTTPException(
+                status_code=HTTP_400_BAD_REQUEST,
+                detail={
+                    "products": "Each product must have an id or a name.",
+                    "code": "null",
+                },
+            )
+        return self
+
     @field_validator("quantity")
     def validate_quantity(cls, value: int) -> int:
         if value <= 0:
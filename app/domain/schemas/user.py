@@ -1,4 +1,5 @@
 from fastapi_users import schemas
+from pydantic import ConfigDict
 
 
 class UserRead(schemas.BaseUser[int]):
@@ -9,6 +10,25 @@ class UserRead(schemas.BaseUser[int]):
     role: str
 
 
+class AuthenticatedUser(schemas.BaseUser[int]):
+    """
+    Read-only user resolved from the auth cache or a JWT. It has no password hash
+    and is not bound to a session, so changes go through a User reloaded from
+    the database.
+    """
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+    is_deleted: bool = False
+
+    @property
+    def role(self) -> str:
+        """
+        Returns the user's role as 'admin' if superuser, otherwise 'user'.
+        """
+        return "admin" if self.is_superuser else "user"
+
+
 class UserCreate(schemas.BaseUserCreate):
     """
     Schema for creating a new user with default fields from BaseUserCreate.
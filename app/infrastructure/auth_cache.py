@@ -0,0 +1,210 @@
+import hashlib
+import json
+import time
+from typing import TYPE_CHECKING, Any, Optional
+
+from redis.exceptions import WatchError
+
+from app.core.config import settings
+from app.domain.schemas.user import AuthenticatedUser
+from app.infrastructure.local_cache import LocalCache
+
+if TYPE_CHECKING:
+    from aioredis import Redis
+    from app.domain.models.auth import User
+
+# User fields needed to authorize a request; the password hash is never cached.
+CACHED_USER_FIELDS: tuple[str, ...] = (
+    "id",
+    "email",
+    "is_active",
+    "is_superuser",
+    "is_verified",
+    "is_deleted",
+)
+
+# Per-worker tier in front of Redis, enabled by AUTH_LOCAL_CACHE_ENABLED.
+auth_local_cache: Optional[LocalCache] = (
+    LocalCache(
+        ttl_seconds=settings.AUTH_LOCAL_CACHE_TTL_SECONDS,
+        max_entries=settings.AUTH_LOCAL_CACHE_MAX_ENTRIES,
+        max_bytes=settings.AUTH_LOCAL_CACHE_MAX_ENTRIES * 1024,
+    )
+    if settings.AUTH_LOCAL_CACHE_ENABLED
+    else None
+)
+
+
+def token_cache_key(token: str) -> str:
+    """
+    Keys are derived from a hash of the token, so Redis never holds usable tokens.
+    """
+    digest: str = hashlib.sha256(token.encode("utf-8")).hexdigest()
+    return f"{settings.CACHE_KEY_PREFIX}:auth:token:{digest}"
+
+
+def user_tokens_key(user_id: int) -> str:
+    return f"{settings.CACHE_KEY_PREFIX}:auth:user:{user_id}:tokens"
+
+
+def user_generation_key(user_id: int) -> str:
+    return f"{settings.CACHE_KEY_PREFIX}:auth:user:{user_id}:gen"
+
+
+def user_revoked_key(user_id: int) -> str:
+    return f"{settings.CACHE_KEY_PREFIX}:auth:user:{user_id}:revoked_at"
+
+
+def revoked_token_key(token_id: str) -> str:
+    return f"{settings.CACHE_KEY_PREFIX}:auth:revoked:{token_id}"
+
+
+def user_claims(user: "User") -> dict[str, Any]:
+    return {field: getattr(user, field) for field in CACHED_USER_FIELDS}
+
+
+def build_user(claims: dict[str, Any]) -> AuthenticatedUser:
+    """
+    Builds the read-only user from cached fields or token claims.
+    """
+    return AuthenticatedUser.model_validate(
+        {field: claims[field] for field in CACHED_USER_FIELDS}
+    )
+
+
+def dump_user(user: "User") -> str:
+    return json.dumps(user_claims(user))
+
+
+def load_user(value: bytes | str) -> AuthenticatedUser:
+    return build_user(json.loads(value))
+
+
+async def get_user_generation(redis: "Redis", user_id: int) -> Optional[Any]:
+    """
+    Returns the generation of the user, bumped by invalidate_user. Read it before
+    loading the user to cache, see cache_user_token.
+    """
+    return await redis.get(user_generation_key(user_id))
+
+
+async def cache_user_token(
+    redis: "Redis",
+    token: str,
+    user: "User",
+    ttl_seconds: int,
+    generation: Optional[Any],
+) -> bool:
+    """
+    Caches the user resolved from the token and remembers the token key under the
+    user, so that every token of a user can be dropped when the user changes.
+    The user is only cached if it has not been invalidated since its generation
+    was read, so that a load racing a change does not put back the old user.
+    Returns whether the user was cached.
+    """
+    if ttl_seconds <= 0:
+        return False
+    key: str = token_cache_key(token)
+    tokens_key: str = user_tokens_key(user.id)
+    generation_key: str = user_generation_key(user.id)
+    async with redis.pipeline(transaction=True) as pipe:
+        try:
+            await pipe.watch(generation_key)
+            if await pipe.get(generation_key) != generation:
+                return False
+            pipe.multi()
+            pipe.set(key, dump_user(user), ex=ttl_seconds)
+            pipe.sadd(tokens_key, key)
+            pipe.expire(tokens_key, settings.AUTH_CACHE_TTL_SECONDS)
+            await pipe.execute()
+            return True
+        except WatchError:
+            return False
+
+
+async def get_cached_user(redis: "Redis", token: str) -> Optional[AuthenticatedUser]:
+    """
+    Returns the user cached for the token, checking the local tier first.
+    """
+    key: str = token_cache_key(token)
+    if auth_local_cache is not None and (value := auth_local_cache.get(key)):
+        return load_user(value)
+
+    invalidations: Optional[int] = (
+        auth_local_cache.invalidations if auth_local_cache is not None else None
+    )
+    value: Optional[Any] = await redis.get(key)
+    if value is None:
+        return None
+    if auth_local_cache is not None:
+        auth_local_cache.set(key, value, len(value), invalidations)
+    return load_user(value)
+
+
+async def invalidate_token(redis: "Redis", token: str) -> None:
+    """
+    Drops the cached user of a single token, e.g. on logout.
+    """
+    await invalidate_keys(redis, [token_cache_key(token)])
+
+
+async def invalidate_user(redis: "Redis", user_id: int) -> None:
+    """
+    Drops the cached user of every token issued to the user and records the
+    time, so that JWTs issued before it are rejected. The generation is bumped
+    before the tokens are listed, so that a token cached in between is either
+    listed or not cached at all.
+    """
+    tokens_key: str = user_tokens_key(user_id)
+    generation_key: str = user_generation_key(user_id)
+    async with redis.pipeline(transaction=True) as pipe:
+        pipe.incr(generation_key)
+        pipe.expire(generation_key, settings.AUTH_CACHE_TTL_SECONDS)
+        pipe.set(user_revoked_key(user_id), time.time(), ex=settings.LIFE_TIME_SECONDS)
+        pipe.smembers(tokens_key)
+        members: set[Any] = (await pipe.execute())[-1]
+    keys: list[Any] = [
+        key.decode() if isinstance(key, bytes) else key for key in members
+    ]
+    await invalidate_keys(redis, keys + [tokens_key])
+
+
+async def revoke_token(redis: "Redis", token_id: str, expires_at: float) -> None:
+    """
+    Adds a JWT to the deny-list until it would have expired anyway.
+    """
+    ttl_seconds: int = int(expires_at - time.time()) + 1
+    if ttl_seconds > 0:
+        await redis.set(revoked_token_key(token_id), 1, ex=ttl_seconds)
+
+
+async def is_token_revoked(
+    redis: "Redis",
+    token_id: str,
+    user_id: int,
+    issued_at: float,
+) -> bool:
+    """
+    Checks the token deny-list and the user's revocation time in one round trip.
+    """
+    revoked, revoked_at = await redis.mget(
+        revoked_token_key(token_id), user_revoked_key(user_id)
+    )
+    return revoked is not None or (
+        revoked_at is not None and issued_at <= float(revoked_at)
+    )
+
+
+async def invalidate_keys(redis: "Redis", keys: list[str]) -> None:
+    """
+    Unlinks the keys and asks every worker to drop them from its local tier.
+    """
+    if not keys:
+        return
+    async with redis.pipeline(transaction=True) as pipe:
+        pipe.unlink(*keys)
+        if auth_local_cache is not None:
+            for key in keys:
+                auth_local_cache.delete(key)
+                pipe.publish(settings.CACHE_INVALIDATION_CHANNEL, key)
+        await pipe.execute()
@@ -1,23 +1,272 @@
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, AsyncEngine, async_sessionmaker
-from sqlalchemy.orm import DeclarativeBase
+import asyncio
+import itertools
+import logging
+import time
+from contextlib import asynccontextmanager
+from logging.config import dictConfig
+from typing import Any, AsyncIterator, Optional
+from uuid import uuid4
+
+from sqlalchemy import URL, Engine, make_url, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    create_async_engine,
+    AsyncEngine,
+    async_sessionmaker,
+    AsyncConnection,
+)
+from sqlalchemy.orm import DeclarativeBase, Session
+from sqlalchemy.pool import NullPool, QueuePool
 from typing_extensions import AsyncGenerator
 
 from app.core.config import settings
+from app.core.logger import LoggerConfig
+
+dictConfig(LoggerConfig().model_dump())
+logger: logging = logging.getLogger("digital_travel_concierge")
 
 
 class Base(DeclarativeBase):
     pass
 
 
+# Engine defaults per deployment, overridden by any DB_* setting that is set explicitly.
+#
+# "direct": the application connects straight to Postgres. Connections are pooled
+# in-process, checked before use, recycled periodically, and asyncpg caches
+# prepared statements per connection.
+#
+# "transaction_pooler": the application connects through PgBouncer (or a similar
+# pooler) in transaction mode. The pooler owns the connections, so SQLAlchemy uses
+# NullPool. Prepared statement caches are disabled because consecutive transactions
+# may run on different server connections. Startup parameters such as
+# statement_timeout are not sent because poolers reject them; set them on the
+# database role instead.
+DB_POOL_PRESETS: dict[str, dict[str, Any]] = {
+    "direct": {
+        "DB_USE_NULL_POOL": False,
+        "DB_POOL_SIZE": 10,
+        "DB_MAX_OVERFLOW": 10,
+        "DB_POOL_TIMEOUT": 30.0,
+        "DB_POOL_RECYCLE": 1800,
+        "DB_POOL_PRE_PING": True,
+        "DB_POOL_WARMUP_CONNECTIONS": 2,
+        "DB_STATEMENT_CACHE_SIZE": 100,
+        "DB_STATEMENT_TIMEOUT_MS": 30_000,
+    },
+    "transaction_pooler": {
+        "DB_USE_NULL_POOL": True,
+        "DB_POOL_SIZE": 0,
+        "DB_MAX_OVERFLOW": 0,
+        "DB_POOL_TIMEOUT": 30.0,
+        "DB_POOL_RECYCLE": -1,
+        "DB_POOL_PRE_PING": False,
+        "DB_POOL_WARMUP_CONNECTIONS": 0,
+        "DB_STATEMENT_CACHE_SIZE": 0,
+        "DB_STATEMENT_TIMEOUT_MS": None,
+    },
+}
+
+
+def engine_setting(name: str) -> Any:
+    """
+    Returns the explicitly configured value of a DB_* setting, or the preset default.
+    """
+    value: Optional[Any] = getattr(settings, name)
+    if value is None:
+        return DB_POOL_PRESETS[settings.DB_POOL_PRESET][name]
+    return value
+
+
+def engine_options(url: str | URL = settings.DB_URL) -> dict[str, Any]:
+    """
+    Builds the create_async_engine keyword arguments for the URL from the settings.
+    The pool sizing and connection arguments only apply to asyncpg, engines of other
+    drivers (such as SQLite replicas in development) keep their dialect's pool.
+    """
+    options: dict[str, Any] = {
+        "pool_pre_ping": engine_setting("DB_POOL_PRE_PING"),
+    }
+    if engine_setting("DB_USE_NULL_POOL"):
+        options["poolclass"] = NullPool
+    if make_url(url).get_driver_name() != "asyncpg":
+        return options
+
+    statement_cache_size: int = engine_setting("DB_STATEMENT_CACHE_SIZE")
+    connect_args: dict[str, Any] = {
+        # asyncpg's own statement cache and SQLAlchemy's cache on top of it.
+        "statement_cache_size": statement_cache_size,
+        "prepared_statement_cache_size": statement_cache_size,
+    }
+    if statement_cache_size == 0:
+        # Unique names cannot collide with statements left on a server connection by another client.
+        connect_args["prepared_statement_name_func"] = lambda: f"__asyncpg_{uuid4()}__"
+
+    server_settings: dict[str, str] = {}
+    if settings.DB_POOL_PRESET != "transaction_pooler":
+        server_settings["application_name"] = settings.DB_APPLICATION_NAME
+    statement_timeout_ms: Optional[int] = engine_setting("DB_STATEMENT_TIMEOUT_MS")
+    if statement_timeout_ms:
+        server_settings["statement_timeout"] = str(statement_timeout_ms)
+    if server_settings:
+        connect_args["server_settings"] = server_settings
+
+    options["connect_args"] = connect_args
+    if "poolclass" not in options:
+        options.update(
+            pool_size=engine_setting("DB_POOL_SIZE"),
+            max_overflow=engine_setting("DB_MAX_OVERFLOW"),
+            pool_timeout=engine_setting("DB_POOL_TIMEOUT"),
+            pool_recycle=engine_setting("DB_POOL_RECYCLE"),
+        )
+    return options
+
+
 # Create an asynchronous engine for the database connection
 engine: AsyncEngine = create_async_engine(
-    url=settings.DB_URL
+    url=settings.DB_URL,
+    **engine_options(settings.DB_URL),
 )
 
 # Create an asynchronous session maker
 async_session_maker = async_sessionmaker(engine, expire_on_commit=False)
 
 
+class RoutingSession(Session):
+    """
+    Session bound to the primary that sends plain SELECTs to the replica engine set
+    in ``info["replica"]``. Once the session writes, locks rows or is pinned with
+    ``info["use_primary"]``, every following statement goes to the primary so
+    that it reads its own writes.
+    """
+
+    def get_bind(self, mapper: Any = None, *, clause: Any = None, **kw: Any) -> Any:
+        replica: Optional[Engine] = self.info.get("replica")
+        if replica is None or self.info.get("use_primary"):
+            return super().get_bind(mapper, clause=clause, **kw)
+        if (
+            self._flushing
+            or clause is None
+            or not clause.is_select
+            or getattr(clause, "_for_update_arg", None) is not None
+        ):
+            self.info["use_primary"] = True
+            return super().get_bind(mapper, clause=clause, **kw)
+        return replica
+
+
+def create_replica_engines() -> list[AsyncEngine]:
+    """
+    Creates an engine for each URL of DB_REPLICA_URLS, tuned like the primary.
+    """
+    return [
+        create_async_engine(url=url, **engine_options(url))
+        for url in settings.DB_REPLICA_URLS
+    ]
+
+
+# Read replicas from DB_REPLICA_URLS.
+replica_engines: list[AsyncEngine] = create_replica_engines()
+replica_cycle: Any = itertools.cycle(replica_engines)
+# Replication lag of each replica and when it was measured.
+replica_lags: dict[AsyncEngine, tuple[float, float]] = {}
+
+# Session maker for read-only endpoints, see get_read_session.
+read_session_maker = async_sessionmaker(
+    engine, expire_on_commit=False, sync_session_class=RoutingSession
+)
+
+
+async def measure_replica_lag(replica: AsyncEngine) -> float:
+    """
+    Returns how many seconds the replica is behind the primary. A replica that has
+    replayed everything it received is considered up to date even if the primary
+    has been idle. Other dialects have no replication and report no lag.
+    """
+    if replica.dialect.name != "postgresql":
+        return 0.0
+    async with replica.connect() as connection:
+        lag: Optional[float] = await connection.scalar(
+            text(
+                "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() "
+                "THEN 0 ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END"
+            )
+        )
+    return float(lag or 0.0)
+
+
+async def replica_lag(replica: AsyncEngine) -> float:
+    """
+    Returns the replica's lag, measured at most once per
+    DB_REPLICA_LAG_CHECK_INTERVAL_SECONDS. Unreachable replicas have infinite lag.
+    """
+    now: float = time.monotonic()
+    measured: Optional[tuple[float, float]] = replica_lags.get(replica)
+    if (
+        measured is not None
+        and now - measured[0] < settings.DB_REPLICA_LAG_CHECK_INTERVAL_SECONDS
+    ):
+        return measured[1]
+    try:
+        lag: float = await measure_replica_lag(replica)
+    except (SQLAlchemyError, OSError) as e:
+        logger.warning("Replica %s is unavailable: %s", replica.url.host, e)
+        lag = float("inf")
+    replica_lags[replica] = (now, lag)
+    return lag
+
+
+async def pick_replica() -> Optional[AsyncEngine]:
+    """
+    Returns the next replica, round robin, whose lag is within
+    DB_REPLICA_MAX_LAG_SECONDS, or None to read from the primary.
+    """
+    for _ in range(len(replica_engines)):
+        replica: AsyncEngine = next(replica_cycle)
+        if await replica_lag(replica) <= settings.DB_REPLICA_MAX_LAG_SECONDS:
+            return replica
+    return None
+
+
+async def warm_up_engine(
+    db_engine: AsyncEngine = engine,
+    connections: Optional[int] = None,
+) -> int:
+    """
+    Opens the given number of pool connections at once (DB_POOL_WARMUP_CONNECTIONS by
+    default) and returns them to the pool, so that the first requests do not pay the
+    connect latency. Failures are logged and do not prevent startup.
+    Returns the number of connections opened.
+    """
+    if connections is None:
+        connections = engine_setting("DB_POOL_WARMUP_CONNECTIONS")
+    if not isinstance(db_engine.pool, QueuePool) or connections <= 0:
+        return 0
+    connections = min(connections, db_engine.pool.size())
+
+    opened: list[AsyncConnection] = []
+
+    async def connect() -> None:
+        connection: AsyncConnection = await db_engine.connect()
+        opened.append(connection)
+        await connection.execute(text("SELECT 1"))
+
+    results: list[Any] = await asyncio.gather(
+        *(connect() for _ in range(connections)),
+        return_exceptions=True,
+    )
+    for connection in opened:
+        await connection.close()
+    for result in results:
+        if isinstance(result, (SQLAlchemyError, OSError)):
+            logger.warning("Database pool warm-up failed: %s", result)
+            break
+        if isinstance(result, BaseException):
+            raise result
+    return len(opened)
+
+
 async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency function to provide an asynchronous SQLAlchemy session.
@@ -25,3 +274,33 @@ async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
     """
     async with async_session_maker() as session:
         yield session
+
+
+@asynccontextmanager
+async def read_session() -> AsyncIterator[AsyncSession]:
+    """
+    Opens a session for reading. Its queries go to a sufficiently fresh read replica
+    when one is configured, and to the primary after the first write or once pinned
+    with use_primary.
+    """
+    replica: Optional[AsyncEngine] = await pick_replica()
+    info: dict[str, Any] = {}
+    if replica is not None:
+        info["replica"] = replica.sync_engine
+    async with read_session_maker(info=info) as session:
+        yield session
+
+
+async def get_read_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency function to provide a session for read-only endpoints, see read_session.
+    """
+    async with read_session() as session:
+        yield session
+
+
+def use_primary(session: AsyncSession) -> None:
+    """
+    Sends every following query of the session to the primary.
+    """
+    session.info["use_primary"] = True
@@ -0,0 +1,138 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from logging.config import dictConfig
+from typing import TYPE_CHECKING, Any, Optional
+
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.logger import LoggerConfig
+
+if TYPE_CHECKING:
+    from aioredis import Redis
+
+dictConfig(LoggerConfig().model_dump())
+logger: logging = logging.getLogger("digital_travel_concierge")
+
+
+class LocalCache:
+    """
+    In-process LRU cache with a per-entry TTL, bounded both by the number of
+    entries and by the total size of the stored values.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int, max_bytes: int) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size_bytes: int = 0
+        # Incremented on every invalidation, see ``set``.
+        self.invalidations: int = 0
+        self._entries: OrderedDict[str, tuple[float, int, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Returns the value stored under the key, or None if it is missing or expired.
+        """
+        entry: Optional[tuple[float, int, Any]] = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, _, value = entry
+        if expires_at < time.monotonic():
+            self._pop(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        size: int,
+        token: Optional[int] = None,
+    ) -> None:
+        """
+        Stores the value and evicts the least recently used entries over the limits.
+        When a token taken from ``invalidations`` before reading the value is given,
+        the value is dropped if any invalidation arrived in the meantime.
+        """
+        if token is not None and token != self.invalidations:
+            return
+        if size > self.max_bytes:
+            return
+        self._pop(key)
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, size, value)
+        self.size_bytes += size
+        while len(self._entries) > self.max_entries or self.size_bytes > self.max_bytes:
+            self._pop(next(iter(self._entries)))
+
+    def delete(self, key: str) -> None:
+        """
+        Removes the key from the cache.
+        """
+        self.invalidations += 1
+        self._pop(key)
+
+    def clear(self) -> None:
+        """
+        Removes every entry from the cache.
+        """
+        self.invalidations += 1
+        self._entries.clear()
+        self.size_bytes = 0
+
+    def _pop(self, key: str) -> None:
+        entry: Optional[tuple[float, int, Any]] = self._entries.pop(key, None)
+        if entry is not None:
+            self.size_bytes -= entry[1]
+
+
+async def listen_for_invalidations(
+    redis_client: "Redis",
+    channel: str,
+    caches: list[LocalCache],
+) -> None:
+    """
+    Drops local entries whose keys are published on the invalidation channel by
+    any worker. The caches are cleared whenever the subscription is (re)established,
+    because invalidations may have been missed while it was down.
+    """
+    while True:
+        try:
+            async with redis_client.pubsub() as pubsub:
+                await pubsub.subscribe(channel)
+                for cache in caches:
+                    cache.clear()
+                while True:
+                    message: Optional[dict[str, Any]] = await pubsub.get_message(
+                        ignore_subscribe_messages=True,
+                        timeout=1.0,
+                    )
+                    if message is None:
+                        continue
+                    key: Any = message["data"]
+                    key = key.decode() if isinstance(key, bytes) else key
+                    for cache in caches:
+                        cache.delete(key)
+        except RedisError as e:
+            logger.warning("Invalidation listener disconnected: %s", e)
+            for cache in caches:
+                cache.clear()
+            await asyncio.sleep(1)
+
+
+# Per-worker cache in front of Redis, enabled by ORDER_LOCAL_CACHE_ENABLED.
+order_local_cache: Optional[LocalCache] = (
+    LocalCache(
+        ttl_seconds=settings.ORDER_LOCAL_CACHE_TTL_SECONDS,
+        max_entries=settings.ORDER_LOCAL_CACHE_MAX_ENTRIES,
+        max_bytes=settings.ORDER_LOCAL_CACHE_MAX_BYTES,
+    )
+    if settings.ORDER_LOCAL_CACHE_ENABLED
+    else None
+)
@@ -0,0 +1,141 @@
+import asyncio
+import logging
+from datetime import date, datetime, timezone
+from logging.config import dictConfig
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from app.core.config import settings
+from app.core.logger import LoggerConfig
+
+dictConfig(LoggerConfig().model_dump())
+logger: logging = logging.getLogger("digital_travel_concierge")
+
+# Tables partitioned by created_at month when ORDERS_PARTITIONING is enabled.
+PARTITIONED_TABLES: tuple[str, ...] = ("orders", "order_product_association")
+
+
+def orders_partitioned(dialect_name: str) -> bool:
+    """
+    Returns whether the migrations partition the orders, which only happens on
+    PostgreSQL with ORDERS_PARTITIONING enabled. Decided from the settings rather
+    than the catalog, so that offline migrations render the same statements.
+    """
+    return dialect_name == "postgresql" and settings.ORDERS_PARTITIONING
+
+
+def add_months(day: date, months: int) -> date:
+    """
+    Returns the first day of the month that is the given number of months after the day's month.
+    """
+    month_index: int = day.year * 12 + day.month - 1 + months
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+
+def partition_statement(table: str, start: date) -> str:
+    """
+    Builds the statement creating the partition of the table for the month starting
+    at start, unless it exists.
+    """
+    end: date = add_months(start, 1)
+    return (
+        f"CREATE TABLE IF NOT EXISTS {table}_p{start:%Y%m} PARTITION OF {table} "
+        f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+    )
+
+
+def partition_statements(table: str, first_month: date, months: int) -> list[str]:
+    """
+    Builds the statements creating the monthly partitions of the table for the
+    given number of months from first_month, skipping the existing ones.
+    """
+    return [
+        partition_statement(table, add_months(first_month, offset))
+        for offset in range(months)
+    ]
+
+
+async def create_partition(connection: AsyncConnection, table: str, start: date) -> int:
+    """
+    Creates the partition of the table for the month starting at start, unless it
+    exists. PostgreSQL refuses to create it while the default partition holds rows
+    of that month, which happens when they are written before the partition is
+    created, e.g. imported orders dated months ahead. Those rows are then moved
+    into the new partition: the default partition is detached, the rows copied
+    through the partitioned table and deleted, and the default partition attached
+    again, all in the caller's transaction. Returns the number of statements
+    executed.
+    """
+    in_month: str = (
+        f"created_at >= '{start.isoformat()}' "
+        f"AND created_at < '{add_months(start, 1).isoformat()}'"
+    )
+    stranded: bool = bool(
+        await connection.scalar(
+            text(f"SELECT EXISTS (SELECT 1 FROM {table}_default WHERE {in_month})")
+        )
+    )
+    statements: list[str] = [partition_statement(table, start)]
+    if stranded:
+        statements = [
+            f"ALTER TABLE {table} DETACH PARTITION {table}_default",
+            *statements,
+            f"INSERT INTO {table} SELECT * FROM {table}_default WHERE {in_month}",
+            f"DELETE FROM {table}_default WHERE {in_month}",
+            f"ALTER TABLE {table} ATTACH PARTITION {table}_default DEFAULT",
+        ]
+        logger.info("Moving %s rows of %s out of the default partition", table, start)
+    for statement in statements:
+        await connection.execute(text(statement))
+    return len(statements)
+
+
+async def create_order_partitions(
+    db_engine: AsyncEngine,
+    months_ahead: int = settings.ORDERS_PARTITIONS_AHEAD_MONTHS,
+) -> int:
+    """
+    Creates the missing partitions of the orders and their lines for the
+    months_ahead months after the current one, moving the rows already written to
+    the default partition for those months into them, see create_partition. Does
+    nothing unless the tables are partitioned, which only happens on PostgreSQL.
+    Returns the number of statements executed.
+    """
+    if db_engine.dialect.name != "postgresql":
+        return 0
+    async with db_engine.begin() as connection:
+        partitioned: bool = bool(
+            await connection.scalar(
+                text(
+                    "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table "
+                    "WHERE partrelid = to_regclass('orders'))"
+                )
+            )
+        )
+        if not partitioned:
+            return 0
+        # The current month is covered already, by the legacy partition or by a
+        # partition created ahead of time.
+        next_month: date = add_months(datetime.now(timezone.utc).date(), 1)
+        executed: int = 0
+        for table in PARTITIONED_TABLES:
+            for offset in range(months_ahead):
+                executed += await create_partition(
+                    connection, table, add_months(next_month, offset)
+                )
+    return executed
+
+
+async def maintain_order_partitions(db_engine: AsyncEngine) -> None:
+    """
+    Creates the upcoming order partitions now and then every
+    ORDERS_PARTITION_CHECK_INTERVAL_SECONDS, so that inserts never miss a partition.
+    """
+    while True:
+        try:
+            await create_order_partitions(db_engine)
+        except (SQLAlchemyError, OSError) as e:
+            logger.warning("Order partition maintenance failed: %s", e)
+        await asyncio.sleep(settings.ORDERS_PARTITION_CHECK_INTERVAL_SECONDS)
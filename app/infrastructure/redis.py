@@ -1,4 +1,5 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
+
 import redis
 
 from app.core.config import settings
@@ -6,12 +7,55 @@ from app.core.config import settings
 if TYPE_CHECKING:
     from aioredis import Redis
 
+# Application-wide connection pool, created and closed by the FastAPI lifespan hook.
+redis_pool: Optional[redis.asyncio.ConnectionPool] = None
 
-async def get_redis() -> "Redis":
-    redis_client: "Redis" = await redis.asyncio.Redis(
+
+def create_redis_pool() -> redis.asyncio.ConnectionPool:
+    """
+    Builds a shared Redis connection pool from the application settings.
+    redis-py parses replies with hiredis whenever it is installed.
+    """
+    return redis.asyncio.ConnectionPool(
         host=settings.REDIS_HOST,
         port=settings.REDIS_PORT,
+        max_connections=settings.REDIS_MAX_CONNECTIONS,
+        socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+        socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+        health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL,
         encoding="utf-8",
         decode_responses=True,
-    ).initialize()
-    yield redis_client
+    )
+
+
+async def init_redis_pool() -> redis.asyncio.ConnectionPool:
+    """
+    Creates the application-wide Redis connection pool.
+    """
+    global redis_pool
+    redis_pool = create_redis_pool()
+    return redis_pool
+
+
+async def close_redis_pool() -> None:
+    """
+    Disconnects every connection of the application-wide Redis pool.
+    """
+    global redis_pool
+    if redis_pool is not None:
+        await redis_pool.aclose()
+        redis_pool = None
+
+
+async def get_redis() -> "Redis":
+    """
+    Provides a Redis client bound to the shared connection pool.
+    Connections are returned to the pool instead of being closed.
+    """
+    if redis_pool is None:
+        await init_redis_pool()
+    redis_client: "Redis" = redis.asyncio.Redis(connection_pool=redis_pool)
+    try:
+        yield redis_client
+    finally:
+        await redis_client.aclose(close_connection_pool=False)
@@ -0,0 +1,31 @@
+import asyncio
+from typing import Any, Awaitable, Callable
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls for the same key within the process: the first
+    caller runs the loader and every other caller awaits its result.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[str, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def run(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Returns the result of the in-flight call for the key, starting one if needed.
+        The call is shielded so that a cancelled caller does not cancel the others.
+        """
+        future: asyncio.Future = self._calls.get(key)
+        if future is None:
+            future = asyncio.ensure_future(loader())
+            self._calls[key] = future
+            future.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(future)
+
+    def _forget(self, key: str, future: asyncio.Future) -> None:
+        if self._calls.get(key) is future:
+            del self._calls[key]
@@ -1,9 +1,20 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from logging.config import dictConfig
 
+import redis
 from fastapi import FastAPI
+from typing_extensions import AsyncGenerator
 
+from app.core.config import settings
 from app.core.logger import LoggerConfig
+from app.infrastructure.auth_cache import auth_local_cache
+from app.infrastructure.db import engine, replica_engines, warm_up_engine
+from app.infrastructure.local_cache import listen_for_invalidations, order_local_cache
+from app.infrastructure.partitions import maintain_order_partitions
+from app.infrastructure.redis import init_redis_pool, close_redis_pool
 from app.presentation.api.main import router
+from app.presentation.cli.archive_orders import archive_periodically
 
 
 def setup_logging():
@@ -14,7 +25,44 @@ def setup_logging():
     dictConfig(config.dict())
 
 
-app: FastAPI = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+    """
+    Creates shared resources on startup and releases them on shutdown.
+    """
+    for db_engine in (engine, *replica_engines):
+        await warm_up_engine(db_engine)
+    redis_pool = await init_redis_pool()
+    local_caches = [
+        cache for cache in (order_local_cache, auth_local_cache) if cache is not None
+    ]
+    background_tasks: list[asyncio.Task] = []
+    if settings.ORDERS_PARTITIONING:
+        background_tasks.append(asyncio.create_task(maintain_order_partitions(engine)))
+    if settings.ORDERS_ARCHIVE_ENABLED:
+        background_tasks.append(asyncio.create_task(archive_periodically()))
+    invalidation_listener = None
+    if local_caches:
+        invalidation_listener = asyncio.create_task(
+            listen_for_invalidations(
+                redis.asyncio.Redis(connection_pool=redis_pool),
+                settings.CACHE_INVALIDATION_CHANNEL,
+                local_caches,
+            )
+        )
+    yield
+    if invalidation_listener is not None:
+        background_tasks.append(invalidation_listener)
+    for task in background_tasks:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    await close_redis_pool()
+    for db_engine in (engine, *replica_engines):
+        await db_engine.dispose()
+
+
+app: FastAPI = FastAPI(lifespan=lifespan)
 
 # Setup logging
 setup_logging()
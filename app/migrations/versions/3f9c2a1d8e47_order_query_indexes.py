@@ -0,0 +1,96 @@
+"""order query indexes
+
+Revision ID: 3f9c2a1d8e47
+Revises: 7b54a85bd04f
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3f9c2a1d8e47"
+down_revision: Union[str, None] = "7b54a85bd04f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Partial index condition matching the ``is_deleted == False`` filter of the order queries.
+NOT_DELETED = {
+    "postgresql_where": sa.text("NOT is_deleted"),
+    "sqlite_where": sa.text("is_deleted = 0"),
+}
+
+ORDER_INDEXES = {
+    "ix_orders_user_id_created_at": ["user_id", "created_at", "id"],
+    "ix_orders_created_at": ["created_at", "id"],
+    "ix_orders_status_created_at": ["status", "created_at", "id"],
+    "ix_orders_total_price": ["total_price", "id"],
+}
+
+# Redundant with the primary keys they were declared on.
+PRIMARY_KEY_INDEXES = {
+    "ix_orders_id": "orders",
+    "ix_products_id": "products",
+    "ix_user_id": "user",
+}
+
+
+def upgrade() -> None:
+    # Built concurrently on PostgreSQL so that writes to the tables are not blocked,
+    # which requires running outside of the migration transaction.
+    with op.get_context().autocommit_block():
+        for name, columns in ORDER_INDEXES.items():
+            op.create_index(
+                name,
+                "orders",
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+                **NOT_DELETED,
+            )
+        op.create_index(
+            "ix_order_product_association_product_id",
+            "order_product_association",
+            ["product_id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        for name, table in PRIMARY_KEY_INDEXES.items():
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table in PRIMARY_KEY_INDEXES.items():
+            op.create_index(
+                name,
+                table,
+                ["id"],
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        op.drop_index(
+            "ix_order_product_association_product_id",
+            table_name="order_product_association",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        for name in reversed(ORDER_INDEXES):
+            op.drop_index(
+                name,
+                table_name="orders",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
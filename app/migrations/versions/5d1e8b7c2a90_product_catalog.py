@@ -0,0 +1,103 @@
+"""product catalog
+
+Revision ID: 5d1e8b7c2a90
+Revises: 3f9c2a1d8e47
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5d1e8b7c2a90"
+down_revision: Union[str, None] = "3f9c2a1d8e47"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Step 1: Copy the line data of every order onto its association row.
+    op.add_column(
+        "order_product_association",
+        sa.Column("quantity", sa.Integer(), nullable=True),
+    )
+    op.add_column(
+        "order_product_association",
+        sa.Column("price", sa.Numeric(precision=10, scale=2), nullable=True),
+    )
+    op.execute(
+        "UPDATE order_product_association SET "
+        "quantity = (SELECT quantity FROM products "
+        "WHERE products.id = order_product_association.product_id), "
+        "price = (SELECT price FROM products "
+        "WHERE products.id = order_product_association.product_id)"
+    )
+    op.alter_column("order_product_association", "quantity", nullable=False)
+    op.alter_column("order_product_association", "price", nullable=False)
+
+    # Step 2: An order may now contain the same product on several lines.
+    op.drop_constraint(
+        "idx_unique_order_product", "order_product_association", type_="unique"
+    )
+    op.create_index(
+        "ix_order_product_association_order_id",
+        "order_product_association",
+        ["order_id", "product_id"],
+        unique=False,
+    )
+
+    # Step 3: Point the lines at the first product created with each name, price
+    # it as last ordered, and delete the duplicates.
+    op.create_index("tmp_ix_products_name", "products", ["name", "id"], unique=False)
+    op.execute(
+        "UPDATE order_product_association SET product_id = ("
+        "SELECT MIN(canonical.id) FROM products AS canonical "
+        "JOIN products AS ordered ON ordered.name = canonical.name "
+        "WHERE ordered.id = order_product_association.product_id)"
+    )
+    op.execute(
+        "UPDATE products SET price = (SELECT latest.price FROM products AS latest "
+        "WHERE latest.name = products.name ORDER BY latest.id DESC LIMIT 1) "
+        "WHERE id IN (SELECT MIN(id) FROM products GROUP BY name)"
+    )
+    op.execute(
+        "DELETE FROM products WHERE id NOT IN (SELECT MIN(id) FROM products GROUP BY name)"
+    )
+    op.drop_index("tmp_ix_products_name", table_name="products")
+
+    op.create_index("ix_products_name", "products", ["name"], unique=True)
+    op.drop_column("products", "quantity")
+
+
+def downgrade() -> None:
+    # Products are not split again: each catalog product keeps the quantity of
+    # its latest order line, and the lines lose their own quantity and price.
+    op.add_column(
+        "products",
+        sa.Column("quantity", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.execute(
+        "UPDATE products SET quantity = COALESCE((SELECT line.quantity "
+        "FROM order_product_association AS line WHERE line.product_id = products.id "
+        "ORDER BY line.id DESC LIMIT 1), 0)"
+    )
+    op.drop_index("ix_products_name", table_name="products")
+    op.drop_index(
+        "ix_order_product_association_order_id",
+        table_name="order_product_association",
+    )
+    op.execute(
+        "DELETE FROM order_product_association WHERE id NOT IN ("
+        "SELECT MIN(id) FROM order_product_association GROUP BY order_id, product_id)"
+    )
+    op.create_unique_constraint(
+        "idx_unique_order_product",
+        "order_product_association",
+        ["order_id", "product_id"],
+    )
+    op.drop_column("order_product_association", "price")
+    op.drop_column("order_product_association", "quantity")
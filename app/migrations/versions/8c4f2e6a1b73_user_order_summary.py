@@ -0,0 +1,56 @@
+"""user order summary
+
+Revision ID: 8c4f2e6a1b73
+Revises: 5d1e8b7c2a90
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8c4f2e6a1b73"
+down_revision: Union[str, None] = "5d1e8b7c2a90"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_order_summary",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "status",
+            postgresql.ENUM(
+                "PENDING",
+                "CONFIRMED",
+                "CANCELLED",
+                name="statusenum",
+                create_type=False,
+            ),
+            nullable=False,
+        ),
+        sa.Column("order_count", sa.Integer(), nullable=False),
+        sa.Column("total_spent", sa.Numeric(precision=14, scale=2), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["user.id"],
+        ),
+        sa.PrimaryKeyConstraint("user_id", "status"),
+    )
+    # Run python -m app.presentation.cli.rebuild_order_summary --check after the
+    # deployment to verify that no order written during the backfill was missed.
+    op.execute(
+        "INSERT INTO user_order_summary (user_id, status, order_count, total_spent) "
+        "SELECT user_id, status, COUNT(*), COALESCE(SUM(total_price), 0) FROM orders "
+        "WHERE NOT is_deleted AND status IS NOT NULL GROUP BY user_id, status"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("user_order_summary")
@@ -0,0 +1,172 @@
+"""order partitioning
+
+Adds the partition key, the creation time of the order, to the order lines.
+With ORDERS_PARTITIONING enabled on PostgreSQL, also converts orders and
+order_product_association to tables partitioned by created_at month.
+
+The existing tables are kept as the partitions of everything created before next
+month, or before the month after their latest order if that is later, so no rows
+are copied. A CHECK constraint validated beforehand lets them
+be attached without a scan under an exclusive lock. Monthly partitions follow,
+created ahead of time by the application, and a default partition catches
+anything outside of them until the application creates their partition and
+moves them into it.
+
+Revision ID: a7e3c9d51f08
+Revises: 8c4f2e6a1b73
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+
+from datetime import date, datetime, timezone
+from typing import Optional, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.config import settings
+from app.infrastructure.partitions import (
+    add_months,
+    orders_partitioned,
+    partition_statements,
+)
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a7e3c9d51f08"
+down_revision: Union[str, None] = "8c4f2e6a1b73"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Indexes of each table, recreated on the partitioned table. The existing ones
+# are renamed and attached as the indexes of the legacy partition.
+INDEXES = {
+    "orders": {
+        "ix_orders_user_id_created_at": "(user_id, created_at, id) WHERE NOT is_deleted",
+        "ix_orders_created_at": "(created_at, id) WHERE NOT is_deleted",
+        "ix_orders_status_created_at": "(status, created_at, id) WHERE NOT is_deleted",
+        "ix_orders_total_price": "(total_price, id) WHERE NOT is_deleted",
+    },
+    "order_product_association": {
+        "ix_order_product_association_order_id": "(order_id, product_id)",
+        "ix_order_product_association_product_id": "(product_id)",
+    },
+}
+
+FOREIGN_KEYS = {
+    "orders": ['(user_id) REFERENCES "user" (id)'],
+    # Lines no longer reference orders: a foreign key to a partitioned table cannot
+    # be added NOT VALID, so it would be validated under a lock on both tables.
+    "order_product_association": ["(product_id) REFERENCES products (id)"],
+}
+
+
+def legacy_boundary() -> date:
+    """
+    Returns the end of the legacy partition: the first day of next month, or of the
+    month after the latest order or line if one is dated later, so that the CHECK
+    constraint holds for every existing row. Offline migrations cannot read the
+    rows and use next month.
+    """
+    boundary: date = add_months(datetime.now(timezone.utc).date(), 1)
+    if op.get_context().as_sql:
+        return boundary
+    latest: Optional[datetime] = op.get_bind().scalar(
+        sa.text(
+            "SELECT GREATEST((SELECT max(created_at) FROM orders), "
+            "(SELECT max(created_at) FROM order_product_association))"
+        )
+    )
+    if latest is None or latest.date() < boundary:
+        return boundary
+    latest_boundary: date = add_months(latest.date(), 1)
+    if latest_boundary > add_months(boundary, settings.ORDERS_PARTITIONS_AHEAD_MONTHS):
+        raise RuntimeError(
+            f"Orders are dated up to {latest.isoformat()}, more than "
+            f"ORDERS_PARTITIONS_AHEAD_MONTHS ({settings.ORDERS_PARTITIONS_AHEAD_MONTHS}) "
+            f"months ahead, so every new order would stay in the legacy partition. "
+            f"Correct their created_at before partitioning the orders."
+        )
+    return latest_boundary
+
+
+def upgrade() -> None:
+    op.add_column(
+        "order_product_association",
+        sa.Column(
+            "created_at", sa.DateTime(), server_default=sa.text("now()"), nullable=True
+        ),
+    )
+    op.execute(
+        "UPDATE order_product_association SET created_at = orders.created_at "
+        "FROM orders WHERE orders.id = order_product_association.order_id"
+    )
+    op.alter_column("order_product_association", "created_at", nullable=False)
+
+    if not orders_partitioned(op.get_bind().dialect.name):
+        return
+
+    boundary: date = legacy_boundary()
+    with op.get_context().autocommit_block():
+        for table in INDEXES:
+            op.execute(
+                f"CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS {table}_legacy_key "
+                f"ON {table} (id, created_at)"
+            )
+            op.execute(
+                f"ALTER TABLE {table} ADD CONSTRAINT {table}_legacy_created_at_check "
+                f"CHECK (created_at < '{boundary.isoformat()}') NOT VALID"
+            )
+            op.execute(
+                f"ALTER TABLE {table} VALIDATE CONSTRAINT {table}_legacy_created_at_check"
+            )
+
+    op.execute(
+        "ALTER TABLE order_product_association "
+        "DROP CONSTRAINT order_product_association_order_id_fkey"
+    )
+    for table, indexes in INDEXES.items():
+        for name in indexes:
+            op.execute(f"ALTER INDEX {name} RENAME TO {name}_legacy")
+        op.execute(f"ALTER TABLE {table} RENAME TO {table}_legacy")
+        # A partition cannot keep a primary key other than the partitioned table's,
+        # so the (id, created_at) index built above becomes its primary key.
+        op.execute(
+            f"ALTER TABLE {table}_legacy DROP CONSTRAINT {table}_pkey, "
+            f"ADD CONSTRAINT {table}_legacy_pkey PRIMARY KEY USING INDEX {table}_legacy_key"
+        )
+        op.execute(
+            f"CREATE TABLE {table} (LIKE {table}_legacy INCLUDING DEFAULTS) "
+            f"PARTITION BY RANGE (created_at)"
+        )
+        op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id")
+        op.execute(f"ALTER TABLE {table} ADD PRIMARY KEY (id, created_at)")
+        for foreign_key in FOREIGN_KEYS[table]:
+            op.execute(f"ALTER TABLE {table} ADD FOREIGN KEY {foreign_key}")
+        for name, definition in indexes.items():
+            op.execute(f"CREATE INDEX {name} ON {table} {definition}")
+        op.execute(
+            f"ALTER TABLE {table} ATTACH PARTITION {table}_legacy "
+            f"FOR VALUES FROM (MINVALUE) TO ('{boundary.isoformat()}')"
+        )
+        op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+        for statement in partition_statements(
+            table, boundary, settings.ORDERS_PARTITIONS_AHEAD_MONTHS
+        ):
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        partitioned: bool = op.get_bind().scalar(
+            sa.text(
+                "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table "
+                "WHERE partrelid = to_regclass('orders'))"
+            )
+        )
+        if partitioned:
+            raise RuntimeError(
+                "Partitioned orders cannot be converted back automatically; "
+                "copy them into unpartitioned tables before downgrading."
+            )
+    op.drop_column("order_product_association", "created_at")
@@ -0,0 +1,102 @@
+"""orders archive
+
+Revision ID: b2d8f4a6c915
+Revises: a7e3c9d51f08
+Create Date: 2026-10-17 17:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.infrastructure.partitions import orders_partitioned
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b2d8f4a6c915"
+down_revision: Union[str, None] = "a7e3c9d51f08"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Partial index condition matching the soft-deleted orders waiting to be archived.
+DELETED = {
+    "postgresql_where": sa.text("is_deleted"),
+    "sqlite_where": sa.text("is_deleted = 1"),
+}
+
+
+def upgrade() -> None:
+    op.create_table(
+        "orders_archive",
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("customer_name", sa.String(length=255), nullable=False),
+        sa.Column(
+            "status",
+            postgresql.ENUM(
+                "PENDING",
+                "CONFIRMED",
+                "CANCELLED",
+                name="statusenum",
+                create_type=False,
+            ),
+            nullable=True,
+        ),
+        sa.Column("total_price", sa.Numeric(precision=10, scale=2), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(), nullable=False),
+        sa.Column(
+            "archived_at",
+            sa.DateTime(),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_orders_archive_user_id", "orders_archive", ["user_id"])
+    op.create_table(
+        "order_product_association_archive",
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("order_id", sa.Integer(), nullable=False),
+        sa.Column("product_id", sa.Integer(), nullable=False),
+        sa.Column("quantity", sa.Integer(), nullable=False),
+        sa.Column("price", sa.Numeric(precision=10, scale=2), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_order_product_association_archive_order_id",
+        "order_product_association_archive",
+        ["order_id"],
+    )
+
+    # Indexes cannot be built concurrently on a partitioned table, only on its partitions.
+    if orders_partitioned(op.get_bind().dialect.name):
+        op.create_index(
+            "ix_orders_deleted_updated_at", "orders", ["updated_at", "id"], **DELETED
+        )
+        return
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_orders_deleted_updated_at",
+            "orders",
+            ["updated_at", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+            **DELETED,
+        )
+
+
+def downgrade() -> None:
+    # Archived orders are not restored: downgrading drops them.
+    op.drop_index("ix_orders_deleted_updated_at", table_name="orders")
+    op.drop_index(
+        "ix_order_product_association_archive_order_id",
+        table_name="order_product_association_archive",
+    )
+    op.drop_table("order_product_association_archive")
+    op.drop_index("ix_orders_archive_user_id", table_name="orders_archive")
+    op.drop_table("orders_archive")
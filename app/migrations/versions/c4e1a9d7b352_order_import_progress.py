@@ -0,0 +1,35 @@
+"""order import progress
+
+Revision ID: c4e1a9d7b352
+Revises: b2d8f4a6c915
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c4e1a9d7b352"
+down_revision: Union[str, None] = "b2d8f4a6c915"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "order_import_progress",
+        sa.Column("source", sa.String(length=255), nullable=False),
+        sa.Column("position", sa.Integer(), nullable=False),
+        sa.Column(
+            "updated_at", sa.DateTime(), server_default=sa.text("now()"), nullable=False
+        ),
+        sa.PrimaryKeyConstraint("source"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("order_import_progress")
@@ -0,0 +1,76 @@
+"""order search trigram indexes
+
+Trigram GIN indexes answering the case-insensitive substring searches of the
+customer and product names of GET /orders?q=. SQLite has no trigram indexes and
+scans the names instead.
+
+Revision ID: d6f1b3e8a204
+Revises: c4e1a9d7b352
+Create Date: 2026-10-17 20:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.infrastructure.partitions import orders_partitioned
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d6f1b3e8a204"
+down_revision: Union[str, None] = "c4e1a9d7b352"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Trigram index of the customer names of the non-deleted orders, the only ones searched.
+CUSTOMER_NAME_TRGM = {
+    "postgresql_using": "gin",
+    "postgresql_ops": {"customer_name": "gin_trgm_ops"},
+    "postgresql_where": sa.text("NOT is_deleted"),
+}
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # Indexes cannot be built concurrently on a partitioned table, only on its partitions.
+    partitioned: bool = orders_partitioned(op.get_bind().dialect.name)
+    if partitioned:
+        op.create_index(
+            "ix_orders_customer_name_trgm",
+            "orders",
+            ["customer_name"],
+            if_not_exists=True,
+            **CUSTOMER_NAME_TRGM,
+        )
+    with op.get_context().autocommit_block():
+        if not partitioned:
+            op.create_index(
+                "ix_orders_customer_name_trgm",
+                "orders",
+                ["customer_name"],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+                **CUSTOMER_NAME_TRGM,
+            )
+        op.create_index(
+            "ix_products_name_trgm",
+            "products",
+            ["name"],
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    # The pg_trgm extension is kept, other database objects may depend on it.
+    op.drop_index("ix_products_name_trgm", table_name="products")
+    op.drop_index("ix_orders_customer_name_trgm", table_name="orders")
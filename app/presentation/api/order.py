@@ -1,5 +1,8 @@
+from datetime import datetime
+from typing import Literal
+
 from redis import Redis
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response, StreamingResponse
 from starlette.status import (
     HTTP_200_OK,
     HTTP_201_CREATED,
@@ -12,10 +15,19 @@ from starlette.status import (
 from fastapi import APIRouter, Depends, Query
 
 from app.application.managers.order import OrderManager
-from app.domain.dependencies.order import get_order_db
+from app.domain.dependencies.order import get_order_db, get_order_read_db
 from app.domain.dependencies.user import get_user_manager
 from app.domain.models.order import StatusEnum
-from app.domain.schemas.order import OrderRead, OrderWrite, OrderUpdate
+from app.core.config import settings
+from app.domain.schemas.order import (
+    OrderRead,
+    OrderWrite,
+    OrderUpdate,
+    OrderPage,
+    OrderBulkWrite,
+    OrderStats,
+    UserOrderSummary,
+)
 from app.domain.schemas.user import UserRead
 from app.domain.repositories.orders import OrdersRepository
 from app.infrastructure.redis import get_redis
@@ -64,6 +76,229 @@ async def create_orders(
     return order_data
 
 
+@router.post(
+    path="/bulk",
+    summary="Create orders in bulk",
+    description=f"""The endpoint is responsible for creating up to {settings.ORDERS_BULK_MAX_SIZE} orders at once,
+        in a single transaction.
+
+        Options:
+        {''.join([f"{key} - {value}, " for key, value in StatusEnum.__members__.items()])}
+        """,
+    dependencies=[Depends(current_user)],
+    status_code=HTTP_201_CREATED,
+    response_description="Successful. The orders have been created.",
+    response_model=list[OrderRead],
+    responses={
+        HTTP_400_BAD_REQUEST: {
+            "description": "Bad Request. Return the errors list for each field that is invalid.",
+        },
+    },
+)
+async def create_orders_bulk(
+    data: OrderBulkWrite,
+    user: UserRead = Depends(current_user),
+    order_repository: OrdersRepository = Depends(get_order_db),
+    redis: Redis = Depends(get_redis),
+) -> JSONResponse:
+    order_manager: OrderManager = OrderManager(
+        order_repository=order_repository,
+        redis=redis,
+    )
+    orders_data: JSONResponse = await order_manager.on_after_bulk_create_orders(
+        data=[order.model_dump() for order in data.orders],
+        user=user,
+    )
+    return orders_data
+
+
+@router.get(
+    path="/stats",
+    summary="Get order statistics",
+    description=f"""This endpoint returns the number of orders and the sum, average, minimum
+        and maximum of their total price per status, computed by the database.
+        Pass `group_by=day` and/or `group_by=user` to split the groups further.
+        Results are cached for {settings.ORDERS_STATS_CACHE_TTL_SECONDS} seconds.
+        Options:
+            {''.join([f"{key} - {value}, " for key, value in StatusEnum.__members__.items()])}
+        """,
+    dependencies=[Depends(current_user)],
+    status_code=HTTP_200_OK,
+    response_description="Successful. The order statistics.",
+    response_model=OrderStats,
+    responses={
+        HTTP_400_BAD_REQUEST: {
+            "description": "Bad Request. Return the errors list for each field that is invalid.",
+        },
+        HTTP_401_UNAUTHORIZED: {
+            "description": "Unauthorized access",
+        },
+    },
+)
+async def get_orders_stats(
+    status: str | None = Query(
+        default=None,
+        description="Filter by order status",
+    ),
+    min_price: float | None = Query(
+        default=None,
+        description="Filter by minimum price",
+    ),
+    max_price: float | None = Query(
+        default=None,
+        description="Filter by maximum price",
+    ),
+    user_id: int | None = Query(
+        default=None,
+        description="Filter by owner, superusers only",
+    ),
+    created_from: datetime | None = Query(
+        default=None,
+        description="Only orders created at or after this time",
+    ),
+    created_to: datetime | None = Query(
+        default=None,
+        description="Only orders created before this time",
+    ),
+    group_by: list[Literal["day", "user"]] = Query(
+        default=[],
+        description="Also group by day of creation and/or by user",
+    ),
+    user: UserRead = Depends(current_user),
+    order_repository: OrdersRepository = Depends(get_order_read_db),
+    redis: Redis = Depends(get_redis),
+) -> Response:
+    order_manager: OrderManager = OrderManager(
+        order_repository=order_repository,
+        redis=redis,
+    )
+    stats_data: Response = await order_manager.get_stats(
+        user=user,
+        filters={
+            "status": status,
+            "min_price": min_price,
+            "max_price": max_price,
+            "user_id": user_id,
+            "created_from": created_from,
+            "created_to": created_to,
+        },
+        group_by=group_by,
+    )
+    return stats_data
+
+
+@router.get(
+    path="/export",
+    summary="Export orders",
+    description=f"""This endpoint streams every order matching the filters, without pagination.
+        `format=ndjson` writes one order per line, as in the list endpoint.
+        `format=csv` writes one row per order line, in the format read by the import command.
+        Options:
+            {''.join([f"{key} - {value}, " for key, value in StatusEnum.__members__.items()])}
+        """,
+    dependencies=[Depends(current_user)],
+    status_code=HTTP_200_OK,
+    response_description="Successful. The exported orders.",
+    response_class=StreamingResponse,
+    responses={
+        HTTP_400_BAD_REQUEST: {
+            "description": "Bad Request. Return the errors list for each field that is invalid.",
+        },
+        HTTP_401_UNAUTHORIZED: {
+            "description": "Unauthorized access",
+        },
+    },
+)
+async def export_orders(
+    export_format: Literal["ndjson", "csv"] = Query(
+        default="ndjson",
+        alias="format",
+        description="Format of the export",
+    ),
+    status: str | None = Query(
+        default=None,
+        description="Filter by order status",
+    ),
+    min_price: float | None = Query(
+        default=None,
+        description="Filter by minimum price",
+    ),
+    max_price: float | None = Query(
+        default=None,
+        description="Filter by maximum price",
+    ),
+    user_id: int | None = Query(
+        default=None,
+        description="Filter by owner, superusers only",
+    ),
+    created_from: datetime | None = Query(
+        default=None,
+        description="Only orders created at or after this time",
+    ),
+    created_to: datetime | None = Query(
+        default=None,
+        description="Only orders created before this time",
+    ),
+    user: UserRead = Depends(current_user),
+    order_repository: OrdersRepository = Depends(get_order_read_db),
+    redis: Redis = Depends(get_redis),
+) -> StreamingResponse:
+    order_manager: OrderManager = OrderManager(
+        order_repository=order_repository,
+        redis=redis,
+    )
+    orders_data: StreamingResponse = await order_manager.export_orders(
+        user=user,
+        filters={
+            "status": status,
+            "min_price": min_price,
+            "max_price": max_price,
+            "user_id": user_id,
+            "created_from": created_from,
+            "created_to": created_to,
+        },
+        export_format=export_format,
+    )
+    return orders_data
+
+
+@router.get(
+    path="/summary",
+    summary="Get user order summary",
+    description="""This endpoint returns the number and total price of a user's orders per status.
+        The summary is maintained on every order write, so reading it does not scan the orders.
+        Superusers may pass `user_id` to read the summary of another user.
+        """,
+    dependencies=[Depends(current_user)],
+    status_code=HTTP_200_OK,
+    response_description="Successful. The user order summary.",
+    response_model=UserOrderSummary,
+    responses={
+        HTTP_401_UNAUTHORIZED: {
+            "description": "Unauthorized access",
+        },
+    },
+)
+async def get_user_orders_summary(
+    user_id: int | None = Query(
+        default=None,
+        description="Owner of the orders, superusers only",
+    ),
+    user: UserRead = Depends(current_user),
+    order_repository: OrdersRepository = Depends(get_order_read_db),
+    redis: Redis = Depends(get_redis),
+) -> JSONResponse:
+    order_manager: OrderManager = OrderManager(
+        order_repository=order_repository,
+        redis=redis,
+    )
+    summary_data: JSONResponse = await order_manager.get_user_summary(
+        user=user,
+        user_id=user_id,
+    )
+    return summary_data
+
+
 @router.get(
     path="/{order_id}",
     summary="Get detail of order",
@@ -82,14 +317,14 @@ async def create_orders(
 async def get_order(
     order_id: int,
     user: UserRead = Depends(current_user),
-    order_repository: OrdersRepository = Depends(get_order_db),
+    order_repository: OrdersRepository = Depends(get_order_read_db),
     redis: Redis = Depends(get_redis),
-) -> JSONResponse:
+) -> Response:
     order_manager: OrderManager = OrderManager(
         order_repository=order_repository,
         redis=redis,
     )
-    order_data: JSONResponse = await order_manager.get_details(
+    order_data: Response = await order_manager.get_details(
         order_id,
         user=user,
     )
@@ -134,17 +369,87 @@ async def delete_order(
     return order_data
 
 
+@router.delete(
+    path="",
+    summary="Delete orders in bulk",
+    description=f"""This endpoint soft deletes every order matching the filters in a single statement.
+        At least one filter is required. Up to {settings.ORDERS_BULK_MAX_SIZE} ids can be given.
+        Options:
+            {''.join([f"{key} - {value}, " for key, value in StatusEnum.__members__.items()])}
+        """,
+    dependencies=[Depends(current_super_user)],
+    status_code=HTTP_200_OK,
+    response_description="Successful. The number of deleted orders.",
+    responses={
+        HTTP_400_BAD_REQUEST: {
+            "description": "Bad Request. Return the errors list for each field that is invalid.",
+        },
+        HTTP_401_UNAUTHORIZED: {
+            "description": "Unauthorized access",
+        },
+        HTTP_403_FORBIDDEN: {
+            "description": "Forbidden access",
+        },
+    },
+)
+async def delete_orders(
+    ids: list[int] | None = Query(
+        default=None,
+        max_length=settings.ORDERS_BULK_MAX_SIZE,
+        description="Delete the orders with these ids",
+    ),
+    status: str | None = Query(
+        default=None,
+        description="Filter by order status",
+    ),
+    min_price: float | None = Query(
+        default=None,
+        description="Filter by minimum price",
+    ),
+    max_price: float | None = Query(
+        default=None,
+        description="Filter by maximum price",
+    ),
+    user_id: int | None = Query(
+        default=None,
+        description="Filter by owner",
+    ),
+    user: UserRead = Depends(current_super_user),
+    order_repository: OrdersRepository = Depends(get_order_db),
+    redis: Redis = Depends(get_redis),
+) -> JSONResponse:
+    order_manager: OrderManager = OrderManager(
+        order_repository=order_repository,
+        redis=redis,
+    )
+    orders_data: JSONResponse = await order_manager.bulk_soft_delete(
+        user=user,
+        filters={
+            "ids": ids,
+            "status": status,
+            "min_price": min_price,
+            "max_price": max_price,
+            "user_id": user_id,
+        },
+    )
+    return orders_data
+
+
 @router.get(
     path="",
     summary="Get list orders",
-    description=f"""This endpoint get list orders.
+    description=f"""This endpoint get list orders, one page at a time.
+        Pass `next_cursor` of a page as `cursor` to get the next one.
+        Pass `q` to search the customer and product names, most relevant first.
+        Sorted by relevance, at most {settings.ORDERS_SEARCH_MAX_CANDIDATES} matches of
+        each name are ranked; sort by created_at to list every match.
         Options:
             {''.join([f"{key} - {value}, " for key, value in StatusEnum.__members__.items()])}
         """,
     dependencies=[Depends(current_user)],
     status_code=HTTP_200_OK,
     response_description="Successful. The get list orders.",
-    response_model=list[OrderRead],
+    response_model=OrderPage,
     responses={
         HTTP_400_BAD_REQUEST: {
             "description": "Bad Request. Return the errors list for each field that is invalid.",
@@ -167,21 +472,55 @@ async def get_orders(
         default=None,
         description="Filter by maximum price",
     ),
+    limit: int = Query(
+        default=settings.ORDERS_PAGE_SIZE,
+        ge=1,
+        le=settings.ORDERS_MAX_PAGE_SIZE,
+        description="Maximum number of orders in the page",
+    ),
+    cursor: str | None = Query(
+        default=None,
+        description="Opaque cursor returned as next_cursor by the previous page",
+    ),
+    order_by: Literal["relevance", "created_at", "total_price"] | None = Query(
+        default=None,
+        description="Sort key, orders are returned in descending order. "
+        "Defaults to relevance when searching, and to created_at otherwise",
+    ),
+    created_from: datetime | None = Query(
+        default=None,
+        description="Only orders created at or after this time",
+    ),
+    created_to: datetime | None = Query(
+        default=None,
+        description="Only orders created before this time",
+    ),
+    q: str | None = Query(
+        default=None,
+        max_length=255,
+        description="Search the customer name and the product names, ignoring case",
+    ),
     user: UserRead = Depends(current_user),
-    order_repository: OrdersRepository = Depends(get_order_db),
+    order_repository: OrdersRepository = Depends(get_order_read_db),
     redis: Redis = Depends(get_redis),
-) -> JSONResponse:
+) -> Response:
     order_manager: OrderManager = OrderManager(
         order_repository=order_repository,
         redis=redis,
     )
-    orders_data: JSONResponse = await order_manager.filter_orders(
+    orders_data: Response = await order_manager.filter_orders(
         user=user,
         filters={
             "status": status,
             "min_price": min_price,
             "max_price": max_price,
+            "created_from": created_from,
+            "created_to": created_to,
+            "q": q,
         },
+        limit=limit,
+        cursor=cursor,
+        order_by=order_by,
     )
     return orders_data
 
@@ -0,0 +1,104 @@
+"""
+Moves the orders soft-deleted for longer than the retention window, and their
+lines, to the archive tables in batches, and reports the rows moved per second:
+
+    python -m app.presentation.cli.archive_orders --retention-days 30 --batch-size 1000
+
+Each batch is a short transaction skipping the orders locked by the application,
+so the command can run at any time. Set ORDERS_ARCHIVE_ENABLED to run it
+periodically in the application instead.
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from logging.config import dictConfig
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.core.config import settings
+from app.core.logger import LoggerConfig
+from app.domain.models import Order
+from app.infrastructure.db import async_session_maker, engine
+
+dictConfig(LoggerConfig().model_dump())
+logger: logging = logging.getLogger("digital_travel_concierge")
+
+
+async def archive(
+    retention_days: int = settings.ORDERS_ARCHIVE_RETENTION_DAYS,
+    batch_size: int = settings.ORDERS_ARCHIVE_BATCH_SIZE,
+    pause: float = settings.ORDERS_ARCHIVE_BATCH_PAUSE_SECONDS,
+    session_maker: async_sessionmaker = async_session_maker,
+) -> tuple[int, int]:
+    """
+    Archives the orders deleted more than retention_days ago, one transaction per
+    batch, sleeping pause seconds between batches. Stops at the first batch that is
+    not full. Returns the number of orders and lines moved.
+    """
+    now: datetime = datetime.now(timezone.utc).replace(tzinfo=None)
+    deleted_before: datetime = now - timedelta(days=retention_days)
+    orders: int = 0
+    lines: int = 0
+    started: float = time.perf_counter()
+    while True:
+        async with session_maker() as session:
+            batch_orders, batch_lines = await Order.get_db(session).archive_deleted(
+                deleted_before, batch_size
+            )
+        orders += batch_orders
+        lines += batch_lines
+        if batch_orders < batch_size:
+            break
+        if pause:
+            await asyncio.sleep(pause)
+
+    elapsed: float = time.perf_counter() - started
+    logger.info(
+        "Archived %d orders and %d lines in %.1fs (%.0f rows/s)",
+        orders,
+        lines,
+        elapsed,
+        (orders + lines) / elapsed if elapsed else 0,
+    )
+    return orders, lines
+
+
+async def archive_periodically() -> None:
+    """
+    Archives the deleted orders now and then every ORDERS_ARCHIVE_INTERVAL_SECONDS.
+    """
+    while True:
+        try:
+            await archive()
+        except (SQLAlchemyError, OSError) as e:
+            logger.warning("Order archival failed: %s", e)
+        await asyncio.sleep(settings.ORDERS_ARCHIVE_INTERVAL_SECONDS)
+
+
+async def main(retention_days: int, batch_size: int, pause: float) -> None:
+    try:
+        await archive(retention_days, batch_size, pause)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--retention-days", type=int, default=settings.ORDERS_ARCHIVE_RETENTION_DAYS
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=settings.ORDERS_ARCHIVE_BATCH_SIZE
+    )
+    parser.add_argument(
+        "--pause",
+        type=float,
+        default=settings.ORDERS_ARCHIVE_BATCH_PAUSE_SECONDS,
+        help="seconds to sleep between batches",
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.retention_days, args.batch_size, args.pause))
@@ -0,0 +1,317 @@
+"""
+Loads historical orders from a CSV or NDJSON file, in batches validated at once
+with the order schemas, and reports the orders imported per second:
+
+    python -m app import-orders orders.ndjson --batch-size 10000
+    python -m app import-orders orders.csv --format csv
+
+Each NDJSON line is an order: {"user_id": 1, "customer_name": "...", "status":
+"PENDING", "created_at": "2024-01-31T12:00:00Z", "products": [{"name": "...",
+"price": 10.5, "quantity": 2}]}, where created_at is optional and products are
+referenced by "id" or "name" as in the API. CSV files have one row per order
+line, with the columns of ORDER_CSV_COLUMNS, as exported by GET /orders/export.
+
+Invalid orders are logged and skipped. The position in the file is committed
+with every batch, so running the same command again after an interruption
+resumes after the last imported batch; --restart imports the file from the start.
+"""
+
+import argparse
+import asyncio
+import csv
+import gc
+import json
+import logging
+import os
+import time
+from itertools import groupby, islice
+from logging.config import dictConfig
+from typing import Any, Iterator, Optional, TextIO
+
+from fastapi import HTTPException
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.core.logger import LoggerConfig
+from app.domain.models import Order
+from app.domain.schemas.order import ORDER_CSV_COLUMNS, OrderImport
+from app.infrastructure.db import async_session_maker, engine
+
+dictConfig(LoggerConfig().model_dump())
+logger: logging = logging.getLogger("digital_travel_concierge")
+
+# Validates and dumps a whole batch of orders in one call.
+order_imports: TypeAdapter[list[OrderImport]] = TypeAdapter(list[OrderImport])
+
+
+def read_ndjson(file: TextIO) -> Iterator[tuple[int, Any]]:
+    """
+    Yields the line number and the decoded order of every non-empty line.
+    Lines that are not valid JSON are yielded as None.
+    """
+    for number, line in enumerate(file, 1):
+        if not line.strip():
+            continue
+        try:
+            yield number, json.loads(line)
+        except json.JSONDecodeError:
+            yield number, None
+
+
+def read_csv(file: TextIO) -> Iterator[tuple[int, Any]]:
+    """
+    Yields the line number of the first row and the order built from each run of
+    consecutive rows sharing an order_ref.
+    """
+    reader: csv.DictReader = csv.DictReader(file)
+    missing: set[str] = set(ORDER_CSV_COLUMNS) - set(reader.fieldnames or ())
+    if missing:
+        raise ValueError(f"Missing CSV columns: {', '.join(sorted(missing))}")
+    rows: Iterator[tuple[int, dict[str, str]]] = (
+        (reader.line_num, row) for row in reader
+    )
+    for _, group in groupby(rows, key=lambda item: item[1]["order_ref"]):
+        lines: list[tuple[int, dict[str, str]]] = list(group)
+        number, first = lines[0]
+        yield number, {
+            "user_id": first["user_id"],
+            "customer_name": first["customer_name"],
+            "status": first["status"],
+            "created_at": first["created_at"] or None,
+            "products": [
+                {
+                    "id": row["product_id"] or None,
+                    "name": row["product_name"] or None,
+                    "price": row["price"],
+                    "quantity": row["quantity"],
+                }
+                for _, row in lines
+            ],
+        }
+
+
+def validate(number: int, record: Any) -> Optional[dict[str, Any]]:
+    """
+    Validates an order with the rules of the API, logging why it is rejected.
+    """
+    try:
+        return OrderImport.model_validate(record).model_dump()
+    except HTTPException as e:
+        detail: Any = e.detail
+    except ValidationError as e:
+        detail = e.errors(include_url=False, include_context=False)
+    logger.warning("Rejected the order at line %d: %s", number, detail)
+    return None
+
+
+def validate_batch(batch: list[tuple[int, Any]]) -> list[tuple[int, dict[str, Any]]]:
+    """
+    Validates the orders of a batch in one call with the rules of the API, logging
+    why the rejected ones are, and returns the valid orders with their line numbers.
+    """
+    try:
+        orders: list[OrderImport] = order_imports.validate_python(
+            [record for _, record in batch]
+        )
+    except ValidationError as e:
+        errors: dict[int, list[dict[str, Any]]] = {}
+        for error in e.errors(include_url=False, include_context=False):
+            index, *loc = error["loc"]
+            errors.setdefault(index, []).append({**error, "loc": tuple(loc)})
+        for index, detail in errors.items():
+            logger.warning("Rejected the order at line %d: %s", batch[index][0], detail)
+        return validate_batch(
+            [item for index, item in enumerate(batch) if index not in errors]
+        )
+    except HTTPException:
+        # Raised by the API validators, it stops the batch at the first order it
+        # rejects without telling which one, so the orders are validated one by one.
+        return [
+            (number, order)
+            for number, record in batch
+            if (order := validate(number, record)) is not None
+        ]
+    return list(zip([number for number, _ in batch], order_imports.dump_python(orders)))
+
+
+async def reject_unknown(
+    repository: Any,
+    orders: list[tuple[int, dict[str, Any]]],
+) -> list[dict[str, Any]]:
+    """
+    Returns the orders whose user and products exist, logging the others as rejected.
+    """
+    missing_users: list[int] = await repository.get_missing_user_ids(
+        {order["user_id"] for _, order in orders}
+    )
+    missing_products: list[int] = await repository.get_missing_product_ids(
+        {
+            product["id"]
+            for _, order in orders
+            for product in order["products"]
+            if product["id"] is not None
+        }
+    )
+    valid: list[dict[str, Any]] = []
+    for number, order in orders:
+        unknown: list[int] = [
+            product["id"]
+            for product in order["products"]
+            if product["id"] in missing_products
+        ]
+        if order["user_id"] in missing_users:
+            logger.warning(
+                "Rejected the order at line %d: %s",
+                number,
+                {"user_id": f"User not found: {order['user_id']}", "code": "not_found"},
+            )
+        elif unknown:
+            logger.warning(
+                "Rejected the order at line %d: %s",
+                number,
+                {
+                    "products": f"Products not found by ids: {unknown}",
+                    "code": "not_found",
+                },
+            )
+        else:
+            valid.append(order)
+    return valid
+
+
+def read_batch(
+    records: Iterator[tuple[int, Any]],
+    batch_size: int,
+) -> tuple[int, list[tuple[int, dict[str, Any]]]]:
+    """
+    Reads up to batch_size records and returns their number and the valid orders
+    among them, with their line numbers.
+    """
+    # Reading and validating create many objects without reference cycles, which the
+    # cycle collector would otherwise walk again every few hundred allocations.
+    gc.disable()
+    try:
+        batch: list[tuple[int, Any]] = list(islice(records, batch_size))
+        return len(batch), validate_batch(batch)
+    finally:
+        gc.enable()
+
+
+async def load_batch(
+    orders: list[tuple[int, dict[str, Any]]],
+    source: str,
+    position: int,
+    catalog: dict[str, int],
+    session_maker: async_sessionmaker,
+) -> int:
+    """
+    Imports the orders whose user and products exist in one transaction, which
+    records position as the progress of the source. Returns the number imported.
+    """
+    async with session_maker() as session:
+        repository: Any = Order.get_db(session)
+        valid: list[dict[str, Any]] = await reject_unknown(repository, orders)
+        await repository.import_batch(valid, source, position, catalog)
+    return len(valid)
+
+
+async def import_orders(
+    path: str,
+    file_format: str,
+    batch_size: int,
+    source: Optional[str] = None,
+    restart: bool = False,
+    session_maker: async_sessionmaker = async_session_maker,
+) -> tuple[int, int]:
+    """
+    Imports the orders of the file in batches of batch_size, one transaction per
+    batch, resuming after the batches committed by previous runs unless restart
+    is set. Progress is recorded under source, the file name by default.
+    Returns the number of orders imported and rejected.
+    """
+    source = source or os.path.basename(path)
+    async with session_maker() as session:
+        position: int = (
+            0 if restart else await Order.get_db(session).get_import_position(source)
+        )
+    if position:
+        logger.info("Resuming the import of %s after %d orders", source, position)
+
+    catalog: dict[str, int] = {}
+    imported: int = 0
+    rejected: int = 0
+    started: float = time.perf_counter()
+    # The batch being loaded and its number of records.
+    loading: Optional[tuple[asyncio.Task, int]] = None
+    with open(path, newline="", encoding="utf-8") as file:
+        records: Iterator[tuple[int, Any]] = islice(
+            read_csv(file) if file_format == "csv" else read_ndjson(file),
+            position,
+            None,
+        )
+        try:
+            while True:
+                # The next batch is read and validated while the previous one is loaded,
+                # the batches are still committed one after another and in order.
+                count, orders = await asyncio.to_thread(read_batch, records, batch_size)
+                if loading is not None:
+                    loaded: int = await loading[0]
+                    imported += loaded
+                    rejected += loading[1] - loaded
+                    loading = None
+                    elapsed: float = time.perf_counter() - started
+                    logger.info(
+                        "Imported %d orders, rejected %d (%.0f orders/s)",
+                        imported,
+                        rejected,
+                        imported / elapsed if elapsed else 0,
+                    )
+                if not count:
+                    break
+                position += count
+                loading = (
+                    asyncio.create_task(
+                        load_batch(orders, source, position, catalog, session_maker)
+                    ),
+                    count,
+                )
+        finally:
+            if loading is not None:
+                loading[0].cancel()
+                await asyncio.gather(loading[0], return_exceptions=True)
+    return imported, rejected
+
+
+async def main(
+    path: str,
+    file_format: str,
+    batch_size: int,
+    source: Optional[str],
+    restart: bool,
+) -> None:
+    try:
+        await import_orders(path, file_format, batch_size, source, restart)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("path")
+    parser.add_argument("--format", choices=["ndjson", "csv"], default=None)
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    parser.add_argument(
+        "--source", help="name the progress is recorded under, the file name by default"
+    )
+    parser.add_argument(
+        "--restart", action="store_true", help="ignore the progress of previous runs"
+    )
+    args = parser.parse_args()
+    file_format: str = args.format or (
+        "csv" if args.path.endswith(".csv") else "ndjson"
+    )
+    asyncio.run(
+        main(args.path, file_format, args.batch_size, args.source, args.restart)
+    )
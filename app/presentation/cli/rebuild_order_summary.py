@@ -0,0 +1,80 @@
+"""
+Recomputes the per-user order summaries from the orders, in batches of users,
+and reports how many of them had drifted:
+
+    python -m app.presentation.cli.rebuild_order_summary --batch-size 1000
+    python -m app.presentation.cli.rebuild_order_summary --check
+
+With --check the summaries are only verified, and the command exits with status 1
+if any of them drifted.
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+from logging.config import dictConfig
+from typing import Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.core.logger import LoggerConfig
+from app.domain.models import Order, User
+from app.infrastructure.db import async_session_maker, engine
+
+dictConfig(LoggerConfig().model_dump())
+logger: logging = logging.getLogger("digital_travel_concierge")
+
+
+async def rebuild(
+    batch_size: int,
+    write: bool,
+    session_maker: async_sessionmaker = async_session_maker,
+) -> int:
+    """
+    Rebuilds or verifies the summaries of every user, one transaction per batch
+    of user IDs. Returns the number of summaries that had drifted.
+    """
+    async with session_maker() as session:
+        last_user_id: Optional[int] = await session.scalar(select(func.max(User.id)))
+
+    drift: int = 0
+    first_user_id: int = 1
+    while last_user_id is not None and first_user_id <= last_user_id:
+        async with session_maker() as session:
+            batch_drift: int = await Order.get_db(session).rebuild_summaries(
+                first_user_id, first_user_id + batch_size - 1, write=write
+            )
+        if batch_drift:
+            logger.warning(
+                "Order summaries of users %d-%d: %d drifted",
+                first_user_id,
+                first_user_id + batch_size - 1,
+                batch_drift,
+            )
+        drift += batch_drift
+        first_user_id += batch_size
+
+    logger.info(
+        "Order summaries %s, %d drifted", "rebuilt" if write else "verified", drift
+    )
+    return drift
+
+
+async def main(batch_size: int, write: bool) -> int:
+    try:
+        return await rebuild(batch_size, write)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument(
+        "--check", action="store_true", help="only verify the summaries"
+    )
+    args = parser.parse_args()
+    drifted: int = asyncio.run(main(args.batch_size, not args.check))
+    sys.exit(1 if args.check and drifted else 0)
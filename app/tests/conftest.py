@@ -1,6 +1,7 @@
 from random import choice, randint
 from typing import Any, AsyncGenerator, Generator, Optional
 import pytest_asyncio
+from fakeredis import FakeServer
 from fakeredis.aioredis import FakeRedis
 from httpx import AsyncClient, ASGITransport, Response
 from sqlalchemy import select, Result
@@ -9,7 +10,8 @@ from sqlalchemy.orm import selectinload
 from starlette.status import HTTP_201_CREATED, HTTP_200_OK
 
 from app.domain.models import *  # noqa
-from app.infrastructure.db import Base, get_async_session
+from app.infrastructure import db
+from app.infrastructure.db import Base, RoutingSession, get_async_session
 from app.infrastructure.redis import get_redis
 from app.main import app
 
@@ -50,6 +52,14 @@ async def override_get_aioredis() -> Generator[FakeRedis, Any, None]:
 
 
 app.dependency_overrides[get_async_session] = override_get_async_session
+# Sessions opened with read_session, by read-only endpoints and by work that
+# outlives a request, read the test database.
+db.read_session_maker = async_sessionmaker(
+    engine,
+    expire_on_commit=False,
+    autoflush=False,
+    sync_session_class=RoutingSession,
+)
 app.dependency_overrides[get_redis] = override_get_aioredis
 
 
@@ -67,6 +77,24 @@ async def get_test_redis() -> Generator[FakeRedis, Any, None]:
         yield aioredis
 
 
+@pytest_asyncio.fixture
+async def shared_redis() -> Generator[FakeRedis, Any, None]:
+    """
+    Provide a FakeRedis whose data survives between requests, so that the cache
+    written by one request can be read by the next one.
+    """
+    server: FakeServer = FakeServer()
+
+    async def override_get_shared_redis() -> Generator[FakeRedis, Any, None]:
+        yield FakeRedis(server=server)
+
+    app.dependency_overrides[get_redis] = override_get_shared_redis
+    r = FakeRedis(server=server)
+    yield r
+    await r.flushall()
+    app.dependency_overrides[get_redis] = override_get_aioredis
+
+
 @pytest_asyncio.fixture
 async def async_client() -> Generator[AsyncClient, Any, None]:
     """Provide an asynchronous HTTP client for test functions."""
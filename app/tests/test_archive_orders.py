@@ -0,0 +1,87 @@
+from datetime import datetime, timedelta, timezone
+
+from httpx import AsyncClient, Response
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.status import HTTP_200_OK
+
+from app.domain.models import (
+    User,
+    Order,
+    order_product_association_table,
+    orders_archive_table,
+    order_product_association_archive_table,
+)
+from app.presentation.cli.archive_orders import archive
+from app.tests.conftest import TestingSessionLocal
+
+
+async def test_archive_orders_deleted_before_retention(
+    login_user: tuple[AsyncClient, User],
+    create_order: Order,
+    get_test_session: AsyncSession,
+) -> None:
+    """
+    Test that only the orders deleted longer than the retention are moved to the archive with their lines.
+    """
+
+    # Step 1: Create three orders and delete two of them
+    client, _ = login_user
+    kept: Order = await create_order(client)
+    recent: Order = await create_order(client)
+    expired: Order = await create_order(client)
+    for order in (recent, expired):
+        response: Response = await client.delete(f"/orders/{order.id}")
+        assert response.status_code == HTTP_200_OK
+
+    # Step 2: Move the deletion of one of them back by forty days
+    async with get_test_session as session:
+        await session.execute(
+            update(Order)
+            .where(Order.id == expired.id)
+            .values(
+                updated_at=datetime.now(timezone.utc).replace(tzinfo=None)
+                - timedelta(days=40)
+            )
+        )
+        await session.commit()
+        line_count: int = await session.scalar(
+            select(func.count()).where(
+                order_product_association_table.c.order_id == expired.id
+            )
+        )
+
+    # Step 3: Archive in batches of one order
+    assert await archive(
+        retention_days=30, batch_size=1, pause=0, session_maker=TestingSessionLocal
+    ) == (1, line_count)
+
+    # Step 4: Assert the expired order and its lines moved to the archive
+    async with TestingSessionLocal() as session:
+        assert list(await session.scalars(select(Order.id).order_by(Order.id))) == [
+            kept.id,
+            recent.id,
+        ]
+        assert list(await session.scalars(select(orders_archive_table.c.id))) == [
+            expired.id
+        ]
+        assert (
+            await session.scalar(
+                select(func.count()).where(
+                    order_product_association_table.c.order_id == expired.id
+                )
+            )
+            == 0
+        )
+        archived_lines = order_product_association_archive_table
+        assert (
+            await session.scalar(
+                select(func.count()).where(archived_lines.c.order_id == expired.id)
+            )
+            == line_count
+        )
+
+    # Step 5: Assert a second run has nothing left to archive
+    assert await archive(
+        retention_days=30, batch_size=1, pause=0, session_maker=TestingSessionLocal
+    ) == (0, 0)
@@ -0,0 +1,168 @@
+import pytest
+from fakeredis.aioredis import FakeRedis
+from fastapi_users.schemas import BaseUserUpdate
+from fastapi_users_db_sqlalchemy.access_token import SQLAlchemyAccessTokenDatabase
+from httpx import AsyncClient, Response
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.status import HTTP_200_OK, HTTP_204_NO_CONTENT, HTTP_401_UNAUTHORIZED
+
+from app.application.managers.user import UserManager
+from app.core.config import settings
+from app.domain.models import User, Order
+from app.domain.schemas.user import AuthenticatedUser
+from app.infrastructure.auth_cache import (
+    get_cached_user,
+    invalidate_user,
+    token_cache_key,
+    user_tokens_key,
+)
+
+
+def bearer_token(async_client: AsyncClient) -> str:
+    return async_client.headers["Authorization"].removeprefix("Bearer ")
+
+
+async def test_authenticated_request_uses_cached_token(
+    monkeypatch,
+    shared_redis: FakeRedis,
+    login_user: tuple[AsyncClient, User],
+    create_order: Order,
+) -> None:
+    """
+    Test that once a token is resolved, later requests do not read the access token table.
+    """
+
+    # Step 1: Login as a user and make an authenticated request
+    client, user = login_user
+    order: Order = await create_order(client)
+
+    # Step 2: Assert the token is cached with a TTL bounded by the token lifetime
+    key: str = token_cache_key(bearer_token(client))
+    ttl: int = await shared_redis.ttl(key)
+    assert 0 < ttl <= min(settings.AUTH_CACHE_TTL_SECONDS, settings.LIFE_TIME_SECONDS)
+
+    # Step 3: Fail on any access token lookup and repeat the request
+    async def failing_get_by_token(self, token, max_age=None):
+        raise AssertionError("The access token table must not be queried")
+
+    monkeypatch.setattr(
+        SQLAlchemyAccessTokenDatabase, "get_by_token", failing_get_by_token
+    )
+    response: Response = await client.get(f"/orders/{order.id}")
+    assert response.status_code == HTTP_200_OK, response.json()
+
+
+async def test_logout_invalidates_cached_token(
+    shared_redis: FakeRedis,
+    login_user: tuple[AsyncClient, User],
+    create_order: Order,
+) -> None:
+    """
+    Test that logging out drops the cached token and rejects it afterwards.
+    """
+
+    # Step 1: Login as a user and make an authenticated request
+    client, user = login_user
+    order: Order = await create_order(client)
+    key: str = token_cache_key(bearer_token(client))
+    assert await shared_redis.exists(key)
+
+    # Step 2: Logout and assert the cached token is gone
+    response: Response = await client.post("/auth/logout")
+    assert response.status_code == HTTP_204_NO_CONTENT
+    assert not await shared_redis.exists(key)
+
+    # Step 3: Assert the token is rejected
+    response = await client.get(f"/orders/{order.id}")
+    assert response.status_code == HTTP_401_UNAUTHORIZED
+
+
+async def test_user_change_invalidates_cached_tokens(
+    shared_redis: FakeRedis,
+    login_user: tuple[AsyncClient, User],
+    create_order: Order,
+) -> None:
+    """
+    Test that invalidating a user drops the cached user of all of their tokens.
+    """
+
+    # Step 1: Login as a user and make an authenticated request
+    client, user = login_user
+    await create_order(client)
+    key: str = token_cache_key(bearer_token(client))
+    assert await shared_redis.sismember(user_tokens_key(user.id), key)
+
+    # Step 2: Invalidate the user and assert every cached token is gone
+    await invalidate_user(shared_redis, user.id)
+    assert not await shared_redis.exists(key)
+    assert not await shared_redis.exists(user_tokens_key(user.id))
+
+
+async def test_cached_user_changes_go_through_database(
+    shared_redis: FakeRedis,
+    login_user: tuple[AsyncClient, User],
+    get_test_session: AsyncSession,
+) -> None:
+    """
+    Test that the cached user is read-only and that updating or deleting it
+    changes the user reloaded from the database.
+    """
+
+    # Step 1: Login as a user, make an authenticated request and read the cached user
+    client, user = login_user
+    response: Response = await client.get("/orders")
+    assert response.status_code == HTTP_200_OK
+    cached_user: AuthenticatedUser = await get_cached_user(
+        shared_redis, bearer_token(client)
+    )
+    assert cached_user.id == user.id
+    with pytest.raises(ValidationError):
+        cached_user.is_superuser = True
+
+    async with get_test_session as session:
+        user_manager: UserManager = UserManager(User.get_db(session), shared_redis)
+
+        # Step 2: Update the cached user and assert the stored user keeps its password
+        updated: User = await user_manager.update(
+            BaseUserUpdate(is_verified=True), cached_user
+        )
+        assert updated.is_verified
+        assert updated.hashed_password == user.hashed_password
+        assert not await shared_redis.exists(token_cache_key(bearer_token(client)))
+
+        # Step 3: Delete the cached user and assert the stored user is gone
+        await user_manager.delete(cached_user)
+        assert await User.get_db(session).get(user.id) is None
+
+
+async def test_stale_fill_is_skipped_after_invalidation(
+    monkeypatch,
+    shared_redis: FakeRedis,
+    login_user: tuple[AsyncClient, User],
+) -> None:
+    """
+    Test that a user loaded before being invalidated is not cached afterwards.
+    """
+
+    # Step 1: Invalidate the user while the token's user is loaded from the database
+    client, user = login_user
+    get = UserManager.get
+
+    async def racing_get(self, id):
+        loaded: User = await get(self, id)
+        await invalidate_user(shared_redis, id)
+        return loaded
+
+    monkeypatch.setattr(UserManager, "get", racing_get)
+
+    # Step 2: Make an authenticated request and assert the loaded user is not cached
+    response: Response = await client.get("/orders")
+    assert response.status_code == HTTP_200_OK
+    assert not await shared_redis.exists(token_cache_key(bearer_token(client)))
+
+    # Step 3: Assert the next load is cached
+    monkeypatch.setattr(UserManager, "get", get)
+    response = await client.get("/orders")
+    assert response.status_code == HTTP_200_OK
+    assert await shared_redis.exists(token_cache_key(bearer_token(client)))
@@ -0,0 +1,129 @@
+import pytest
+from httpx import AsyncClient, Response
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.status import HTTP_200_OK
+
+from app.domain.models import User, Order
+from app.domain.repositories.abstract import BaseRepository, build_filter_statement
+
+
+async def test_filter_statement_sql(get_test_session: AsyncSession) -> None:
+    """
+    Test that every operator is compiled to a SQL predicate with bound parameters.
+    """
+
+    # Step 1: Parse filters using every operator
+    repository: BaseRepository = BaseRepository(get_test_session, Order)
+    shape, params = repository.parse_filters(
+        {
+            "status": "PENDING",
+            "id__in": [1, 2],
+            "total_price__gte": 10,
+            "total_price__lt": 20,
+            "customer_name__ilike": "%smith%",
+            "updated_at__null": False,
+        }
+    )
+
+    # Step 2: Assert the values are bound and the statement compiled as expected
+    assert params == {
+        "status__eq": "PENDING",
+        "id__in": [1, 2],
+        "total_price__gte": 10,
+        "total_price__lt": 20,
+        "customer_name__ilike": "%smith%",
+    }
+    sql: str = str(
+        build_filter_statement(Order, shape).compile(dialect=sqlite.dialect())
+    )
+    assert " ".join(sql.split()) == (
+        "SELECT orders.user_id, orders.customer_name, orders.status, orders.total_price, "
+        "orders.id, orders.created_at, orders.updated_at, orders.is_deleted FROM orders "
+        "WHERE orders.is_deleted = 0 AND lower(orders.customer_name) LIKE lower(?) "
+        "AND orders.id IN (__[POSTCOMPILE_id__in]) AND orders.status = ? "
+        "AND orders.total_price >= ? AND orders.total_price < ? "
+        "AND orders.updated_at IS NOT NULL ORDER BY orders.id LIMIT ? OFFSET ?"
+    )
+
+    # Step 3: Assert filters of the same shape reuse the statement
+    other_shape, _ = repository.parse_filters(
+        {
+            "updated_at__null": False,
+            "customer_name__ilike": "%doe%",
+            "total_price__lt": 50,
+            "total_price__gte": 0,
+            "id__in": [3],
+            "status": "CONFIRMED",
+        }
+    )
+    assert build_filter_statement(Order, other_shape) is build_filter_statement(
+        Order, shape
+    )
+
+
+async def test_filter_and_get_exclude_deleted(
+    login_user: tuple[AsyncClient, User],
+    create_order: Order,
+    get_test_session: AsyncSession,
+) -> None:
+    """
+    Test that objects are filtered in the database and soft-deleted ones are never returned.
+    """
+
+    # Step 1: Create three orders and delete one of them
+    client, _ = login_user
+    orders: list[Order] = [
+        await create_order(client, status="PENDING"),
+        await create_order(client, status="CONFIRMED"),
+        await create_order(client, status="PENDING"),
+    ]
+    response: Response = await client.delete(f"/orders/{orders[2].id}")
+    assert response.status_code == HTTP_200_OK
+
+    # Step 2: Assert orders are found by ID unless deleted
+    async with get_test_session as session:
+        repository: BaseRepository = BaseRepository(session, Order)
+        assert (await repository.get_by_id(orders[0].id)).id == orders[0].id
+        assert await repository.get_by_id(orders[2].id) is None
+        assert [order.id for order in await repository.get_all()] == [
+            orders[0].id,
+            orders[1].id,
+        ]
+
+        # Step 3: Assert the operators select the matching orders
+        assert [
+            order.id
+            for order in await repository.filter_by(
+                {"status": "PENDING", "id__in": [order.id for order in orders]}
+            )
+        ] == [orders[0].id]
+        assert [
+            order.id
+            for order in await repository.filter_by(
+                {
+                    "customer_name__ilike": orders[1].customer_name.upper(),
+                    "user_id__null": False,
+                }
+            )
+        ] == [orders[0].id, orders[1].id]
+        assert [
+            order.id for order in await repository.filter_by({}, limit=1, offset=1)
+        ] == [orders[1].id]
+
+
+async def test_filter_rejects_unknown_columns_and_operators(
+    get_test_session: AsyncSession,
+) -> None:
+    """
+    Test that filters on unknown columns, with unknown operators or given twice are rejected.
+    """
+
+    # Step 1: Assert they are rejected before querying
+    repository: BaseRepository = BaseRepository(get_test_session, Order)
+    with pytest.raises(ValueError, match="no column 'products'"):
+        await repository.filter_by({"products": 1})
+    with pytest.raises(ValueError, match="operator 'like'"):
+        await repository.filter_by({"customer_name__like": "%a%"})
+    with pytest.raises(ValueError, match="Duplicate filter status__eq"):
+        await repository.filter_by({"status": "PENDING", "status__eq": "CONFIRMED"})
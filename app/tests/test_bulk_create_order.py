@@ -0,0 +1,108 @@
+from typing import Any
+
+import pytest
+from fakeredis.aioredis import FakeRedis
+from httpx import AsyncClient, Response
+from sqlalchemy import Result, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from starlette.status import HTTP_200_OK, HTTP_201_CREATED, HTTP_400_BAD_REQUEST
+
+from app.application.managers.order import OrderManager
+from app.core.config import settings
+from app.domain.models import User, Order
+
+
+def bulk_payload(count: int) -> dict[str, Any]:
+    """Build a bulk request with ``count`` orders of two products each."""
+    return {
+        "orders": [
+            {
+                "customer_name": f"Customer {i}",
+                "status": "PENDING",
+                "products": [
+                    {"name": f"product{i}-1", "price": 10, "quantity": i + 1},
+                    {"name": f"product{i}-2", "price": 20, "quantity": 1},
+                ],
+            }
+            for i in range(count)
+        ]
+    }
+
+
+async def test_success_bulk_create_orders(
+    shared_redis: FakeRedis,
+    login_user: tuple[AsyncClient, User],
+    get_test_session: AsyncSession,
+) -> None:
+    """
+    Test creating several orders at once with their products, links and cache entries.
+    """
+
+    # Step 1: Create three orders in bulk
+    client, user = login_user
+    response: Response = await client.post("/orders/bulk", json=bulk_payload(3))
+    assert response.status_code == HTTP_201_CREATED
+    created: list[dict[str, Any]] = response.json()
+
+    # Step 2: Assert the response keeps the request order and totals
+    assert [order["customer_name"] for order in created] == [
+        "Customer 0",
+        "Customer 1",
+        "Customer 2",
+    ]
+    assert [order["total_price"] for order in created] == [30.0, 40.0, 50.0]
+    assert all(order["user_id"] == user.id for order in created)
+
+    # Step 3: Assert every order is stored with its own products
+    async with get_test_session as session:
+        result: Result = await session.execute(
+            select(Order).order_by(Order.id).options(selectinload(Order.products))
+        )
+        orders: list[Order] = result.scalars().all()
+    assert [order.id for order in orders] == [order["id"] for order in created]
+    for order, order_data in zip(orders, created):
+        assert sorted(product.name for product in order.products) == sorted(
+            product["name"] for product in order_data["products"]
+        )
+
+    # Step 4: Assert the orders were cached and are served as created
+    for order_data in created:
+        assert await shared_redis.exists(OrderManager.order_cache_key(order_data["id"]))
+        response = await client.get(f"/orders/{order_data['id']}")
+        assert response.status_code == HTTP_200_OK
+        assert response.json() == order_data
+
+
+async def test_fail_bulk_create_too_many_orders(
+    monkeypatch: pytest.MonkeyPatch,
+    login_user: tuple[AsyncClient, User],
+) -> None:
+    """
+    Test that a batch larger than ORDERS_BULK_MAX_SIZE is rejected.
+    """
+
+    # Step 1: Lower the batch limit and send a larger batch
+    monkeypatch.setattr(settings, "ORDERS_BULK_MAX_SIZE", 2)
+    client, _ = login_user
+    response: Response = await client.post("/orders/bulk", json=bulk_payload(3))
+
+    # Step 2: Assert the batch is rejected
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["detail"]["code"] == "too_many"
+
+
+async def test_fail_bulk_create_empty(
+    login_user: tuple[AsyncClient, User],
+) -> None:
+    """
+    Test that an empty batch is rejected.
+    """
+
+    # Step 1: Send an empty batch
+    client, _ = login_user
+    response: Response = await client.post("/orders/bulk", json={"orders": []})
+
+    # Step 2: Assert the batch is rejected
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["detail"]["code"] == "null"
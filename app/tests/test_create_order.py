@@ -1,5 +1,5 @@
 from httpx import AsyncClient, Response
-from sqlalchemy import Result, select
+from sqlalchemy import Result, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from starlette.status import (
@@ -9,7 +9,7 @@ from starlette.status import (
     HTTP_422_UNPROCESSABLE_ENTITY,
 )
 
-from app.domain.models import User, Order
+from app.domain.models import User, Order, Product
 
 
 async def test_success_create_order(
@@ -59,6 +59,7 @@ async def test_success_create_order(
             .options(selectinload(Order.products))
         )
         order: Order = result_order.scalars().first()
+        products: list[dict] = await Order.get_db(session).get_products(order.id)
 
     # Step 4: Asserting the order was successfully created
     assert order.id is not None
@@ -69,9 +70,9 @@ async def test_success_create_order(
 
     # Step 5: Validating the product details
     for i in range(len(payload["products"])):
-        assert response.json()["products"][i]["name"] == order.products[i].name
-        assert response.json()["products"][i]["price"] == order.products[i].price
-        assert response.json()["products"][i]["quantity"] == order.products[i].quantity
+        assert response.json()["products"][i]["name"] == products[i]["name"]
+        assert response.json()["products"][i]["price"] == products[i]["price"]
+        assert response.json()["products"][i]["quantity"] == products[i]["quantity"]
 
 
 async def test_unauthorized_create_order(
@@ -392,3 +393,145 @@ async def test_bad_request_product_empty_create_order(
 
     # Step 3: Asserting the presence of null code error for empty products
     assert response.json()["detail"]["code"] == "null", "products must not be empty"
+
+
+async def test_success_create_orders_share_catalog_products(
+    login_user: tuple[AsyncClient, User],
+    get_test_session: AsyncSession,
+) -> None:
+    """
+    Test that orders of the same product reference a single catalog product,
+    each with its own quantity and price.
+    """
+
+    async_client, user = login_user
+
+    # Step 1: Create two orders of the same product at different prices
+    first: Response = await async_client.post(
+        url="/orders",
+        json={
+            "customer_name": "Test customer",
+            "status": "PENDING",
+            "products": [{"name": "product1", "price": 100, "quantity": 2}],
+        },
+    )
+    second: Response = await async_client.post(
+        url="/orders",
+        json={
+            "customer_name": "Test customer",
+            "status": "PENDING",
+            "products": [{"name": "product1", "price": 80, "quantity": 5}],
+        },
+    )
+    assert first.status_code == HTTP_201_CREATED
+    assert second.status_code == HTTP_201_CREATED
+
+    # Step 2: Assert both orders reference the same product with their own line data
+    first_product: dict = first.json()["products"][0]
+    second_product: dict = second.json()["products"][0]
+    assert first_product["id"] == second_product["id"]
+    assert (first_product["price"], first_product["quantity"]) == (100, 2)
+    assert (second_product["price"], second_product["quantity"]) == (80, 5)
+    assert second.json()["total_price"] == 400
+
+    # Step 3: Assert the catalog holds the product once
+    async with get_test_session as session:
+        count: int = await session.scalar(
+            select(func.count()).select_from(Product).where(Product.name == "product1")
+        )
+        products: list[dict] = await Order.get_db(session).get_products(
+            second.json()["id"]
+        )
+    assert count == 1
+    assert products == [second_product]
+
+
+async def test_success_create_order_by_product_id(
+    login_user: tuple[AsyncClient, User],
+) -> None:
+    """
+    Test creating an order that references a catalog product by its id.
+    """
+
+    async_client, user = login_user
+
+    # Step 1: Add a product to the catalog with a first order
+    response: Response = await async_client.post(
+        url="/orders",
+        json={
+            "customer_name": "Test customer",
+            "status": "PENDING",
+            "products": [{"name": "product1", "price": 100, "quantity": 1}],
+        },
+    )
+    product_id: int = response.json()["products"][0]["id"]
+
+    # Step 2: Order the product by id
+    response = await async_client.post(
+        url="/orders",
+        json={
+            "customer_name": "Test customer",
+            "status": "PENDING",
+            "products": [{"id": product_id, "price": 90, "quantity": 3}],
+        },
+    )
+
+    # Step 3: Assert the line references the catalog product
+    assert response.status_code == HTTP_201_CREATED
+    assert response.json()["products"] == [
+        {
+            "name": "product1",
+            "price": 90,
+            "quantity": 3,
+            "is_deleted": False,
+            "id": product_id,
+        }
+    ]
+
+
+async def test_bad_request_unknown_product_id_create_order(
+    login_user: tuple[AsyncClient, User],
+) -> None:
+    """
+    Test creating an order that references a product missing from the catalog.
+    """
+
+    async_client, user = login_user
+
+    # Step 1: Order a product by an unknown id
+    response: Response = await async_client.post(
+        url="/orders",
+        json={
+            "customer_name": "Test customer",
+            "status": "PENDING",
+            "products": [{"id": 404, "price": 90, "quantity": 3}],
+        },
+    )
+
+    # Step 2: Assert the order is rejected
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["detail"]["code"] == "not_found"
+
+
+async def test_bad_request_product_without_reference_create_order(
+    login_user: tuple[AsyncClient, User],
+) -> None:
+    """
+    Test creating an order with a product that has neither an id nor a name.
+    """
+
+    async_client, user = login_user
+
+    # Step 1: Order a product without an id or a name
+    response: Response = await async_client.post(
+        url="/orders",
+        json={
+            "customer_name": "Test customer",
+            "status": "PENDING",
+            "products": [{"price": 90, "quantity": 3}],
+        },
+    )
+
+    # Step 2: Assert the order is rejected
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["detail"]["code"] == "null"
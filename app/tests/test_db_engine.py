@@ -0,0 +1,70 @@
+from typing import Any
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
+
+from app.core.config import settings
+from app.infrastructure.db import engine_options, warm_up_engine
+
+
+async def test_direct_preset_pools_connections(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that the direct preset pools connections and that explicit settings override it.
+    """
+
+    # Step 1: Select the direct preset and override the pool size
+    monkeypatch.setattr(settings, "DB_POOL_PRESET", "direct")
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 25)
+    monkeypatch.setattr(settings, "DB_STATEMENT_TIMEOUT_MS", 5000)
+
+    # Step 2: Assert the engine options combine the override with the preset
+    options: dict[str, Any] = engine_options()
+    assert "poolclass" not in options
+    assert options["pool_size"] == 25
+    assert options["max_overflow"] == 10
+    assert options["pool_pre_ping"] is True
+    assert options["connect_args"]["statement_cache_size"] == 100
+    assert options["connect_args"]["server_settings"]["statement_timeout"] == "5000"
+
+
+async def test_transaction_pooler_preset_disables_pooling(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Test that the transaction pooler preset uses NullPool without statement caches.
+    """
+
+    # Step 1: Select the transaction pooler preset
+    monkeypatch.setattr(settings, "DB_POOL_PRESET", "transaction_pooler")
+
+    # Step 2: Assert pooling, statement caches and startup parameters are disabled
+    options: dict[str, Any] = engine_options()
+    assert options["poolclass"] is NullPool
+    assert "pool_size" not in options
+    assert options["connect_args"]["statement_cache_size"] == 0
+    assert options["connect_args"]["prepared_statement_cache_size"] == 0
+    assert callable(options["connect_args"]["prepared_statement_name_func"])
+    assert "server_settings" not in options["connect_args"]
+
+
+async def test_warm_up_opens_pool_connections() -> None:
+    """
+    Test that the warm-up leaves the requested number of idle connections in the pool.
+    """
+
+    # Step 1: Create an engine with an empty pool
+    db_engine: AsyncEngine = create_async_engine(
+        "sqlite+aiosqlite:///./test.db",
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=5,
+    )
+    assert db_engine.pool.checkedin() == 0
+
+    # Step 2: Warm up three connections and assert they are idle in the pool
+    try:
+        assert await warm_up_engine(db_engine, connections=3) == 3
+        assert db_engine.pool.checkedin() == 3
+        assert db_engine.pool.checkedout() == 0
+    finally:
+        await db_engine.dispose()
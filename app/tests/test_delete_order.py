@@ -2,13 +2,16 @@ from httpx import AsyncClient, Response
 from sqlalchemy import Result, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
+from fakeredis.aioredis import FakeRedis
 from starlette.status import (
     HTTP_200_OK,
+    HTTP_400_BAD_REQUEST,
     HTTP_401_UNAUTHORIZED,
     HTTP_403_FORBIDDEN,
     HTTP_404_NOT_FOUND,
 )
 
+from app.application.managers.order import OrderManager
 from app.domain.models import User, Order
 
 
@@ -118,3 +121,125 @@ async def test_not_found_delete_order(
 
     # Step 3: Assert that the response status code is 404 Not Found
     assert response.status_code == HTTP_404_NOT_FOUND, response.json()
+
+
+async def test_not_found_delete_deleted_order(
+    login_user: tuple[AsyncClient, User],
+    create_order: Order,
+) -> None:
+    """
+    Test that deleting an already deleted order returns a 404 Not Found status.
+    """
+
+    # Step 1: Login as a user and delete an order
+    async_client, user = login_user
+    order: Order = await create_order(async_client)
+    response: Response = await async_client.delete(url=f"/orders/{order.id}")
+    assert response.status_code == HTTP_200_OK, response.json()
+
+    # Step 2: Assert that deleting it again returns 404 Not Found
+    response = await async_client.delete(url=f"/orders/{order.id}")
+    assert response.status_code == HTTP_404_NOT_FOUND, response.json()
+
+
+async def test_success_bulk_delete_orders_by_ids(
+    shared_redis: FakeRedis,
+    login_user: tuple[AsyncClient, User],
+    create_order: Order,
+    get_test_session: AsyncSession,
+) -> None:
+    """
+    Test soft deletion of several orders by id, including their cache entries.
+    """
+
+    # Step 1: Login as a user and create three orders
+    async_client, user = login_user
+    orders: list[Order] = [await create_order(async_client) for _ in range(3)]
+    deleted_ids: list[int] = [orders[0].id, orders[1].id]
+
+    # Step 2: Delete the first two orders in bulk
+    response: Response = await async_client.delete(
+        url="/orders", params={"ids": deleted_ids}
+    )
+    assert response.status_code == HTTP_200_OK, response.json()
+    assert response.json() == {"deleted": 2}
+
+    # Step 3: Verify only those orders are soft deleted and uncached
+    async with get_test_session as session:
+        result: Result = await session.execute(select(Order).order_by(Order.id))
+        stored: list[Order] = result.scalars().all()
+    assert [order.is_deleted for order in stored] == [True, True, False]
+    for order_id in deleted_ids:
+        assert not await shared_redis.exists(OrderManager.order_cache_key(order_id))
+    assert await shared_redis.exists(OrderManager.order_cache_key(orders[2].id))
+
+
+async def test_success_bulk_delete_orders_by_status(
+    login_user: tuple[AsyncClient, User],
+    create_order: Order,
+) -> None:
+    """
+    Test soft deletion of every order with a given status.
+    """
+
+    # Step 1: Login as a user and create orders with different statuses
+    async_client, user = login_user
+    await create_order(async_client, status="CANCELLED")
+    await create_order(async_client, status="CANCELLED")
+    kept: Order = await create_order(async_client, status="CONFIRMED")
+
+    # Step 2: Delete the cancelled orders in bulk
+    response: Response = await async_client.delete(
+        url="/orders", params={"status": "CANCELLED"}
+    )
+    assert response.status_code == HTTP_200_OK, response.json()
+    assert response.json() == {"deleted": 2}
+
+    # Step 3: Assert only the confirmed order is still listed
+    response = await async_client.get(url="/orders")
+    assert [order["id"] for order in response.json()["items"]] == [kept.id]
+
+
+async def test_bad_request_bulk_delete_without_filters(
+    login_user: tuple[AsyncClient, User],
+    create_order: Order,
+) -> None:
+    """
+    Test that a bulk deletion without any filter is refused.
+    """
+
+    # Step 1: Login as a user and create an order
+    async_client, user = login_user
+    await create_order(async_client)
+
+    # Step 2: Attempt to delete orders without filters
+    response: Response = await async_client.delete(url="/orders")
+
+    # Step 3: Assert that the response status code is 400 Bad Request
+    assert response.status_code == HTTP_400_BAD_REQUEST, response.json()
+    assert response.json()["detail"]["code"] == "null"
+
+
+async def test_forbidden_bulk_delete_orders(
+    login_user: tuple[AsyncClient, User],
+    get_test_session: AsyncSession,
+) -> None:
+    """
+    Test forbidden bulk deletion of orders by a non-superuser user.
+    """
+
+    # Step 1: Login as a user and set them as non-superuser
+    async_client, user = login_user
+    async with get_test_session as session:
+        result: Result = await session.execute(select(User).filter_by(id=user.id))
+        user: User = result.scalars().first()
+        user.is_superuser = False
+        await session.commit()
+
+    # Step 2: Attempt to delete orders in bulk
+    response: Response = await async_client.delete(
+        url="/orders", params={"status": "PENDING"}
+    )
+
+    # Step 3: Assert that the response status code is 403 Forbidden
+    assert response.status_code == HTTP_403_FORBIDDEN, response.json()
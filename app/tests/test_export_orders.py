@@ -0,0 +1,233 @@
+import asyncio
+import csv
+import io
+import json
+import os
+from typing import Any, AsyncGenerator
+
+import pytest
+from httpx import AsyncClient, Response
+from sqlalchemy import Result, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.status import HTTP_200_OK
+
+from app.domain.models import User, Order
+from app.domain.repositories.orders import OrdersRepository
+from app.domain.schemas.order import ORDER_CSV_COLUMNS
+from app.infrastructure.db import get_read_session
+from app.main import app
+from app.tests.conftest import TestingSessionLocal
+
+
+async def test_success_export_orders_ndjson(
+    login_user: tuple[AsyncClient, User],
+    create_order: Order,
+) -> None:
+    """
+    Test that the NDJSON export contains every matching order as rendered by the list endpoint.
+    """
+
+    # Step 1: Create three orders
+    client, _ = login_user
+    orders: list[Order] = [
+        await create_order(client, status="PENDING"),
+        await create_order(client, status="CONFIRMED"),
+        await create_order(client, status="PENDING"),
+    ]
+
+    # Step 2: Export the pending orders
+    response: Response = await client.get(
+        "/orders/export", params={"status": "PENDING"}
+    )
+    assert response.status_code == HTTP_200_OK
+    assert response.headers["content-type"] == "application/x-ndjson"
+
+    # Step 3: Assert they are exported by ID, as in the list endpoint
+    exported: list[dict] = [json.loads(line) for line in response.text.splitlines()]
+    listed: list[dict] = (
+        await client.get("/orders", params={"status": "PENDING"})
+    ).json()["items"]
+    assert [order["id"] for order in exported] == [orders[0].id, orders[2].id]
+    assert exported == sorted(listed, key=lambda order: order["id"])
+
+
+async def test_export_orders_csv_scoped_to_user(
+    login_user: tuple[AsyncClient, User],
+    create_order: Order,
+    get_test_session: AsyncSession,
+) -> None:
+    """
+    Test that the CSV export has a row per order line and only the user's orders for other users.
+    """
+
+    # Step 1: Create an order and insert one of another user
+    client, user = login_user
+    order: Order = await create_order(client)
+    async with get_test_session as session:
+        await session.execute(
+            Order.__table__.insert().values(
+                user_id=user.id + 1,
+                customer_name="Other customer",
+                status="PENDING",
+                total_price=10,
+                is_deleted=False,
+            )
+        )
+        result: Result = await session.execute(select(User).filter_by(id=user.id))
+        result.scalars().first().is_superuser = False
+        await session.commit()
+
+    # Step 2: Export the orders of the other user as CSV
+    response: Response = await client.get(
+        "/orders/export", params={"format": "csv", "user_id": user.id + 1}
+    )
+    assert response.status_code == HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/csv")
+
+    # Step 3: Assert only the lines of the user's order are exported
+    rows: list[dict] = list(csv.DictReader(io.StringIO(response.text)))
+    products: list[dict] = (await client.get(f"/orders/{order.id}")).json()["products"]
+    assert tuple(rows[0]) == ORDER_CSV_COLUMNS
+    assert [
+        (int(row["order_ref"]), row["product_name"], int(row["quantity"]))
+        for row in rows
+    ] == [(order.id, product["name"], product["quantity"]) for product in products]
+
+
+async def test_export_streams_after_request_session_closed(
+    monkeypatch,
+    login_user: tuple[AsyncClient, User],
+    create_order: Order,
+) -> None:
+    """
+    Test that the export does not read on the request's session, which is closed
+    before the body is sent.
+    """
+
+    # Step 1: Create two orders
+    client, _ = login_user
+    orders: list[Order] = [await create_order(client), await create_order(client)]
+
+    # Step 2: Mark the sessions of the requests once their request has ended
+    async def override_get_read_session() -> AsyncGenerator[AsyncSession, Any]:
+        async with TestingSessionLocal() as session:
+            try:
+                yield session
+            finally:
+                session.info["closed"] = True
+
+    monkeypatch.setitem(
+        app.dependency_overrides, get_read_session, override_get_read_session
+    )
+
+    # Step 3: Fail exports streamed on a closed request session
+    stream_rows_by_filter = OrdersRepository.stream_rows_by_filter
+
+    async def checked_stream_rows_by_filter(self, filters, batch_size):
+        assert not self.session.info.get("closed"), "The request session was closed"
+        async for rows in stream_rows_by_filter(self, filters, batch_size):
+            yield rows
+
+    monkeypatch.setattr(
+        OrdersRepository, "stream_rows_by_filter", checked_stream_rows_by_filter
+    )
+
+    # Step 4: Assert the export contains both orders
+    response: Response = await client.get("/orders/export")
+    assert response.status_code == HTTP_200_OK
+    assert [json.loads(line)["id"] for line in response.text.splitlines()] == [
+        order.id for order in orders
+    ]
+
+
+def resident_memory() -> int:
+    """Return the resident set size of the process in bytes."""
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/statm"), reason="needs /proc")
+async def test_export_memory_does_not_grow_with_orders(
+    login_user: tuple[AsyncClient, User],
+    get_test_session: AsyncSession,
+) -> None:
+    """
+    Test that exporting a million orders keeps the resident memory under a fixed ceiling.
+    """
+
+    # Step 1: Seed a million orders with a line each
+    client, user = login_user
+    count: int = 1_000_000
+    async with get_test_session as session:
+        await session.execute(
+            text(
+                "INSERT INTO products (name, price, created_at, updated_at, is_deleted) "
+                "VALUES ('seeded', 1, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, 0)"
+            )
+        )
+        await session.execute(
+            text(
+                "WITH RECURSIVE seq(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM seq "
+                "WHERE n < :count) INSERT INTO orders (id, user_id, customer_name, "
+                "status, total_price, created_at, updated_at, is_deleted) SELECT n, "
+                ":user_id, 'Seeded', 'PENDING', 1, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, 0 "
+                "FROM seq"
+            ),
+            {"count": count, "user_id": user.id},
+        )
+        await session.execute(
+            text(
+                "INSERT INTO order_product_association "
+                "(order_id, product_id, quantity, price, created_at) "
+                "SELECT id, (SELECT id FROM products), 1, 1, created_at FROM orders"
+            )
+        )
+        await session.commit()
+
+    # Step 2: Stream the export through the application, discarding the body
+    exported: list[int] = [0, 0]
+    ceiling: int = resident_memory() + 64 * 1024 * 1024
+
+    requests: list[dict] = [{"type": "http.request", "body": b"", "more_body": False}]
+    disconnected: asyncio.Event = asyncio.Event()
+
+    async def receive() -> dict:
+        if requests:
+            return requests.pop()
+        # The client stays connected until the whole body is sent.
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict) -> None:
+        if message["type"] == "http.response.start":
+            exported.append(message["status"])
+        elif message["type"] == "http.response.body":
+            exported[0] += message["body"].count(b"\n")
+            exported[1] = max(exported[1], resident_memory())
+
+    await app(
+        {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": "/orders/export",
+            "raw_path": b"/orders/export",
+            "query_string": b"",
+            "root_path": "",
+            "headers": [
+                (b"host", b"testserver"),
+                (b"authorization", client.headers["Authorization"].encode()),
+            ],
+            "client": ("testclient", 50000),
+            "server": ("testserver", 80),
+        },
+        receive,
+        send,
+    )
+
+    # Step 3: Assert every order was exported under the memory ceiling
+    assert exported[2] == HTTP_200_OK
+    assert exported[0] == count
+    assert exported[1] < ceiling
@@ -0,0 +1,89 @@
+from typing import Any, Generator
+
+import pytest_asyncio
+from fakeredis.aioredis import FakeRedis
+from fastapi_users_db_sqlalchemy import SQLAlchemyUserDatabase
+from httpx import AsyncClient, Response
+from starlette.status import HTTP_200_OK, HTTP_204_NO_CONTENT, HTTP_401_UNAUTHORIZED
+
+from app.core.security import get_database_strategy, get_jwt_strategy
+from app.domain.models import User, Order
+from app.infrastructure.auth_cache import invalidate_user
+from app.main import app
+
+
+@pytest_asyncio.fixture
+async def jwt_strategy(shared_redis: FakeRedis) -> Generator[FakeRedis, Any, None]:
+    """Switch the authentication backend to the JWT strategy."""
+    app.dependency_overrides[get_database_strategy] = get_jwt_strategy
+    yield shared_redis
+    app.dependency_overrides.pop(get_database_strategy)
+
+
+async def test_jwt_read_needs_no_database(
+    monkeypatch,
+    jwt_strategy: FakeRedis,
+    login_user: tuple[AsyncClient, User],
+    create_order: Order,
+) -> None:
+    """
+    Test that a JWT is accepted without looking the user up in the database.
+    """
+
+    # Step 1: Login as a user and create an order
+    client, user = login_user
+    order: Order = await create_order(client)
+
+    # Step 2: Fail on any user lookup and read the order
+    async def failing_get(self, id):
+        raise AssertionError("The user table must not be queried")
+
+    monkeypatch.setattr(SQLAlchemyUserDatabase, "get", failing_get)
+    response: Response = await client.get(f"/orders/{order.id}")
+
+    # Step 3: Assert the order is returned
+    assert response.status_code == HTTP_200_OK, response.json()
+    assert response.json()["id"] == order.id
+
+
+async def test_jwt_logout_revokes_token(
+    jwt_strategy: FakeRedis,
+    login_user: tuple[AsyncClient, User],
+    create_order: Order,
+) -> None:
+    """
+    Test that a JWT is rejected after logout.
+    """
+
+    # Step 1: Login as a user and create an order
+    client, user = login_user
+    order: Order = await create_order(client)
+
+    # Step 2: Logout
+    response: Response = await client.post("/auth/logout")
+    assert response.status_code == HTTP_204_NO_CONTENT
+
+    # Step 3: Assert the token is rejected
+    response = await client.get(f"/orders/{order.id}")
+    assert response.status_code == HTTP_401_UNAUTHORIZED
+
+
+async def test_jwt_rejected_after_user_change(
+    jwt_strategy: FakeRedis,
+    login_user: tuple[AsyncClient, User],
+    create_order: Order,
+) -> None:
+    """
+    Test that JWTs issued before a user change are rejected.
+    """
+
+    # Step 1: Login as a user and create an order
+    client, user = login_user
+    order: Order = await create_order(client)
+
+    # Step 2: Invalidate the user as the user manager does on update
+    await invalidate_user(jwt_strategy, user.id)
+
+    # Step 3: Assert the old token is rejected
+    response: Response = await client.get(f"/orders/{order.id}")
+    assert response.status_code == HTTP_401_UNAUTHORIZED
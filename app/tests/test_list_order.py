@@ -4,6 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.status import HTTP_200_OK, HTTP_400_BAD_REQUEST, HTTP_401_UNAUTHORIZED
 
 from app.domain.models import User, Order
+from app.domain.schemas.order import OrderRead
 
 
 async def test_success_get_all_orders(
@@ -36,7 +37,7 @@ async def test_success_get_all_orders(
         result: Result = await session.execute(select(Order))
         orders: list[Order] = result.scalars().all()
 
-    assert len(response.json()) == len(orders)
+    assert len(response.json()["items"]) == len(orders)
 
 
 async def test_success_filter_by_status_orders(
@@ -71,8 +72,8 @@ async def test_success_filter_by_status_orders(
         )
         orders: list[Order] = result.scalars().all()
 
-    assert len(response.json()) == len(orders)
-    assert response.json()[0]["status"] == orders[0].status.value
+    assert len(response.json()["items"]) == len(orders)
+    assert response.json()["items"][0]["status"] == orders[0].status.value
 
 
 async def test_success_filter_by_price_orders(
@@ -129,7 +130,7 @@ async def test_success_filter_by_price_orders(
         result: ScalarResult[Order] = await session.scalars(stmt)
         orders = result.all()
 
-    assert len(response.json()) == len(orders), response.json()
+    assert len(response.json()["items"]) == len(orders), response.json()
 
 
 async def test_bad_request_invalid_status_in_filter(
@@ -216,3 +217,102 @@ async def test_unauthorized_invalid_price_in_filter(
 
     # Step 5: Assert unauthorized response
     assert response.status_code == HTTP_401_UNAUTHORIZED, response.json()
+
+
+async def test_success_paginate_orders(
+    login_user: tuple[AsyncClient, User],
+    create_order: Order,
+    get_test_session: AsyncSession,
+) -> None:
+    """
+    Test walking through all orders page by page with the returned cursors.
+    """
+
+    # Step 1: Login as a user
+    client, user = login_user
+
+    # Step 2: Create more orders than fit in one page
+    for i in range(5):
+        await create_order(client, customer_name=f"Test customer {i}")
+
+    for order_by in ("created_at", "total_price"):
+        # Step 3: Follow next_cursor until the last page
+        ids: list[int] = []
+        cursor: str | None = None
+        while True:
+            params: dict[str, str | int] = {"limit": 2, "order_by": order_by}
+            if cursor is not None:
+                params["cursor"] = cursor
+            response = await client.get("/orders", params=params)
+            assert response.status_code == HTTP_200_OK, response.json()
+            assert len(response.json()["items"]) <= 2
+            ids.extend(item["id"] for item in response.json()["items"])
+            cursor = response.json()["next_cursor"]
+            if cursor is None:
+                break
+
+        # Step 4: Assert every order was returned exactly once
+        async with get_test_session as session:
+            result: Result = await session.execute(select(Order.id))
+            order_ids: list[int] = result.scalars().all()
+
+        assert sorted(ids) == sorted(order_ids), order_by
+
+
+async def test_bad_request_invalid_cursor(
+    login_user: tuple[AsyncClient, User],
+    create_order: Order,
+) -> None:
+    """
+    Test that malformed cursors and cursors of another sort order are rejected.
+    """
+
+    # Step 1: Login as a user and create orders
+    client, user = login_user
+    await create_order(client)
+    await create_order(client)
+
+    # Step 2: Use a malformed cursor
+    response = await client.get("/orders?cursor=not-a-cursor")
+    assert response.status_code == HTTP_400_BAD_REQUEST, response.json()
+    assert response.json()["detail"]["code"] == "invalid_cursor"
+
+    # Step 3: Use a cursor issued for another sort order
+    response = await client.get("/orders?limit=1&order_by=created_at")
+    cursor: str = response.json()["next_cursor"]
+    response = await client.get(f"/orders?order_by=total_price&cursor={cursor}")
+    assert response.status_code == HTTP_400_BAD_REQUEST, response.json()
+    assert response.json()["detail"]["code"] == "invalid_cursor"
+
+
+async def test_list_rows_match_order_read(
+    login_user: tuple[AsyncClient, User],
+    create_order: Order,
+    get_test_session: AsyncSession,
+) -> None:
+    """
+    Test that the listed orders, rendered from plain rows, match the validated orders.
+    """
+
+    # Step 1: Create orders with products
+    client, _ = login_user
+    orders: list[Order] = [
+        await create_order(client),
+        await create_order(
+            client, customer_name="Test customer name", status="CONFIRMED"
+        ),
+    ]
+
+    # Step 2: Load the same orders one by one and validate them
+    async with get_test_session as session:
+        expected: list[dict] = [
+            OrderRead.model_validate(
+                await Order.get_db(session).get_data_by_id(order.id)
+            ).model_dump(mode="json")
+            for order in orders
+        ]
+
+    # Step 3: Assert the list returns identical items
+    response = await client.get("/orders")
+    assert response.status_code == HTTP_200_OK
+    assert sorted(response.json()["items"], key=lambda item: item["id"]) == expected
@@ -0,0 +1,99 @@
+import asyncio
+from contextlib import suppress
+
+from fakeredis.aioredis import FakeRedis
+from httpx import AsyncClient, Response
+from starlette.status import HTTP_200_OK
+
+from app.application.managers.order import OrderManager
+from app.core.config import settings
+from app.domain.models import User, Order
+from app.infrastructure.local_cache import LocalCache, listen_for_invalidations
+
+
+async def test_local_cache_evicts_by_entries_and_size() -> None:
+    """
+    Test that the least recently used entries are evicted over the entry and byte limits.
+    """
+
+    # Step 1: Fill the cache over its entry limit
+    cache: LocalCache = LocalCache(ttl_seconds=60, max_entries=2, max_bytes=100)
+    cache.set("a", 1, 10)
+    cache.set("b", 2, 10)
+    assert cache.get("a") == 1
+    cache.set("c", 3, 10)
+
+    # Step 2: Assert the least recently used entry was evicted
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+
+    # Step 3: Store a large value and assert the byte limit is respected
+    cache.set("d", 4, 95)
+    assert cache.size_bytes <= 100
+    assert len(cache) == 1 and cache.get("d") == 4
+
+
+async def test_local_cache_expires_and_rejects_stale_sets() -> None:
+    """
+    Test TTL expiry and that a value read before an invalidation is not stored.
+    """
+
+    # Step 1: Assert expired entries are not returned
+    cache: LocalCache = LocalCache(ttl_seconds=0, max_entries=10, max_bytes=100)
+    cache.set("a", 1, 1)
+    assert cache.get("a") is None
+
+    # Step 2: Assert a set with an outdated token is ignored
+    cache = LocalCache(ttl_seconds=60, max_entries=10, max_bytes=100)
+    token: int = cache.invalidations
+    cache.delete("a")
+    cache.set("a", 1, 1, token)
+    assert cache.get("a") is None
+
+
+async def test_local_cache_serves_hits_and_is_invalidated_by_other_workers(
+    monkeypatch,
+    shared_redis: FakeRedis,
+    login_user: tuple[AsyncClient, User],
+    create_order: Order,
+) -> None:
+    """
+    Test that order reads fill the local tier and that a published invalidation
+    from another worker drops the entry.
+    """
+
+    # Step 1: Enable the local tier and start the invalidation listener
+    cache: LocalCache = LocalCache(ttl_seconds=60, max_entries=10, max_bytes=10_000)
+    monkeypatch.setattr(OrderManager, "local_cache", cache)
+    listener = asyncio.create_task(
+        listen_for_invalidations(
+            shared_redis, settings.CACHE_INVALIDATION_CHANNEL, [cache]
+        )
+    )
+    while cache.invalidations == 0:
+        # The listener clears the cache once it has subscribed.
+        await asyncio.sleep(0.01)
+
+    # Step 2: Create and read an order, which fills the local tier
+    client, user = login_user
+    invalidations: int = cache.invalidations
+    order: Order = await create_order(client)
+    while cache.invalidations < invalidations + 2:
+        # Wait until the listener has also received the create's own invalidation.
+        await asyncio.sleep(0.01)
+    response: Response = await client.get(f"/orders/{order.id}")
+    assert response.status_code == HTTP_200_OK, response.json()
+    key: str = OrderManager.order_cache_key(order.id)
+    assert cache.get(key)[0] == user.id
+
+    # Step 3: Publish an invalidation as another worker would
+    await shared_redis.publish(settings.CACHE_INVALIDATION_CHANNEL, key)
+    for _ in range(50):
+        if cache.get(key) is None:
+            break
+        await asyncio.sleep(0.05)
+    assert cache.get(key) is None
+
+    listener.cancel()
+    with suppress(asyncio.CancelledError):
+        await listener
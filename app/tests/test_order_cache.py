@@ -0,0 +1,208 @@
+from fakeredis.aioredis import FakeRedis
+from httpx import AsyncClient, Response
+from sqlalchemy import event
+from starlette.responses import JSONResponse
+from starlette.status import HTTP_200_OK, HTTP_201_CREATED, HTTP_404_NOT_FOUND
+
+from app.application.managers.order import OrderManager
+from app.core.config import settings
+from app.domain.models import User, Order
+from app.tests.conftest import engine
+
+
+async def login_another_user(async_client: AsyncClient, email: str) -> None:
+    """Register a regular user and replace the client's bearer token with theirs."""
+    response: Response = await async_client.post(
+        url="/auth/register",
+        json={"email": email, "password": "password"},
+    )
+    assert response.status_code == HTTP_201_CREATED
+
+    response = await async_client.post(
+        url="/auth/login",
+        data={"grant_type": "password", "username": email, "password": "password"},
+    )
+    assert response.status_code == HTTP_200_OK
+    async_client.headers.update(
+        {"Authorization": f"Bearer {response.json()['access_token']}"}
+    )
+
+
+async def test_cached_order_has_versioned_key_and_ttl(
+    shared_redis: FakeRedis,
+    login_user: tuple[AsyncClient, User],
+    create_order: Order,
+) -> None:
+    """
+    Test that a created order is cached under the versioned key with a bounded TTL.
+    """
+
+    # Step 1: Login as a user and create an order
+    client, user = login_user
+    order: Order = await create_order(client)
+
+    # Step 2: Assert the cache key carries the schema/deploy version and a TTL
+    key: str = OrderManager.order_cache_key(order.id)
+    assert key.startswith(settings.CACHE_KEY_PREFIX)
+    ttl: int = await shared_redis.ttl(key)
+    assert 0 < ttl <= settings.ORDER_CACHE_TTL_SECONDS
+
+
+async def test_cached_order_checks_owner(
+    shared_redis: FakeRedis,
+    login_user: tuple[AsyncClient, User],
+    create_order: Order,
+    test_hash: str,
+) -> None:
+    """
+    Test that a cached order is not served to a user who does not own it.
+    """
+
+    # Step 1: Login as a user and create an order, which fills the cache
+    client, user = login_user
+    order: Order = await create_order(client)
+    assert await shared_redis.exists(OrderManager.order_cache_key(order.id))
+
+    # Step 2: Login as another regular user
+    await login_another_user(client, f"another_{test_hash}@gmail.com")
+
+    # Step 3: Assert the cached order is not visible to them
+    response: Response = await client.get(f"/orders/{order.id}")
+    assert response.status_code == HTTP_404_NOT_FOUND, response.json()
+
+
+async def test_cache_invalidated_on_update_and_delete(
+    shared_redis: FakeRedis,
+    login_user: tuple[AsyncClient, User],
+    create_order: Order,
+) -> None:
+    """
+    Test that updating an order refreshes the cache and deleting it drops the entry.
+    """
+
+    # Step 1: Login as a user and create an order
+    client, user = login_user
+    order: Order = await create_order(client)
+
+    # Step 2: Update the order and read it back through the cache
+    response: Response = await client.patch(
+        url=f"/orders/{order.id}",
+        json={"customer_name": "Updated customer"},
+    )
+    assert response.status_code == HTTP_200_OK, response.json()
+
+    response = await client.get(f"/orders/{order.id}")
+    assert response.json()["customer_name"] == "Updated customer"
+
+    # Step 3: Delete the order and assert the cache entry is gone
+    response = await client.delete(f"/orders/{order.id}")
+    assert response.status_code == HTTP_200_OK, response.json()
+    assert not await shared_redis.exists(OrderManager.order_cache_key(order.id))
+
+    response = await client.get(f"/orders/{order.id}")
+    assert response.status_code == HTTP_404_NOT_FOUND, response.json()
+
+
+async def test_stale_fill_is_skipped_after_invalidation(
+    get_test_redis: FakeRedis,
+) -> None:
+    """
+    Test that a cache fill started before an invalidation does not store stale data.
+    """
+
+    # Step 1: Observe a miss and its generation
+    manager: OrderManager = OrderManager(order_repository=None, redis=get_test_redis)
+    cached, generation = await manager.get_cached_order(1)
+    assert cached is None
+
+    # Step 2: Invalidate the order concurrently, then try to fill with stale data
+    await manager.delete_cached_order(1)
+    await manager.fill_cached_order(1, {"id": 1, "user_id": 1}, generation)
+
+    # Step 3: Assert nothing was cached
+    cached, _ = await manager.get_cached_order(1)
+    assert cached is None
+
+
+async def test_cached_body_matches_json_response() -> None:
+    """
+    Test that the cached body is rendered exactly like a JSONResponse of the order.
+    """
+
+    # Step 1: Pack an order with non-ASCII data
+    data: dict = {"id": 1, "user_id": 7, "customer_name": "Клиент", "products": []}
+    user_id, body = OrderManager.unpack_order(OrderManager.pack_order(data))
+
+    # Step 2: Assert the owner and the body are preserved
+    assert user_id == 7
+    assert body == JSONResponse(content=data).body
+
+
+async def test_update_takes_products_from_cache(
+    shared_redis: FakeRedis,
+    login_user: tuple[AsyncClient, User],
+    create_order: Order,
+) -> None:
+    """
+    Test that an update of a cached order returns its products without querying them.
+    """
+
+    # Step 1: Login as a user and create an order, which fills the cache
+    client, user = login_user
+    order: Order = await create_order(client)
+    response: Response = await client.get(f"/orders/{order.id}")
+    products: list[dict] = response.json()["products"]
+
+    # Step 2: Update the order while recording the statements sent
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, *args) -> None:
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    try:
+        response = await client.patch(
+            f"/orders/{order.id}", json={"customer_name": "Updated customer"}
+        )
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+    # Step 3: Assert the response is complete and products were not queried
+    assert response.status_code == HTTP_200_OK
+    assert response.json()["customer_name"] == "Updated customer"
+    assert response.json()["products"] == products
+    assert not any("FROM products" in statement for statement in statements)
+    assert sum(statement.startswith("UPDATE orders") for statement in statements) == 1
+
+
+async def test_update_checks_owner(
+    login_user: tuple[AsyncClient, User],
+    create_order: Order,
+    test_hash: str,
+) -> None:
+    """
+    Test that a user cannot update an order they do not own.
+    """
+
+    # Step 1: Create an order, then switch to another regular user
+    client, user = login_user
+    order: Order = await create_order(client)
+    customer_name: str = order.customer_name
+    await login_another_user(client, f"other_{test_hash}@gmail.com")
+
+    # Step 2: Assert the update is rejected as not found
+    response: Response = await client.patch(
+        f"/orders/{order.id}", json={"customer_name": "Hijacked"}
+    )
+    assert response.status_code == HTTP_404_NOT_FOUND
+
+    # Step 3: Assert the order is unchanged for its owner
+    response = await client.post(
+        url="/auth/login",
+        data={"grant_type": "password", "username": user.email, "password": "password"},
+    )
+    client.headers.update(
+        {"Authorization": f"Bearer {response.json()['access_token']}"}
+    )
+    response = await client.get(f"/orders/{order.id}")
+    assert response.json()["customer_name"] == customer_name
@@ -0,0 +1,137 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy import Select, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.models import Order, Product, User, order_product_association_table
+from app.domain.models.order import StatusEnum
+
+
+async def explain(session: AsyncSession, stmt: Select) -> str:
+    """Return SQLite's query plan for the statement as a single string."""
+    sql: str = str(
+        stmt.compile(
+            dialect=session.bind.dialect,
+            compile_kwargs={"literal_binds": True},
+        )
+    )
+    result = await session.execute(text(f"EXPLAIN QUERY PLAN {sql}"))
+    return "\n".join(row[-1] for row in result.all())
+
+
+def assert_uses_index(plan: str, table: str) -> None:
+    """Assert the table is reached through an index rather than a full scan."""
+    assert f"SCAN {table}\n" not in f"{plan}\n", plan
+    assert (
+        "USING INDEX" in plan
+        or "USING COVERING INDEX" in plan
+        or "USING INTEGER PRIMARY KEY" in plan
+    ), plan
+
+
+@pytest_asyncio.fixture
+async def seeded_orders(
+    get_test_session: AsyncSession,
+    login_user: tuple[AsyncClient, User],
+) -> tuple[AsyncSession, User]:
+    """Seed enough orders for the planner to prefer the indexes, then ANALYZE."""
+    _, user = login_user
+    session: AsyncSession = get_test_session
+    started_at: datetime = datetime(2025, 1, 1)
+    statuses: list[StatusEnum] = list(StatusEnum)
+    session.add_all(
+        Order(
+            user_id=user.id,
+            customer_name=f"customer {i}",
+            status=statuses[i % len(statuses)],
+            total_price=Decimal(i % 1000),
+            created_at=started_at + timedelta(minutes=i),
+            is_deleted=i % 10 == 0,
+        )
+        for i in range(2000)
+    )
+    await session.commit()
+    await session.execute(text("ANALYZE"))
+    return session, user
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {},
+        {"user_id": 1},
+        {"status": StatusEnum.CONFIRMED},
+        {"user_id": 1, "status": StatusEnum.PENDING},
+    ],
+)
+async def test_order_list_uses_index(
+    seeded_orders: tuple[AsyncSession, User],
+    filters: dict[str, Any],
+) -> None:
+    """
+    Test that the order list query and its next page are served by an index.
+    """
+
+    # Step 1: Build the first and the next page queries for the filters
+    session, _ = seeded_orders
+    repository = Order.get_db(session)
+    statements: list[Select] = [
+        repository.filter_statement(filters, limit=51),
+        repository.filter_statement(
+            filters, limit=51, after=(datetime(2025, 1, 1, 12), 720)
+        ),
+    ]
+
+    # Step 2: Assert neither plan scans the whole orders table
+    for stmt in statements:
+        assert_uses_index(await explain(session, stmt), "orders")
+
+
+async def test_order_list_by_price_uses_index(
+    seeded_orders: tuple[AsyncSession, User],
+) -> None:
+    """
+    Test that ordering by total price is served by the price index.
+    """
+
+    # Step 1: Build the price range query sorted by price
+    session, _ = seeded_orders
+    stmt: Select = Order.get_db(session).filter_statement(
+        {"min_price": 100, "max_price": 200}, limit=51, order_by="total_price"
+    )
+
+    # Step 2: Assert the plan uses the price index
+    plan: str = await explain(session, stmt)
+    assert_uses_index(plan, "orders")
+    assert "ix_orders_total_price" in plan
+
+
+async def test_order_detail_and_products_use_index(
+    seeded_orders: tuple[AsyncSession, User],
+) -> None:
+    """
+    Test that the order detail query and the products loaded with it use indexes.
+    """
+
+    # Step 1: Build the detail query and the query selectinload issues for products
+    session, user = seeded_orders
+    detail: Select = Order.get_db(session).get_by_id_statement(100, user.id)
+    products: Select = (
+        select(Product)
+        .join(
+            order_product_association_table,
+            order_product_association_table.c.product_id == Product.id,
+        )
+        .where(order_product_association_table.c.order_id.in_([100, 101, 102]))
+    )
+
+    # Step 2: Assert both plans are index lookups
+    assert_uses_index(await explain(session, detail), "orders")
+    plan: str = await explain(session, products)
+    assert_uses_index(plan, "order_product_association")
+    assert_uses_index(plan, "products")
@@ -0,0 +1,182 @@
+import os
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional
+
+import pytest
+from httpx import AsyncClient, Response
+from sqlalchemy import select, text, update
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from starlette.status import HTTP_200_OK, HTTP_400_BAD_REQUEST
+
+from app.domain.models import User, Order, order_product_association_table
+from app.infrastructure.partitions import (
+    add_months,
+    create_order_partitions,
+    partition_statements,
+)
+from app.tests.conftest import engine
+
+POSTGRES_URL: Optional[str] = os.environ.get("TEST_POSTGRES_URL")
+
+
+async def test_partition_statements_cover_consecutive_months() -> None:
+    """
+    Test that monthly partitions are built across year boundaries without gaps.
+    """
+
+    # Step 1: Build the partitions of three months starting in November
+    statements: list[str] = partition_statements("orders", date(2026, 11, 1), 3)
+
+    # Step 2: Assert each month starts where the previous one ended
+    assert add_months(date(2026, 11, 17), 2) == date(2027, 1, 1)
+    assert statements == [
+        "CREATE TABLE IF NOT EXISTS orders_p202611 PARTITION OF orders "
+        "FOR VALUES FROM ('2026-11-01') TO ('2026-12-01')",
+        "CREATE TABLE IF NOT EXISTS orders_p202612 PARTITION OF orders "
+        "FOR VALUES FROM ('2026-12-01') TO ('2027-01-01')",
+        "CREATE TABLE IF NOT EXISTS orders_p202701 PARTITION OF orders "
+        "FOR VALUES FROM ('2027-01-01') TO ('2027-02-01')",
+    ]
+
+
+async def test_partition_maintenance_skips_sqlite() -> None:
+    """
+    Test that partition maintenance does nothing on databases without partitioning.
+    """
+
+    # Step 1: Assert no statement is executed on SQLite
+    assert await create_order_partitions(engine) == 0
+
+
+@pytest.mark.skipif(POSTGRES_URL is None, reason="TEST_POSTGRES_URL is not set")
+async def test_partition_maintenance_moves_default_rows() -> None:
+    """
+    Test that rows written to the default partition before their month's partition
+    exists are moved into it when it is created.
+    """
+
+    # Step 1: Create partitioned tables with a row of a future month in the default partition
+    postgres_engine: AsyncEngine = create_async_engine(
+        POSTGRES_URL,
+        connect_args={"server_settings": {"search_path": "partitions_test"}},
+    )
+    month: date = add_months(datetime.now(timezone.utc).date(), 2)
+    async with postgres_engine.begin() as conn:
+        await conn.execute(text("DROP SCHEMA IF EXISTS partitions_test CASCADE"))
+        await conn.execute(text("CREATE SCHEMA partitions_test"))
+        for table in ("orders", "order_product_association"):
+            await conn.execute(
+                text(
+                    f"CREATE TABLE {table} (id integer, created_at timestamp) "
+                    f"PARTITION BY RANGE (created_at)"
+                )
+            )
+            await conn.execute(
+                text(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+            )
+            await conn.execute(
+                text(f"INSERT INTO {table} VALUES (1, '{month.isoformat()} 12:00')")
+            )
+
+    # Step 2: Create the partitions and assert the rows moved into theirs
+    try:
+        assert await create_order_partitions(postgres_engine, months_ahead=3) == 14
+        async with postgres_engine.connect() as conn:
+            for table in ("orders", "order_product_association"):
+                rows: list = list(
+                    await conn.execute(
+                        text(f"SELECT tableoid::regclass, id FROM {table}")
+                    )
+                )
+                assert [(str(name), id) for name, id in rows] == [
+                    (f"{table}_p{month:%Y%m}", 1)
+                ]
+
+        # Step 3: Assert running the maintenance again only checks the partitions
+        assert await create_order_partitions(postgres_engine, months_ahead=3) == 6
+    finally:
+        async with postgres_engine.begin() as conn:
+            await conn.execute(text("DROP SCHEMA partitions_test CASCADE"))
+        await postgres_engine.dispose()
+
+
+async def test_lines_share_order_created_at(
+    login_user: tuple[AsyncClient, User],
+    create_order: Order,
+    get_test_session: AsyncSession,
+) -> None:
+    """
+    Test that order lines are stored with the creation time of their order.
+    """
+
+    # Step 1: Create an order
+    client, _ = login_user
+    order: Order = await create_order(client)
+
+    # Step 2: Assert every line carries the order's creation time
+    async with get_test_session as session:
+        created_at: list[datetime] = list(
+            await session.scalars(
+                select(order_product_association_table.c.created_at).where(
+                    order_product_association_table.c.order_id == order.id
+                )
+            )
+        )
+    assert created_at == [order.created_at] * len(created_at)
+    assert created_at
+
+
+async def test_success_filter_orders_by_created_at(
+    login_user: tuple[AsyncClient, User],
+    create_order: Order,
+    get_test_session: AsyncSession,
+) -> None:
+    """
+    Test that listing and statistics can be restricted to a creation time range.
+    """
+
+    # Step 1: Create two orders and move the first one back by ten days
+    client, _ = login_user
+    old_order: Order = await create_order(client, status="PENDING")
+    new_order: Order = await create_order(client, status="PENDING")
+    async with get_test_session as session:
+        await session.execute(
+            update(Order)
+            .where(Order.id == old_order.id)
+            .values(created_at=old_order.created_at - timedelta(days=10))
+        )
+        await session.commit()
+    since: str = (new_order.created_at - timedelta(days=1)).isoformat()
+
+    # Step 2: Assert only the recent order is listed and counted
+    response: Response = await client.get("/orders", params={"created_from": since})
+    assert response.status_code == HTTP_200_OK
+    assert [item["id"] for item in response.json()["items"]] == [new_order.id]
+    response = await client.get("/orders/stats", params={"created_from": since})
+    assert response.json()["items"][0]["count"] == 1
+
+    # Step 3: Assert only the old order is listed before that time
+    response = await client.get("/orders", params={"created_to": since})
+    assert [item["id"] for item in response.json()["items"]] == [old_order.id]
+
+
+async def test_bad_request_invalid_created_at_range(
+    login_user: tuple[AsyncClient, User],
+) -> None:
+    """
+    Test that a time range ending before it starts is rejected.
+    """
+
+    # Step 1: List orders with an inverted time range
+    client, _ = login_user
+    response: Response = await client.get(
+        "/orders",
+        params={
+            "created_from": "2026-10-02T00:00:00Z",
+            "created_to": "2026-10-01T00:00:00Z",
+        },
+    )
+
+    # Step 2: Assert the range is rejected
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["detail"]["code"] == "invalid_date_range"
@@ -0,0 +1,179 @@
+import asyncio
+from typing import Any, AsyncGenerator
+
+from fakeredis.aioredis import FakeRedis
+from httpx import AsyncClient, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.status import HTTP_200_OK, HTTP_404_NOT_FOUND
+
+from app.application.managers.order import OrderManager
+from app.domain.models import User, Order
+from app.domain.repositories.orders import OrdersRepository
+from app.infrastructure.db import get_read_session
+from app.main import app
+from app.tests.conftest import TestingSessionLocal
+
+
+async def test_concurrent_misses_load_order_once(
+    monkeypatch,
+    shared_redis: FakeRedis,
+    login_user: tuple[AsyncClient, User],
+    create_order: Order,
+) -> None:
+    """
+    Test that concurrent cache misses for the same order run a single database load.
+    """
+
+    # Step 1: Login as a user, create an order and drop it from the cache
+    client, user = login_user
+    order: Order = await create_order(client)
+    await shared_redis.delete(OrderManager.order_cache_key(order.id))
+
+    # Step 2: Count and slow down database loads
+    loads: list[int] = []
+    get_data_by_id = OrdersRepository.get_data_by_id
+
+    async def counting_get_data_by_id(self, object_id):
+        loads.append(object_id)
+        await asyncio.sleep(0.1)
+        return await get_data_by_id(self, object_id)
+
+    monkeypatch.setattr(OrdersRepository, "get_data_by_id", counting_get_data_by_id)
+
+    # Step 3: Read the order concurrently
+    responses: list[Response] = await asyncio.gather(
+        *[client.get(f"/orders/{order.id}") for _ in range(5)]
+    )
+
+    # Step 4: Assert every request succeeded with a single database load
+    assert all(response.status_code == HTTP_200_OK for response in responses)
+    assert all(response.json()["id"] == order.id for response in responses)
+    assert loads == [order.id]
+
+
+async def test_miss_waits_for_loader_in_another_process(
+    monkeypatch,
+    shared_redis: FakeRedis,
+    login_user: tuple[AsyncClient, User],
+    create_order: Order,
+) -> None:
+    """
+    Test that a miss waits for the cache to be filled while another process holds the lock.
+    """
+
+    # Step 1: Login as a user, create an order and keep its cached data
+    client, user = login_user
+    order: Order = await create_order(client)
+    key: str = OrderManager.order_cache_key(order.id)
+    value: bytes = await shared_redis.get(key)
+    await shared_redis.delete(key)
+
+    # Step 2: Hold the lock as another process and fail on any database load
+    await shared_redis.set(OrderManager.order_lock_key(order.id), "other", px=3000)
+
+    async def failing_get_data_by_id(self, object_id):
+        raise AssertionError("The database must not be queried")
+
+    monkeypatch.setattr(OrdersRepository, "get_data_by_id", failing_get_data_by_id)
+
+    async def fill_later() -> None:
+        await asyncio.sleep(0.2)
+        await shared_redis.set(key, value)
+
+    # Step 3: Read the order while the other process fills the cache
+    response, _ = await asyncio.gather(client.get(f"/orders/{order.id}"), fill_later())
+
+    # Step 4: Assert the order was served from the cache filled by the other process
+    assert response.status_code == HTTP_200_OK, response.json()
+    assert response.json()["id"] == order.id
+
+
+async def test_miss_stops_waiting_when_loader_finds_order_missing(
+    monkeypatch,
+    shared_redis: FakeRedis,
+    login_user: tuple[AsyncClient, User],
+) -> None:
+    """
+    Test that a miss waiting for another process returns as soon as it reports the order missing.
+    """
+
+    # Step 1: Hold the lock of an unknown order as another process and fail on any database load
+    client, _ = login_user
+    order_id: int = 999_999
+    lock_key: str = OrderManager.order_lock_key(order_id)
+    await shared_redis.set(lock_key, "other", px=3000)
+
+    async def failing_get_data_by_id(self, object_id):
+        raise AssertionError("The database must not be queried")
+
+    monkeypatch.setattr(OrdersRepository, "get_data_by_id", failing_get_data_by_id)
+
+    async def report_missing() -> None:
+        await asyncio.sleep(0.1)
+        await shared_redis.set(OrderManager.order_missing_key(order_id), 1, px=1000)
+        await shared_redis.delete(lock_key)
+
+    # Step 2: Read the order while the other process finds it missing
+    started: float = asyncio.get_running_loop().time()
+    response, _ = await asyncio.gather(
+        client.get(f"/orders/{order_id}"), report_missing()
+    )
+
+    # Step 3: Assert the miss was answered without waiting for the whole lock wait
+    assert response.status_code == HTTP_404_NOT_FOUND
+    assert asyncio.get_running_loop().time() - started < 0.5
+
+
+async def test_load_survives_cancelled_first_caller(
+    monkeypatch,
+    shared_redis: FakeRedis,
+    login_user: tuple[AsyncClient, User],
+    create_order: Order,
+) -> None:
+    """
+    Test that a coalesced load does not use the session of the request that started
+    it, so that cancelling that request does not fail the requests waiting for it.
+    """
+
+    # Step 1: Login as a user, create an order and drop it from the cache
+    client, user = login_user
+    order: Order = await create_order(client)
+    await shared_redis.delete(OrderManager.order_cache_key(order.id))
+
+    # Step 2: Mark the sessions of the requests once their request has ended
+    async def override_get_read_session() -> AsyncGenerator[AsyncSession, Any]:
+        async with TestingSessionLocal() as session:
+            try:
+                yield session
+            finally:
+                session.info["closed"] = True
+
+    monkeypatch.setitem(
+        app.dependency_overrides, get_read_session, override_get_read_session
+    )
+
+    # Step 3: Slow down database loads and fail those running on a closed request session
+    loads: list[int] = []
+    get_data_by_id = OrdersRepository.get_data_by_id
+
+    async def slow_get_data_by_id(self, object_id):
+        loads.append(object_id)
+        await asyncio.sleep(0.2)
+        assert not self.session.info.get("closed"), "The request session was closed"
+        return await get_data_by_id(self, object_id)
+
+    monkeypatch.setattr(OrdersRepository, "get_data_by_id", slow_get_data_by_id)
+
+    # Step 4: Start a read, join it with a second one and cancel the first
+    first: asyncio.Task = asyncio.create_task(client.get(f"/orders/{order.id}"))
+    while not loads:
+        await asyncio.sleep(0.01)
+    second: asyncio.Task = asyncio.create_task(client.get(f"/orders/{order.id}"))
+    await asyncio.sleep(0.05)
+    first.cancel()
+
+    # Step 5: Assert the second read is served by the single load
+    response: Response = await second
+    assert response.status_code == HTTP_200_OK
+    assert response.json()["id"] == order.id
+    assert loads == [order.id]
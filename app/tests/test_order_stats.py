@@ -0,0 +1,150 @@
+from decimal import Decimal
+
+from fakeredis.aioredis import FakeRedis
+from httpx import AsyncClient, Response
+from sqlalchemy import Result, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.status import HTTP_200_OK, HTTP_400_BAD_REQUEST
+
+from app.domain.models import User, Order
+
+
+async def insert_order(session: AsyncSession, user_id: int, total_price: str) -> None:
+    """Insert a pending order of another user directly into the database."""
+    await session.execute(
+        Order.__table__.insert().values(
+            user_id=user_id,
+            customer_name="Other customer",
+            status="PENDING",
+            total_price=Decimal(total_price),
+            is_deleted=False,
+        )
+    )
+    await session.commit()
+
+
+async def test_success_get_orders_stats(
+    login_user: tuple[AsyncClient, User],
+    create_order: Order,
+) -> None:
+    """
+    Test that the statistics match the orders of each status.
+    """
+
+    # Step 1: Create two pending orders and a confirmed one
+    client, _ = login_user
+    pending: list[Order] = [
+        await create_order(client, status="PENDING"),
+        await create_order(client, status="PENDING"),
+    ]
+    confirmed: Order = await create_order(client, status="CONFIRMED")
+
+    # Step 2: Retrieve the statistics
+    response: Response = await client.get("/orders/stats")
+    assert response.status_code == HTTP_200_OK
+    items: dict[str, dict] = {item["status"]: item for item in response.json()["items"]}
+
+    # Step 3: Assert the aggregates of each status
+    totals: list[float] = [float(order.total_price) for order in pending]
+    assert items["PENDING"] == {
+        "status": "PENDING",
+        "count": 2,
+        "total": sum(totals),
+        "avg": round(sum(totals) / 2, 2),
+        "min": min(totals),
+        "max": max(totals),
+    }
+    assert items["CONFIRMED"]["count"] == 1
+    assert items["CONFIRMED"]["total"] == float(confirmed.total_price)
+    assert "CANCELLED" not in items
+
+
+async def test_orders_stats_scoped_to_user(
+    login_user: tuple[AsyncClient, User],
+    create_order: Order,
+    get_test_session: AsyncSession,
+) -> None:
+    """
+    Test that superusers get the statistics of every user and other users only their own.
+    """
+
+    # Step 1: Create an order and insert one of another user
+    client, user = login_user
+    order: Order = await create_order(client, status="PENDING")
+    async with get_test_session as session:
+        await insert_order(session, user.id + 1, "10.00")
+
+    # Step 2: Assert a superuser gets a group per user
+    response: Response = await client.get("/orders/stats", params={"group_by": "user"})
+    assert response.status_code == HTTP_200_OK
+    assert [(item["user_id"], item["count"]) for item in response.json()["items"]] == [
+        (user.id, 1),
+        (user.id + 1, 1),
+    ]
+
+    # Step 3: Set the user as non-superuser
+    async with get_test_session as session:
+        result: Result = await session.execute(select(User).filter_by(id=user.id))
+        result.scalars().first().is_superuser = False
+        await session.commit()
+
+    # Step 4: Assert only the user's own orders are counted, even when filtering by another user
+    response = await client.get("/orders/stats", params={"user_id": user.id + 1})
+    assert response.status_code == HTTP_200_OK
+    assert response.json()["items"] == [
+        {
+            "status": "PENDING",
+            "count": 1,
+            "total": float(order.total_price),
+            "avg": float(order.total_price),
+            "min": float(order.total_price),
+            "max": float(order.total_price),
+        }
+    ]
+
+
+async def test_orders_stats_by_day_are_cached(
+    shared_redis: FakeRedis,
+    login_user: tuple[AsyncClient, User],
+    create_order: Order,
+) -> None:
+    """
+    Test that grouped statistics are served from the cache until it expires.
+    """
+
+    # Step 1: Create an order and retrieve the statistics per day
+    client, _ = login_user
+    order: Order = await create_order(client, status="PENDING")
+    response: Response = await client.get("/orders/stats", params={"group_by": "day"})
+    assert response.status_code == HTTP_200_OK
+    items: list[dict] = response.json()["items"]
+    assert [(item["day"], item["count"]) for item in items] == [
+        (order.created_at.date().isoformat(), 1)
+    ]
+
+    # Step 2: Create another order and assert the cached statistics are returned
+    await create_order(client, status="PENDING")
+    response = await client.get("/orders/stats", params={"group_by": "day"})
+    assert response.json()["items"] == items
+
+    # Step 3: Expire the cache and assert the statistics are computed again
+    for key in await shared_redis.keys("*:orders:stats:*"):
+        await shared_redis.delete(key)
+    response = await client.get("/orders/stats", params={"group_by": "day"})
+    assert response.json()["items"][0]["count"] == 2
+
+
+async def test_bad_request_invalid_status_in_stats(
+    login_user: tuple[AsyncClient, User],
+) -> None:
+    """
+    Test that an invalid status filter is rejected.
+    """
+
+    # Step 1: Retrieve the statistics of an unknown status
+    client, _ = login_user
+    response: Response = await client.get("/orders/stats", params={"status": "unknown"})
+
+    # Step 2: Assert the filter is rejected
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["detail"]["code"] == "invalid_choice"
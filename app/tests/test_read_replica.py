@@ -0,0 +1,270 @@
+import itertools
+import os
+from decimal import Decimal
+from typing import Any, AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from fakeredis.aioredis import FakeRedis
+from httpx import AsyncClient, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from starlette.status import HTTP_200_OK
+
+from app.application.managers.order import OrderManager
+from app.core.config import settings
+from app.domain.models import Product, User, Order
+from app.infrastructure import db
+from app.infrastructure.db import Base, RoutingSession, get_read_session, use_primary
+from app.main import app
+from app.tests.conftest import engine
+
+REPLICA_PATH: str = "./test_replica.db"
+
+
+@pytest_asyncio.fixture
+async def replica_engine() -> AsyncGenerator[AsyncEngine, Any]:
+    """Provide a second SQLite database standing in for a lagging read replica."""
+    replica: AsyncEngine = create_async_engine(f"sqlite+aiosqlite:///{REPLICA_PATH}")
+    async with replica.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield replica
+    await replica.dispose()
+    os.remove(REPLICA_PATH)
+
+
+@pytest_asyncio.fixture
+async def routing_session(
+    replica_engine: AsyncEngine,
+) -> AsyncGenerator[AsyncSession, Any]:
+    """Provide a session bound to the test database that reads from the replica."""
+    session_maker = async_sessionmaker(
+        engine, expire_on_commit=False, sync_session_class=RoutingSession
+    )
+    async with session_maker(info={"replica": replica_engine.sync_engine}) as session:
+        yield session
+
+
+async def product_names(session: AsyncSession) -> list[str]:
+    """Return the names of all products visible to the session."""
+    return list(await session.scalars(select(Product.name).order_by(Product.id)))
+
+
+async def test_reads_go_to_replica_until_write(
+    replica_engine: AsyncEngine,
+    routing_session: AsyncSession,
+) -> None:
+    """
+    Test that reads are served by the replica, and by the primary after a write.
+    """
+
+    # Step 1: Put a product only on the replica
+    async with replica_engine.begin() as conn:
+        await conn.execute(
+            Product.__table__.insert().values(
+                name="replica", price=Decimal("1.00"), is_deleted=False
+            )
+        )
+
+    # Step 2: Assert the read is served by the replica
+    assert await product_names(routing_session) == ["replica"]
+
+    # Step 3: Write a product and assert the session now reads its own write
+    routing_session.add(
+        Product(name="primary", price=Decimal("1.00"), is_deleted=False)
+    )
+    await routing_session.commit()
+    assert await product_names(routing_session) == ["primary"]
+
+
+async def test_use_primary_pins_reads(
+    replica_engine: AsyncEngine,
+    routing_session: AsyncSession,
+) -> None:
+    """
+    Test that a session pinned to the primary no longer reads from the replica.
+    """
+
+    # Step 1: Pin the session before any query
+    use_primary(routing_session)
+
+    # Step 2: Assert the empty primary is read rather than the replica
+    async with replica_engine.begin() as conn:
+        await conn.execute(
+            Product.__table__.insert().values(
+                name="replica", price=Decimal("1.00"), is_deleted=False
+            )
+        )
+    assert await product_names(routing_session) == []
+
+
+async def test_lagging_replica_is_skipped(
+    monkeypatch: pytest.MonkeyPatch,
+    replica_engine: AsyncEngine,
+) -> None:
+    """
+    Test that a replica further behind than DB_REPLICA_MAX_LAG_SECONDS is not used.
+    """
+
+    # Step 1: Configure the replica and make it report a large lag
+    monkeypatch.setattr(db, "replica_engines", [replica_engine])
+    monkeypatch.setattr(db, "replica_cycle", iter([replica_engine] * 2))
+    monkeypatch.setattr(db, "replica_lags", {})
+    lag: list[float] = [settings.DB_REPLICA_MAX_LAG_SECONDS + 1]
+
+    async def measure_replica_lag(replica: AsyncEngine) -> float:
+        return lag[0]
+
+    monkeypatch.setattr(db, "measure_replica_lag", measure_replica_lag)
+    monkeypatch.setattr(settings, "DB_REPLICA_LAG_CHECK_INTERVAL_SECONDS", 0)
+
+    # Step 2: Assert reads fall back to the primary, then use the replica once it catches up
+    assert await db.pick_replica() is None
+    lag[0] = 0.0
+    assert await db.pick_replica() is replica_engine
+
+
+async def test_list_reads_own_writes_from_primary(
+    monkeypatch: pytest.MonkeyPatch,
+    replica_engine: AsyncEngine,
+    shared_redis: FakeRedis,
+    login_user: tuple[AsyncClient, User],
+    create_order: Order,
+) -> None:
+    """
+    Test that a user's orders are listed from the primary right after they write
+    one, and from the (stale) replica once the freshness window has passed.
+    """
+
+    # Step 1: Route the read endpoints to an empty replica
+    monkeypatch.setattr(settings, "DB_REPLICA_URLS", ["sqlite+aiosqlite://"])
+    session_maker = async_sessionmaker(
+        engine, expire_on_commit=False, sync_session_class=RoutingSession
+    )
+
+    async def override_get_read_session() -> AsyncGenerator[AsyncSession, Any]:
+        async with session_maker(
+            info={"replica": replica_engine.sync_engine}
+        ) as session:
+            yield session
+
+    monkeypatch.setitem(
+        app.dependency_overrides, get_read_session, override_get_read_session
+    )
+
+    # Step 2: Create an order and assert the list includes it
+    client, user = login_user
+    order: Order = await create_order(client)
+    response: Response = await client.get("/orders")
+    assert response.status_code == HTTP_200_OK
+    assert [item["id"] for item in response.json()["items"]] == [order.id]
+
+    # Step 3: Expire the freshness marker and assert the replica is read again
+    await shared_redis.delete(OrderManager.user_orders_written_key(user.id))
+    response = await client.get("/orders")
+    assert response.status_code == HTTP_200_OK
+    assert response.json()["items"] == []
+
+
+async def test_list_reads_superuser_writes_from_primary(
+    monkeypatch: pytest.MonkeyPatch,
+    replica_engine: AsyncEngine,
+    shared_redis: FakeRedis,
+    login_user: tuple[AsyncClient, User],
+    get_test_session: AsyncSession,
+) -> None:
+    """
+    Test that a superuser who updates another user's order then lists that user's
+    orders reads them from the primary.
+    """
+
+    # Step 1: Route the read endpoints to an empty replica
+    monkeypatch.setattr(settings, "DB_REPLICA_URLS", ["sqlite+aiosqlite://"])
+    session_maker = async_sessionmaker(
+        engine, expire_on_commit=False, sync_session_class=RoutingSession
+    )
+
+    async def override_get_read_session() -> AsyncGenerator[AsyncSession, Any]:
+        async with session_maker(
+            info={"replica": replica_engine.sync_engine}
+        ) as session:
+            yield session
+
+    monkeypatch.setitem(
+        app.dependency_overrides, get_read_session, override_get_read_session
+    )
+
+    # Step 2: Insert an order of another user and update it as the superuser
+    client, user = login_user
+    owner_id: int = user.id + 1
+    async with get_test_session as session:
+        await session.execute(
+            Order.__table__.insert().values(
+                user_id=owner_id,
+                customer_name="Other customer",
+                status="PENDING",
+                total_price=Decimal("10.00"),
+                is_deleted=False,
+            )
+        )
+        await session.commit()
+        order_id: int = await session.scalar(
+            select(Order.id).filter_by(user_id=owner_id)
+        )
+    response: Response = await client.patch(
+        f"/orders/{order_id}", json={"status": "CONFIRMED"}
+    )
+    assert response.status_code == HTTP_200_OK
+
+    # Step 3: Drop the owner's marker and assert the superuser still reads the primary
+    await shared_redis.delete(OrderManager.user_orders_written_key(owner_id))
+    response = await client.get("/orders", params={"user_id": owner_id})
+    assert response.status_code == HTTP_200_OK
+    assert [item["status"] for item in response.json()["items"]] == ["CONFIRMED"]
+
+
+async def test_retrieve_order_from_configured_sqlite_replica(
+    monkeypatch: pytest.MonkeyPatch,
+    replica_engine: AsyncEngine,
+    login_user: tuple[AsyncClient, User],
+) -> None:
+    """
+    Test that a replica configured in DB_REPLICA_URLS as a second SQLite file serves
+    GET /orders/{id} through the application's own read session.
+    """
+
+    # Step 1: Configure the replica file and route the read sessions through it
+    monkeypatch.setattr(
+        settings, "DB_REPLICA_URLS", [f"sqlite+aiosqlite:///{REPLICA_PATH}"]
+    )
+    replicas: list[AsyncEngine] = db.create_replica_engines()
+    monkeypatch.setattr(db, "replica_engines", replicas)
+    monkeypatch.setattr(db, "replica_cycle", itertools.cycle(replicas))
+    monkeypatch.setattr(db, "replica_lags", {})
+
+    # Step 2: Put an order only on the replica
+    client, user = login_user
+    async with replica_engine.begin() as conn:
+        await conn.execute(
+            Order.__table__.insert().values(
+                id=1,
+                user_id=user.id,
+                customer_name="replica",
+                total_price=Decimal("0.00"),
+                is_deleted=False,
+            )
+        )
+
+    # Step 3: Assert the order is read from the replica
+    try:
+        response: Response = await client.get("/orders/1")
+    finally:
+        for replica in replicas:
+            await replica.dispose()
+    assert response.status_code == HTTP_200_OK
+    assert response.json()["customer_name"] == "replica"
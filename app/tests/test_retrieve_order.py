@@ -40,6 +40,7 @@ async def test_success_retrieve_order(
             .options(selectinload(Order.products))
         )
         order: Order = result.scalar()
+        products: list[dict] = await Order.get_db(session).get_products(order.id)
 
     # Step 6: Assert order details match the response
     assert order.id == response.json()["id"]
@@ -48,11 +49,12 @@ async def test_success_retrieve_order(
     assert order.total_price == response.json()["total_price"]
 
     # Step 7: Assert product details match the response
-    for i in range(len(order.products)):
-        assert order.products[i].id == response.json()["products"][i]["id"]
-        assert order.products[i].name == response.json()["products"][i]["name"]
-        assert order.products[i].price == response.json()["products"][i]["price"]
-        assert order.products[i].quantity == response.json()["products"][i]["quantity"]
+    assert len(order.products) == len(products)
+    for i in range(len(products)):
+        assert products[i]["id"] == response.json()["products"][i]["id"]
+        assert products[i]["name"] == response.json()["products"][i]["name"]
+        assert products[i]["price"] == response.json()["products"][i]["price"]
+        assert products[i]["quantity"] == response.json()["products"][i]["quantity"]
 
 
 async def test_unauthorized_retrieve_order(
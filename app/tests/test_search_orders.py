@@ -0,0 +1,165 @@
+from typing import Any
+
+from httpx import AsyncClient, Response
+from starlette.status import HTTP_200_OK, HTTP_201_CREATED, HTTP_400_BAD_REQUEST
+
+from app.core.config import settings
+from app.domain.models import User, Order
+
+
+async def post_order(client: AsyncClient, customer_name: str, product_name: str) -> int:
+    """Create an order with a single product and return its ID."""
+    response: Response = await client.post(
+        url="/orders",
+        json={
+            "customer_name": customer_name,
+            "status": "PENDING",
+            "products": [{"name": product_name, "price": 10.0, "quantity": 1}],
+        },
+    )
+    assert response.status_code == HTTP_201_CREATED
+    return response.json()["id"]
+
+
+async def search(client: AsyncClient, **params: Any) -> tuple[list[int], Any]:
+    """Search the orders and return the IDs of the page and the next cursor."""
+    response: Response = await client.get("/orders", params=params)
+    assert response.status_code == HTTP_200_OK
+    body: dict[str, Any] = response.json()
+    return [item["id"] for item in body["items"]], body["next_cursor"]
+
+
+async def test_search_ranks_customer_and_product_names(
+    login_user: tuple[AsyncClient, User],
+) -> None:
+    """
+    Test that the search matches customer and product names, ignoring case, most relevant first.
+    """
+
+    # Step 1: Create orders matching the search in different ways, and one that does not
+    client, _ = login_user
+    contains: int = await post_order(client, "Goldsmith Ltd", "Lamp")
+    exact: int = await post_order(client, "Smith", "Chair")
+    product: int = await post_order(client, "Jane Doe", "Smithsonian guide")
+    word: int = await post_order(client, "John Smith", "Desk")
+    prefix: int = await post_order(client, "smithers", "Table")
+    await post_order(client, "Someone else", "Sofa")
+
+    # Step 2: Assert the matches are ranked from the exact name to the product name
+    ids, next_cursor = await search(client, q="SMITH")
+    assert ids == [exact, prefix, word, contains, product]
+    assert next_cursor is None
+
+    # Step 3: Assert another sort key can still be requested
+    ids, _ = await search(client, q="smith", order_by="created_at")
+    assert ids == [prefix, word, product, exact, contains]
+
+
+async def test_search_pages_and_escapes_wildcards(
+    login_user: tuple[AsyncClient, User],
+    create_order: Order,
+) -> None:
+    """
+    Test that search results are paginated by relevance and that LIKE wildcards match literally.
+    """
+
+    # Step 1: Create matching orders of equal relevance, and one with a wildcard in its name
+    client, _ = login_user
+    orders: list[Order] = [
+        await create_order(client, customer_name=f"Acme {i}") for i in range(5)
+    ]
+    wildcard: int = await post_order(client, "100% Acme", "Crate")
+
+    # Step 2: Walk the pages and assert every match is returned once, in rank order
+    pages: list[list[int]] = []
+    next_cursor: Any = None
+    while True:
+        params: dict[str, Any] = {"q": "acme", "limit": 2}
+        if next_cursor is not None:
+            params["cursor"] = next_cursor
+        page, next_cursor = await search(client, **params)
+        pages.append(page)
+        if next_cursor is None:
+            break
+    assert pages == [
+        [orders[4].id, orders[3].id],
+        [orders[2].id, orders[1].id],
+        [orders[0].id, wildcard],
+    ]
+
+    # Step 3: Assert the wildcards of the search are not interpreted
+    assert (await search(client, q="0% A"))[0] == [wildcard]
+    assert (await search(client, q="_cme"))[0] == []
+
+
+async def test_relevance_ranks_capped_candidates(
+    monkeypatch,
+    login_user: tuple[AsyncClient, User],
+) -> None:
+    """
+    Test that a relevance search ranks a bounded number of matches of each name.
+    """
+
+    # Step 1: Create more orders matching by customer name and by product name than the cap
+    client, _ = login_user
+    monkeypatch.setattr(settings, "ORDERS_SEARCH_MAX_CANDIDATES", 2)
+    customers: list[int] = [
+        await post_order(client, f"Globex {i}", "Chair") for i in range(3)
+    ]
+    products: list[int] = [
+        await post_order(client, "Jane Doe", "Globex lamp") for _ in range(3)
+    ]
+
+    # Step 2: Assert at most the cap of each name is ranked
+    ids, next_cursor = await search(client, q="globex")
+    assert len(ids) == 4
+    assert len(set(ids) & set(customers)) == 2
+    assert len(set(ids) & set(products)) == 2
+    assert next_cursor is None
+
+    # Step 3: Assert sorting by creation time still lists every match
+    ids, _ = await search(client, q="globex", order_by="created_at")
+    assert sorted(ids) == sorted(customers + products)
+
+
+async def test_relevance_caps_least_relevant_candidates(
+    monkeypatch,
+    login_user: tuple[AsyncClient, User],
+) -> None:
+    """
+    Test that the capped matches of each name are the most relevant ones, whatever
+    the order the matching rows were created in.
+    """
+
+    # Step 1: Create weak matches of each name before the best ones
+    client, _ = login_user
+    monkeypatch.setattr(settings, "ORDERS_SEARCH_MAX_CANDIDATES", 2)
+    for _ in range(2):
+        await post_order(client, "Big Globex Corp", "Chair")
+        await post_order(client, "Jane Doe", "Lamp by Globex")
+    best_customer: int = await post_order(client, "Globex", "Chair")
+    best_product: int = await post_order(client, "John Doe", "Globex")
+
+    # Step 2: Assert the best match of each name is ranked
+    ids, _ = await search(client, q="globex", order_by="relevance")
+    assert ids[0] == best_customer
+    assert best_product in ids
+
+
+async def test_bad_request_invalid_search(
+    login_user: tuple[AsyncClient, User],
+) -> None:
+    """
+    Test that searches too short to be indexed and relevance sorting without a search are rejected.
+    """
+
+    # Step 1: Search with fewer characters than a trigram
+    client, _ = login_user
+    response: Response = await client.get("/orders", params={"q": " ab "})
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["detail"]["code"] == "invalid_search"
+
+    # Step 2: Sort by relevance without a search
+    response = await client.get("/orders", params={"order_by": "relevance"})
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["detail"]["code"] == "invalid_choice"
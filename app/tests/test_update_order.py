@@ -296,3 +296,51 @@ async def test_not_found_update_order(
 
     # Step 4: Assert the response status is 404 Not Found
     assert response.status_code == HTTP_404_NOT_FOUND, response.json()
+
+
+async def test_not_found_before_invalid_data_update_order(
+    login_user: tuple[AsyncClient, User],
+    get_test_session: AsyncSession,
+) -> None:
+    """
+    Test that invalid updates of a missing order or of another user's order are
+    reported as not found.
+    """
+
+    # Step 1: Login as a user
+    async_client, user = login_user
+
+    # Step 2: Attempt an empty update of a non-existent order
+    response: Response = await async_client.patch(url="/orders/123123123", json={})
+
+    # Step 3: Assert the response status is 404 Not Found
+    assert response.status_code == HTTP_404_NOT_FOUND, response.json()
+
+    # Step 4: Create an order of another user and revoke superuser status
+    async with get_test_session as session:
+        await session.execute(
+            Order.__table__.insert().values(
+                user_id=user.id + 1,
+                customer_name="Other customer",
+                status="PENDING",
+                total_price=10,
+                is_deleted=False,
+            )
+        )
+        result: Result = await session.execute(select(User).filter_by(id=user.id))
+        result.scalars().first().is_superuser = False
+        await session.commit()
+        order_id: int = (
+            await session.execute(select(Order.id).filter_by(user_id=user.id + 1))
+        ).scalar_one()
+
+    # Step 5: Attempt to reassign the other user's order
+    response = await async_client.patch(
+        url=f"/orders/{order_id}",
+        json={
+            "user_id": user.id,
+        },
+    )
+
+    # Step 6: Assert the response status is 404 Not Found
+    assert response.status_code == HTTP_404_NOT_FOUND, response.json()
@@ -0,0 +1,86 @@
+from httpx import AsyncClient, Response
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.status import HTTP_200_OK
+
+from app.domain.models import User, Order, user_order_summary_table
+from app.presentation.cli.rebuild_order_summary import rebuild
+from app.tests.conftest import TestingSessionLocal
+
+
+async def get_summary(client: AsyncClient) -> dict[str, tuple[int, float]]:
+    """Return the current user's summary as (count, total) per status."""
+    response: Response = await client.get("/orders/summary")
+    assert response.status_code == HTTP_200_OK
+    return {
+        item["status"]: (item["count"], item["total"])
+        for item in response.json()["items"]
+    }
+
+
+async def test_summary_follows_order_writes(
+    login_user: tuple[AsyncClient, User],
+    create_order: Order,
+) -> None:
+    """
+    Test that the summary is updated by order creation, status changes and deletion.
+    """
+
+    # Step 1: Create two pending orders
+    client, _ = login_user
+    first: Order = await create_order(client, status="PENDING")
+    second: Order = await create_order(client, status="PENDING")
+    first_total: float = float(first.total_price)
+    second_total: float = float(second.total_price)
+    assert await get_summary(client) == {"PENDING": (2, first_total + second_total)}
+
+    # Step 2: Confirm one of them and assert it moved to the other status
+    response: Response = await client.patch(
+        f"/orders/{first.id}", json={"status": "CONFIRMED"}
+    )
+    assert response.status_code == HTTP_200_OK
+    assert await get_summary(client) == {
+        "CONFIRMED": (1, first_total),
+        "PENDING": (1, second_total),
+    }
+
+    # Step 3: Delete it and assert it is no longer counted
+    response = await client.delete(f"/orders/{first.id}")
+    assert response.status_code == HTTP_200_OK
+    assert await get_summary(client) == {"PENDING": (1, second_total)}
+
+
+async def test_rebuild_repairs_drifted_summary(
+    login_user: tuple[AsyncClient, User],
+    create_order: Order,
+    get_test_session: AsyncSession,
+) -> None:
+    """
+    Test that the rebuild command reports drifted summaries and recomputes them.
+    """
+
+    # Step 1: Create an order and corrupt its summary
+    client, user = login_user
+    order: Order = await create_order(client, status="PENDING")
+    async with get_test_session as session:
+        await session.execute(
+            update(user_order_summary_table)
+            .where(user_order_summary_table.c.user_id == user.id)
+            .values(order_count=5)
+        )
+        await session.commit()
+
+    # Step 2: Assert the check reports the drift without repairing it
+    assert (
+        await rebuild(batch_size=1, write=False, session_maker=TestingSessionLocal) == 1
+    )
+    assert await get_summary(client) == {"PENDING": (5, float(order.total_price))}
+
+    # Step 3: Rebuild and assert the summary is correct again
+    assert (
+        await rebuild(batch_size=1, write=True, session_maker=TestingSessionLocal) == 1
+    )
+    assert await get_summary(client) == {"PENDING": (1, float(order.total_price))}
+    assert (
+        await rebuild(batch_size=1, write=False, session_maker=TestingSessionLocal) == 0
+    )
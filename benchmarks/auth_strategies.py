@@ -0,0 +1,87 @@
+"""
+Compares login and authenticated-read throughput of the database and JWT
+authentication strategies:
+
+    python -m benchmarks.auth_strategies --requests 500
+
+Redis is replaced with an in-process FakeRedis unless --real-redis is given,
+in which case REDIS_HOST / REDIS_PORT are used.
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any, AsyncGenerator, Awaitable, Callable
+
+from fakeredis import FakeServer
+from fakeredis.aioredis import FakeRedis
+
+from app.core.security import get_database_strategy, get_jwt_strategy
+from app.infrastructure.redis import get_redis, init_redis_pool, close_redis_pool
+from benchmarks.common import ORDER_PAYLOAD, app, login_superuser, make_client, reset_db
+
+STRATEGIES: dict[str, Callable[..., Any]] = {
+    "database": get_database_strategy,
+    "jwt": get_jwt_strategy,
+}
+
+
+def use_fake_redis() -> None:
+    server: FakeServer = FakeServer()
+
+    async def get_fake_redis() -> AsyncGenerator[FakeRedis, Any]:
+        yield FakeRedis(server=server)
+
+    app.dependency_overrides[get_redis] = get_fake_redis
+
+
+async def throughput(func: Callable[[], Awaitable[Any]], requests: int) -> float:
+    started: float = time.perf_counter()
+    for _ in range(requests):
+        await func()
+    return requests / (time.perf_counter() - started)
+
+
+async def main(requests: int, real_redis: bool) -> None:
+    if real_redis:
+        await init_redis_pool()
+    else:
+        use_fake_redis()
+
+    for name, strategy in STRATEGIES.items():
+        await reset_db()
+        app.dependency_overrides[get_database_strategy] = strategy
+        async with make_client() as client:
+            await login_superuser(client)
+            order_id: int = (await client.post("/orders", json=ORDER_PAYLOAD)).json()[
+                "id"
+            ]
+
+            async def login() -> None:
+                await client.post(
+                    "/auth/login",
+                    data={
+                        "grant_type": "password",
+                        "username": "bench@gmail.com",
+                        "password": "password",
+                    },
+                )
+
+            async def read() -> None:
+                await client.get(f"/orders/{order_id}")
+
+            login_rps: float = await throughput(login, requests)
+            read_rps: float = await throughput(read, requests)
+        print(f"{name:<10} login={login_rps:8.1f} req/s read={read_rps:8.1f} req/s")
+
+    app.dependency_overrides.pop(get_database_strategy)
+    if real_redis:
+        await close_redis_pool()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--real-redis", action="store_true")
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.real_redis))
@@ -0,0 +1,88 @@
+"""
+Measures the overhead of building the BaseRepository filter queries, and the
+latency of running them:
+
+    python -m benchmarks.base_repository_filters --iterations 2000
+
+"inline" builds a new Select for every call, as filter_by did before. "shaped"
+parses the filters and reuses the statement built for their shape, leaving only
+the parameter values to bind.
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any
+
+from sqlalchemy import Select, select
+
+from app.domain.models import Order
+from app.domain.repositories.abstract import BaseRepository, build_filter_statement
+from benchmarks.common import BenchSessionLocal, measure, report, reset_db
+
+FILTERS: dict[str, Any] = {
+    "status": "PENDING",
+    "total_price__gte": 10,
+    "total_price__lte": 1000,
+    "customer_name__ilike": "%customer%",
+}
+
+
+def inline_statement(filters: dict[str, Any], limit: int, offset: int) -> Select:
+    return (
+        select(Order)
+        .where(
+            Order.is_deleted == False,
+            Order.status == filters["status"],
+            Order.total_price >= filters["total_price__gte"],
+            Order.total_price <= filters["total_price__lte"],
+            Order.customer_name.ilike(filters["customer_name__ilike"]),
+        )
+        .order_by(Order.id)
+        .limit(limit)
+        .offset(offset)
+    )
+
+
+def shaped_statement(
+    repository: BaseRepository, filters: dict[str, Any]
+) -> tuple[Select, dict[str, Any]]:
+    shape, params = repository.parse_filters(filters)
+    return build_filter_statement(Order, shape), params
+
+
+def construction(label: str, build: Any, iterations: int) -> None:
+    started: float = time.perf_counter()
+    for _ in range(iterations):
+        build()
+    elapsed: float = time.perf_counter() - started
+    print(f"{label:<32} {elapsed / iterations * 1_000_000:8.2f}us per statement")
+
+
+async def main(iterations: int) -> None:
+    await reset_db()
+    repository: BaseRepository = BaseRepository(None, Order)
+    construction(
+        "build inline", lambda: inline_statement(FILTERS, 100, 0), iterations * 10
+    )
+    construction(
+        "build shaped", lambda: shaped_statement(repository, FILTERS), iterations * 10
+    )
+
+    async def inline_query() -> None:
+        async with BenchSessionLocal() as session:
+            await session.execute(inline_statement(FILTERS, 100, 0))
+
+    async def shaped_query() -> None:
+        async with BenchSessionLocal() as session:
+            await BaseRepository(session, Order).filter_by(FILTERS)
+
+    report("query inline", await measure(inline_query, iterations))
+    report("query shaped", await measure(shaped_query, iterations))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations))
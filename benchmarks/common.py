@@ -0,0 +1,89 @@
+import statistics
+import time
+from typing import Any, AsyncGenerator, Awaitable, Callable
+
+from httpx import AsyncClient, ASGITransport, Response
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.domain.models import *  # noqa
+from app.infrastructure.db import Base, get_async_session
+from app.main import app
+
+engine = create_async_engine(
+    "sqlite+aiosqlite:///./bench.db",
+    connect_args={"check_same_thread": False},
+)
+
+BenchSessionLocal = async_sessionmaker(engine, expire_on_commit=False)
+
+
+async def override_get_async_session() -> AsyncGenerator[AsyncSession, Any]:
+    """Provide a database session bound to the benchmark database."""
+    async with BenchSessionLocal() as session:
+        yield session
+
+
+app.dependency_overrides[get_async_session] = override_get_async_session
+
+ORDER_PAYLOAD: dict[str, Any] = {
+    "customer_name": "Bench customer",
+    "status": "PENDING",
+    "products": [
+        {"name": "product1", "price": 100, "quantity": 2},
+        {"name": "product2", "price": 50, "quantity": 1},
+    ],
+}
+
+
+async def reset_db() -> None:
+    """Recreate every table of the benchmark database."""
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+
+def make_client() -> AsyncClient:
+    """Build an in-process HTTP client for the application."""
+    return AsyncClient(base_url="http://testserver", transport=ASGITransport(app=app))
+
+
+async def login_superuser(client: AsyncClient, email: str = "bench@gmail.com") -> None:
+    """Register a superuser and attach its bearer token to the client."""
+    await client.post("/auth/register", json={"email": email, "password": "password"})
+    async with BenchSessionLocal() as session:
+        await session.execute(
+            update(User).where(User.email == email).values(is_superuser=True)
+        )
+        await session.commit()
+    response: Response = await client.post(
+        "/auth/login",
+        data={"grant_type": "password", "username": email, "password": "password"},
+    )
+    client.headers["Authorization"] = f"Bearer {response.json()['access_token']}"
+
+
+async def measure(
+    func: Callable[[], Awaitable[Any]],
+    iterations: int,
+    warmup: int = 20,
+) -> list[float]:
+    """Run the coroutine factory and return per-call latencies in milliseconds."""
+    for _ in range(warmup):
+        await func()
+    samples: list[float] = []
+    for _ in range(iterations):
+        started: float = time.perf_counter()
+        await func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def report(label: str, samples: list[float]) -> None:
+    """Print p50/p99 latency of the collected samples."""
+    ordered: list[float] = sorted(samples)
+    p99: float = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    print(
+        f"{label:<32} n={len(ordered):<6} "
+        f"p50={statistics.median(ordered):8.3f}ms p99={p99:8.3f}ms"
+    )
@@ -0,0 +1,74 @@
+"""
+Measures the CPU time spent per GET /orders/{id} cache hit when the cached
+JSON is parsed, validated and rendered again (the previous behaviour) against
+returning the pre-rendered body as is:
+
+    python -m benchmarks.order_cache_hit_cpu --iterations 20000 --products 10
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Callable
+
+from starlette.responses import JSONResponse, Response
+
+from app.application.managers.order import OrderManager
+from app.domain.schemas.order import OrderRead
+
+
+def build_order(products: int) -> dict[str, Any]:
+    return OrderRead.model_validate(
+        {
+            "id": 1,
+            "user_id": 1,
+            "customer_name": "Bench customer",
+            "status": "PENDING",
+            "total_price": 100.0 * products,
+            "is_deleted": False,
+            "products": [
+                {
+                    "id": i,
+                    "name": f"product{i}",
+                    "price": 100.0,
+                    "quantity": 1,
+                    "is_deleted": False,
+                }
+                for i in range(products)
+            ],
+        }
+    ).dict()
+
+
+def revalidate_hit(value: str) -> Response:
+    order_read: OrderRead = OrderRead.model_validate(json.loads(value))
+    return JSONResponse(content=order_read.dict())
+
+
+def raw_hit(value: bytes) -> Response:
+    user_id, body = OrderManager.unpack_order(value)
+    return Response(content=body, media_type="application/json")
+
+
+def cpu_per_call(func: Callable[[Any], Response], value: Any, iterations: int) -> float:
+    started: float = time.process_time()
+    for _ in range(iterations):
+        func(value)
+    return (time.process_time() - started) / iterations * 1_000_000
+
+
+def main(iterations: int, products: int) -> None:
+    data: dict[str, Any] = build_order(products)
+    before: float = cpu_per_call(revalidate_hit, json.dumps(data), iterations)
+    after: float = cpu_per_call(raw_hit, OrderManager.pack_order(data), iterations)
+    print(f"products={products} iterations={iterations}")
+    print(f"{'parse + validate + render':<28} {before:8.2f}us CPU per hit")
+    print(f"{'pre-rendered body':<28} {after:8.2f}us CPU per hit")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--products", type=int, default=10)
+    args = parser.parse_args()
+    main(args.iterations, args.products)
@@ -0,0 +1,73 @@
+"""
+Measures the statements sent and the latency of creating one order with the
+batched INSERT ... RETURNING path:
+
+    python -m benchmarks.order_create --iterations 200
+
+The products are looked up in the catalog, so after the first order they are
+not inserted again and the query count stays constant whatever the number of
+products. The previous ORM path, which inserted one product row per order line,
+no longer applies since products became a catalog.
+"""
+
+import argparse
+import asyncio
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.models import Order
+from app.domain.schemas.order import OrderRead
+from benchmarks.common import BenchSessionLocal, engine, measure, report, reset_db
+
+
+def build_order(products: int) -> dict[str, Any]:
+    return {
+        "user_id": 1,
+        "customer_name": "Bench customer",
+        "status": "PENDING",
+        "products": [
+            {"name": f"product{i}", "price": 10, "quantity": 1} for i in range(products)
+        ],
+    }
+
+
+async def batched_create(session: AsyncSession, data: dict[str, Any]) -> OrderRead:
+    return OrderRead.model_validate(await Order.get_db(session).create(data))
+
+
+async def run(
+    label: str,
+    create: Callable[[AsyncSession, dict[str, Any]], Awaitable[OrderRead]],
+    products: int,
+    iterations: int,
+) -> None:
+    async def create_once() -> None:
+        async with BenchSessionLocal() as session:
+            await create(session, build_order(products))
+
+    statements: list[str] = []
+
+    def count(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", count)
+    await create_once()
+    event.remove(engine.sync_engine, "before_cursor_execute", count)
+
+    samples: list[float] = await measure(create_once, iterations, warmup=5)
+    report(f"{label} products={products} queries={len(statements)}", samples)
+
+
+async def main(iterations: int) -> None:
+    await reset_db()
+    for products in (1, 10, 100):
+        await run("batched returning", batched_create, products, iterations)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations))
@@ -0,0 +1,60 @@
+"""
+Compares p50/p99 latency of GET /orders/{id} with a Redis client created per
+request (the previous behaviour) against clients bound to the shared pool.
+
+Requires a running Redis reachable through REDIS_HOST / REDIS_PORT:
+
+    python -m benchmarks.order_detail_latency --iterations 2000
+"""
+
+import argparse
+import asyncio
+
+import redis
+
+from app.core.config import settings
+from app.infrastructure.redis import get_redis, init_redis_pool, close_redis_pool
+from benchmarks.common import (
+    ORDER_PAYLOAD,
+    app,
+    login_superuser,
+    make_client,
+    measure,
+    report,
+    reset_db,
+)
+
+
+async def get_redis_per_request():
+    """The previous dependency: a new, never closed client on every request."""
+    redis_client = await redis.asyncio.Redis(
+        host=settings.REDIS_HOST,
+        port=settings.REDIS_PORT,
+        encoding="utf-8",
+        decode_responses=True,
+    ).initialize()
+    yield redis_client
+
+
+async def main(iterations: int) -> None:
+    await reset_db()
+    await init_redis_pool()
+    async with make_client() as client:
+        await login_superuser(client)
+        order_id: int = (await client.post("/orders", json=ORDER_PAYLOAD)).json()["id"]
+
+        async def call() -> None:
+            await client.get(f"/orders/{order_id}")
+
+        app.dependency_overrides[get_redis] = get_redis_per_request
+        report("client per request", await measure(call, iterations))
+
+        app.dependency_overrides.pop(get_redis)
+        report("shared connection pool", await measure(call, iterations))
+    await close_redis_pool()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=1000)
+    asyncio.run(main(parser.parse_args().iterations))
@@ -0,0 +1,111 @@
+"""
+Compares listing orders from plain rows, with products aggregated by the
+database, validated with OrderRead against serialized directly:
+
+    python -m benchmarks.order_list_rows --orders 10000 100000
+
+For each size the whole table is read once per path, reporting the wall time,
+the throughput and the peak memory allocated while building the response body.
+Loading ORM objects, before products became a catalog, was about five times
+slower than serializing directly and used five times the memory.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import tracemalloc
+from decimal import Decimal
+from typing import Awaitable, Callable
+
+from app.domain.models import Order, Product
+from app.domain.models.order_product import order_product_association_table
+from app.domain.schemas.order import OrderRead, OrderRow
+from benchmarks.common import BenchSessionLocal, engine, reset_db
+
+PRODUCTS_PER_ORDER: int = 2
+CATALOG_SIZE: int = 1000
+
+
+async def seed(orders: int) -> None:
+    """Insert the given number of orders with their products in a few statements."""
+    await reset_db()
+    async with engine.begin() as conn:
+        await conn.execute(
+            Order.__table__.insert(),
+            [
+                {
+                    "user_id": 1,
+                    "customer_name": f"Customer {i}",
+                    "status": "PENDING",
+                    "total_price": Decimal("150.00"),
+                    "is_deleted": False,
+                }
+                for i in range(orders)
+            ],
+        )
+        await conn.execute(
+            Product.__table__.insert(),
+            [
+                {"name": f"product{i}", "price": Decimal("50.00"), "is_deleted": False}
+                for i in range(CATALOG_SIZE)
+            ],
+        )
+        await conn.execute(
+            order_product_association_table.insert(),
+            [
+                {
+                    "order_id": 1 + i // PRODUCTS_PER_ORDER,
+                    "product_id": 1 + i % CATALOG_SIZE,
+                    "quantity": 1 + i % PRODUCTS_PER_ORDER,
+                    "price": Decimal("50.00"),
+                }
+                for i in range(orders * PRODUCTS_PER_ORDER)
+            ],
+        )
+
+
+async def validated_body() -> str:
+    async with BenchSessionLocal() as session:
+        rows: list[OrderRow] = await Order.get_db(session).get_rows_by_filter({})
+        return json.dumps(
+            [
+                OrderRead.model_validate(
+                    {**row._asdict(), "products": json.loads(row.products)}
+                ).model_dump(mode="json")
+                for row in rows
+            ]
+        )
+
+
+async def rows_body() -> str:
+    async with BenchSessionLocal() as session:
+        rows: list[OrderRow] = await Order.get_db(session).get_rows_by_filter({})
+        return "[" + ",".join(row.to_json() for row in rows) + "]"
+
+
+async def run(label: str, body: Callable[[], Awaitable[str]], orders: int) -> None:
+    tracemalloc.start()
+    started: float = time.perf_counter()
+    await body()
+    elapsed: float = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{label:<24} orders={orders:<7} time={elapsed:8.3f}s "
+        f"rate={orders / elapsed:10.0f}/s peak={peak / 2**20:8.1f}MiB"
+    )
+
+
+async def main(sizes: list[int]) -> None:
+    for orders in sizes:
+        await seed(orders)
+        await run("rows + model_validate", validated_body, orders)
+        await run("rows + to_json", rows_body, orders)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orders", type=int, nargs="+", default=[10_000, 100_000])
+    args = parser.parse_args()
+    asyncio.run(main(args.orders))